@@ -0,0 +1,37 @@
+import threading
+
+from langchain_anthropic import ChatAnthropic
+
+# Models used by the agent, by role. Each is created once per process on first use, so its
+# HTTP client and keep-alive connections are shared by all calls
+MODEL_CONFIGS = {
+    "keywords": {"model": "claude-3-5-sonnet-20240620", "temperature": 0.1},
+    "agent": {"model": "claude-3-haiku-20240307", "temperature": 0},
+    "parser": {"model": "claude-3-haiku-20240307", "temperature": 0},
+}
+
+_models = {}
+_models_lock = threading.Lock()
+
+
+def get_model(role: str):
+    """The shared model for a role of MODEL_CONFIGS, or the one registered for it."""
+    with _models_lock:
+        model = _models.get(role)
+        if model is None:
+            if role not in MODEL_CONFIGS:
+                raise ValueError(f"Unknown model role: {role}. Expected one of {tuple(MODEL_CONFIGS)}")
+            model = _models[role] = ChatAnthropic(**MODEL_CONFIGS[role])
+        return model
+
+
+def register_model(role: str, model):
+    """Use the given model for a role, e.g. a local stand-in model in tests."""
+    with _models_lock:
+        _models[role] = model
+
+
+def reset_models():
+    """Forget all created and registered models."""
+    with _models_lock:
+        _models.clear()
@@ -0,0 +1,57 @@
+import random
+import time
+from copy import deepcopy
+
+from retriever_pipeline.chunking import load_documents, split_into_chunks, clean_chunks
+from retriever_pipeline.processing_chunks import add_chunk_tokens, build_inverted_index, search_by_ngrams, \
+    search_index, generate_ngrams, RANKERS
+
+
+def replicate_chunks(chunks, times):
+    """Grow a corpus by repeating its chunks, keeping their stored tokens."""
+    return [deepcopy(chunk) for _ in range(times) for chunk in chunks]
+
+
+def sample_queries(index, num_queries=50, num_terms=3, seed=42):
+    """Sample queries from the most frequent terms so that every query has many matches."""
+    vocabulary = sorted(index["postings"], key=lambda ng: -len(index["postings"][ng]))[:300]
+    rng = random.Random(seed)
+    return [" ".join(ng[0] for ng in rng.sample(vocabulary, num_terms)) for _ in range(num_queries)]
+
+
+def time_per_query(search, queries):
+    start = time.perf_counter()
+    for query in queries:
+        search(query)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def benchmark(documents_path, scales=(1, 2, 4, 8, 16), top_k=1, num_queries=50):
+    """
+    Print per-query latency (ms) of the full scan, the exhaustive index search and
+    the MaxScore index search for growing corpus sizes.
+    """
+    base_chunks = add_chunk_tokens(clean_chunks(split_into_chunks(load_documents(documents_path))))
+    queries = sample_queries(build_inverted_index(base_chunks), num_queries=num_queries)
+
+    print(f"{'chunks':>8} {'ranker':>9} {'matches':>8} {'scan':>9} {'exhaustive':>11} {'maxscore':>9}")
+    for scale in scales:
+        chunks = replicate_chunks(base_chunks, scale)
+        index = build_inverted_index(chunks)
+        matches = sum(
+            len(set().union(*(index["postings"].get(ng, {}) for ng in generate_ngrams(query, 1))))
+            for query in queries
+        ) / len(queries)
+        scan = time_per_query(lambda q: search_by_ngrams(chunks, q, top_k=top_k), queries)
+        for ranker in RANKERS:
+            exhaustive = time_per_query(
+                lambda q: search_index(chunks, index, q, top_k=top_k, ranker=ranker, early_termination=False),
+                queries
+            )
+            maxscore = time_per_query(lambda q: search_index(chunks, index, q, top_k=top_k, ranker=ranker), queries)
+            scan_ms = f"{scan:9.2f}" if ranker == "presence" else f"{'-':>9}"
+            print(f"{len(chunks):>8} {ranker:>9} {matches:>8.0f} {scan_ms} {exhaustive:>11.2f} {maxscore:>9.2f}")
+
+
+if __name__ == '__main__':
+    benchmark('./retriever_pipeline/documents_txt/literature/*.txt')
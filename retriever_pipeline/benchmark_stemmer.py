@@ -0,0 +1,202 @@
+import contextlib
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from retriever_pipeline import tree_stem, tree_stem_reference
+from retriever_pipeline.processing_chunks import clean_words, contains_only_alph, stemmer, tokenize, tokenize_many, \
+    word_tokenize
+
+DOCUMENTS_PATTERN = './retriever_pipeline/documents_txt/*/*.txt'
+QUESTIONS_PATH = './unlp-2024-shared-task/data/zno.test.jsonl'
+MAX_MISMATCHES_SHOWN = 10
+
+
+@contextlib.contextmanager
+def silenced_warnings():
+    """Drop the out-of-alphabet warnings stem_word prints to stderr."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stderr(devnull):
+        yield
+
+
+def compiled_stem_word(word):
+    """stem_word over the compiled node arrays, bypassing the suffix memo."""
+    cut = tree_stem.evaluate_tree(tree_stem.word_to_vec(word))
+    if not cut or not word:
+        return word
+    if cut >= len(word):
+        return ''
+    return word[:-cut]
+
+
+def memoized_stem_word(word):
+    return tree_stem.stem_word(word)
+
+
+# Every implementation is compared to tree_stem_reference.stem_word, the original decision tree
+IMPLEMENTATIONS = {
+    "reference": tree_stem_reference.stem_word,
+    "compiled": compiled_stem_word,
+    "memoized": memoized_stem_word,
+}
+BATCH_IMPLEMENTATIONS = {
+    "vectorized": tree_stem.stem_words,
+}
+# Import time budgets in ms; importing these must not load any of LAZY_MODULES either
+IMPORT_BUDGETS_MS = {
+    "retriever_pipeline.tree_stem_reference": None,
+    "retriever_pipeline.tree_stem": 100,
+    "retriever_pipeline.processing_chunks": 150,
+}
+LAZY_MODULES = ("nltk", "spacy", "numpy")
+
+
+def load_texts(documents_pattern=DOCUMENTS_PATTERN, questions_path=QUESTIONS_PATH):
+    """Texts of the documents and of the test questions with their answer options."""
+    texts = []
+    for path in sorted(glob.glob(documents_pattern)):
+        with open(path, encoding='utf-8') as file:
+            texts.append(file.read())
+    with open(questions_path, encoding='utf-8') as file:
+        for line in file:
+            question = json.loads(line)
+            texts.append(question["question"])
+            texts.extend(answer["text"] for answer in question["answers"])
+    return texts
+
+
+def stemmer_tokens(texts):
+    """Every word of the texts the way stemmer() passes it to stem_word, repetitions included."""
+    return [
+        cleaned
+        for text in texts
+        for cleaned in map(clean_words, text.lower().split())
+        if contains_only_alph(cleaned)
+    ]
+
+
+def vocabulary(texts, tokens):
+    """Distinct stemmer inputs plus the raw whitespace tokens, which exercise the out-of-alphabet path."""
+    return sorted(set(tokens).union(*(text.split() for text in texts)))
+
+
+def find_mismatches(words, stems):
+    with silenced_warnings():
+        expected = [tree_stem_reference.stem_word(word) for word in words]
+    return [(word, want, got) for word, want, got in zip(words, expected, stems) if want != got]
+
+
+def time_calls(stem, tokens):
+    """Words per second and p50/p99 per-call latency in microseconds."""
+    latencies = []
+    clock = time.perf_counter_ns
+    with silenced_warnings():
+        start = clock()
+        for token in tokens:
+            call_start = clock()
+            stem(token)
+            latencies.append(clock() - call_start)
+        total = clock() - start
+    quantiles = statistics.quantiles(latencies, n=100)
+    return len(tokens) / total * 1e9, quantiles[49] / 1000, quantiles[98] / 1000
+
+
+def time_batch(stem_many, tokens):
+    with silenced_warnings():
+        start = time.perf_counter()
+        stem_many(tokens)
+        total = time.perf_counter() - start
+    return len(tokens) / total
+
+
+def import_time(module, repeat=5):
+    """Best wall time in ms of importing a module in a fresh interpreter and the LAZY_MODULES it loaded."""
+    code = (
+        f"import sys, time; start = time.perf_counter(); import {module}; "
+        f"print(time.perf_counter() - start, *(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        timing, *loaded = output.split()
+        timings.append(float(timing))
+    return min(timings) * 1000, loaded
+
+
+def check_imports():
+    """Print import times and return how many modules exceed their budget or load lazy dependencies."""
+    failed = 0
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        milliseconds, loaded = import_time(module)
+        problems = []
+        if budget is not None and milliseconds > budget:
+            problems.append(f"over the {budget} ms budget")
+        if budget is not None and loaded:
+            problems.append(f"loads {', '.join(loaded)}")
+        print(f"import {module}: {milliseconds:.1f} ms" + (f" ({'; '.join(problems)})" if problems else ""))
+        failed += bool(problems)
+    return failed
+
+
+def check_equivalence(words):
+    """Compare every implementation to the reference on words; return how many of them differ."""
+    failed = 0
+    candidates = {name: stem for name, stem in IMPLEMENTATIONS.items() if name != "reference"}
+    for name, stem in candidates.items():
+        with silenced_warnings():
+            stems = [stem(word) for word in words]
+        failed += report_mismatches(name, find_mismatches(words, stems))
+    for name, stem_many in BATCH_IMPLEMENTATIONS.items():
+        with silenced_warnings():
+            stems = stem_many(words)
+        failed += report_mismatches(name, find_mismatches(words, stems))
+    return failed
+
+
+def check_tokenizer(texts):
+    """Compare tokenize and tokenize_many to word_tokenize(stemmer(text)); return how many of them differ."""
+    with silenced_warnings():
+        expected = [word_tokenize(stemmer(text.lower())) for text in texts]
+        results = {"tokenize": [tokenize(text) for text in texts], "tokenize_many": tokenize_many(texts)}
+    failed = 0
+    for name, tokens in results.items():
+        mismatches = [(text[:80], want, got) for text, want, got in zip(texts, expected, tokens) if want != got]
+        failed += report_mismatches(name, mismatches)
+    return failed
+
+
+def report_mismatches(name, mismatches):
+    if not mismatches:
+        print(f"{name}: identical to the reference")
+        return 0
+    print(f"{name}: {len(mismatches)} inputs differ from the reference")
+    for word, want, got in mismatches[:MAX_MISMATCHES_SHOWN]:
+        print(f"  {word!r}: expected {want!r}, got {got!r}")
+    return 1
+
+
+def benchmark(texts):
+    tokens = stemmer_tokens(texts)
+    words = vocabulary(texts, tokens)
+    print(f"{len(tokens)} tokens, {len(words)} distinct words")
+
+    failed = check_equivalence(words) + check_tokenizer(texts)
+
+    print(f"{'implementation':>15} {'words/s':>10} {'p50 us':>8} {'p99 us':>8}")
+    for name, stem in IMPLEMENTATIONS.items():
+        tree_stem.clear_stem_cache()
+        words_per_second, p50, p99 = time_calls(stem, tokens)
+        print(f"{name:>15} {words_per_second:>10.0f} {p50:>8.2f} {p99:>8.2f}")
+    for name, stem_many in BATCH_IMPLEMENTATIONS.items():
+        print(f"{name:>15} {time_batch(stem_many, tokens):>10.0f} {'-':>8} {'-':>8}")
+    print(f"memo after one pass: {tree_stem.stem_cache_info()}")
+
+    return failed + check_imports()
+
+
+if __name__ == '__main__':
+    sys.exit(1 if benchmark(load_texts()) else 0)
@@ -0,0 +1,22 @@
+import glob
+
+from retriever_pipeline.processing_chunks import clean_words, contains_only_alph
+from retriever_pipeline.tree_stem import build_stem_dictionary, save_stem_dictionary, STEM_DICTIONARY_PATH
+
+DOCUMENTS_PATTERN = './retriever_pipeline/documents_txt/*/*.txt'
+
+
+def corpus_words(pattern=DOCUMENTS_PATTERN):
+    """Yield every word of the documents the way stemmer() passes it to stem_word."""
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding='utf-8') as file:
+            for word in file.read().lower().split():
+                cleaned = clean_words(word)
+                if contains_only_alph(cleaned):
+                    yield cleaned
+
+
+if __name__ == '__main__':
+    dictionary = build_stem_dictionary(corpus_words())
+    save_stem_dictionary(dictionary)
+    print(f'Saved {len(dictionary)} suffixes into {STEM_DICTIONARY_PATH}')
@@ -1,7 +1,19 @@
+import mmap
+import os
 import pickle
+import struct
+from array import array
 from glob import glob
 from langchain_community.document_loaders import TextLoader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
+
+# Bump whenever the saved chunk artifact changes shape, its stored tokens would differ
+# or the index saved next to it gains new fields: stale artifacts are rebuilt on load.
+CHUNKS_FORMAT_VERSION = 6
+CHUNKS_MAGIC = b"ZNOCHUNK"
+# magic, format version, number of chunks, metadata table size, token table size
+CHUNKS_HEADER = struct.Struct("=8sIIQQ")
 
 
 def load_documents(file_pattern: str):
@@ -9,6 +21,13 @@ def load_documents(file_pattern: str):
     Load documents from text files matching the specified file pattern.
     """
     files_path = glob(file_pattern)
+    return load_document_files(files_path)
+
+
+def load_document_files(files_path: list):
+    """
+    Load documents from the given text files.
+    """
     docs = []
     for path in files_path:
         loader = TextLoader(path)
@@ -41,27 +60,182 @@ def clean_chunks(naive_chunks):
     return cleaned_chunks
 
 
+class Chunk:
+    """
+    A chunk of a ChunkStore. Text and metadata are read from the store on access.
+    """
+    __slots__ = ("_store", "_chunk_id")
+
+    def __init__(self, store, chunk_id: int):
+        self._store = store
+        self._chunk_id = chunk_id
+
+    @property
+    def page_content(self) -> str:
+        return self._store.text(self._chunk_id)
+
+    @property
+    def metadata(self) -> dict:
+        return self._store.metadata(self._chunk_id)
+
+
+class ChunkStore:
+    """
+    Read-only sequence of chunks backed by a memory-mapped file written by save_chunks_to_file.
+
+    File layout: header, (num_chunks + 1) uint64 text offsets, pickled metadata table,
+    pickled token lists, then all chunk texts as one UTF-8 blob. Opening reads only the
+    header, offsets and metadata table; token lists are unpickled on first use and chunk
+    text is sliced from the mapping, so pages are shared between processes.
+    """
+
+    def __init__(self, filename: str):
+        with open(filename, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.version, num_chunks, metadata_size, tokens_size = CHUNKS_HEADER.unpack_from(self._mmap)
+        if magic != CHUNKS_MAGIC:
+            raise ValueError(f"{filename} is not a chunk store")
+
+        offsets_start = CHUNKS_HEADER.size
+        metadata_start = offsets_start + 8 * (num_chunks + 1)
+        self._tokens_start = metadata_start + metadata_size
+        self._blob_start = self._tokens_start + tokens_size
+
+        self._buffer = memoryview(self._mmap)
+        self._offsets = self._buffer[offsets_start:metadata_start].cast('Q')
+        self._metadata = pickle.loads(self._buffer[metadata_start:self._tokens_start])
+        self._tokens = None
+
+    def __len__(self):
+        return len(self._metadata)
+
+    def __getitem__(self, chunk_id):
+        if isinstance(chunk_id, slice):
+            return [Chunk(self, i) for i in range(*chunk_id.indices(len(self)))]
+        if chunk_id < 0:
+            chunk_id += len(self)
+        if not 0 <= chunk_id < len(self):
+            raise IndexError("chunk index out of range")
+        return Chunk(self, chunk_id)
+
+    def __iter__(self):
+        return (Chunk(self, i) for i in range(len(self)))
+
+    def raw(self, chunk_id: int) -> memoryview:
+        """Zero-copy view of the UTF-8 encoded text of a chunk."""
+        start = self._blob_start + self._offsets[chunk_id]
+        end = self._blob_start + self._offsets[chunk_id + 1]
+        return self._buffer[start:end]
+
+    def text(self, chunk_id: int) -> str:
+        return str(self.raw(chunk_id), 'utf-8')
+
+    def metadata(self, chunk_id: int) -> dict:
+        if self._tokens is None:
+            self._tokens = pickle.loads(self._buffer[self._tokens_start:self._blob_start])
+        metadata = dict(self._metadata[chunk_id])
+        if self._tokens[chunk_id] is not None:
+            metadata["tokens"] = self._tokens[chunk_id]
+        return metadata
+
+
+def to_documents(chunks):
+    """
+    Materialize chunks, e.g. those of a ChunkStore, as mutable langchain Documents.
+    """
+    return [Document(page_content=chunk.page_content, metadata=dict(chunk.metadata)) for chunk in chunks]
+
+
 def save_chunks_to_file(chunks, filename: str):
     """
-    Save chunks to a file using pickle.
+    Save chunks in the compact chunk store format, tagged with CHUNKS_FORMAT_VERSION.
+
+    The file is written next to the target and moved into place, so processes that
+    have the previous version memory-mapped keep reading a consistent file.
+    """
+    texts = [chunk.page_content.encode('utf-8') for chunk in chunks]
+    offsets = array('Q', [0])
+    for text in texts:
+        offsets.append(offsets[-1] + len(text))
+    metadata = pickle.dumps([{k: v for k, v in chunk.metadata.items() if k != "tokens"} for chunk in chunks])
+    tokens = pickle.dumps([chunk.metadata.get("tokens") for chunk in chunks])
+
+    tmp_filename = f'{filename}.tmp'
+    with open(tmp_filename, 'wb') as file:
+        file.write(CHUNKS_HEADER.pack(CHUNKS_MAGIC, CHUNKS_FORMAT_VERSION, len(chunks), len(metadata), len(tokens)))
+        file.write(offsets.tobytes())
+        file.write(metadata)
+        file.write(tokens)
+        for text in texts:
+            file.write(text)
+    os.replace(tmp_filename, filename)
+
+
+def load_versioned_chunks(filename: str):
     """
-    with open(filename, 'wb') as file:
-        pickle.dump(chunks, file)
+    Load chunks together with the format version they were saved with.
+
+    Parameters:
+        filename (str): The path to the file containing the saved chunks.
+
+    Returns:
+        tuple: The format version (1 for untagged legacy pickles) and the loaded chunks,
+        a ChunkStore for files in the compact format.
+    """
+    with open(filename, 'rb') as file:
+        is_chunk_store = file.read(len(CHUNKS_MAGIC)) == CHUNKS_MAGIC
+    if is_chunk_store:
+        store = ChunkStore(filename)
+        return store.version, store
+
+    # Pickled langchain Documents written by older versions
+    with open(filename, 'rb') as file:
+        data = pickle.load(file)
+    if isinstance(data, dict):
+        return data["version"], data["chunks"]
+    return 1, data
 
 
 def load_chunks_from_file(filename: str):
     """
-    Load chunks from a file saved using pickle.
+    Load chunks from a file saved with save_chunks_to_file.
 
     Parameters:
         filename (str): The path to the file containing the saved chunks.
 
     Returns:
-        list: The loaded chunks.
+        ChunkStore: The loaded chunks.
+    """
+    _, chunks = load_versioned_chunks(filename)
+    return chunks
+
+
+def save_index_to_file(index: dict, filename: str):
+    """
+    Save an inverted index to a file using pickle.
+
+    Like save_chunks_to_file, the file is written next to the target and moved into
+    place, so a concurrent reader never sees a partially written index.
+    """
+    tmp_filename = f'{filename}.tmp'
+    with open(tmp_filename, 'wb') as file:
+        pickle.dump(index, file)
+    os.replace(tmp_filename, filename)
+
+
+def load_index_from_file(filename: str):
+    """
+    Load an inverted index from a file saved using pickle.
+
+    Parameters:
+        filename (str): The path to the file containing the saved index.
+
+    Returns:
+        dict: The loaded index.
     """
     with open(filename, 'rb') as file:
-        chunks = pickle.load(file)
-        return chunks
+        index = pickle.load(file)
+        return index
 
 
 if __name__ == "__main__":
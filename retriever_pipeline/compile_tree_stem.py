@@ -0,0 +1,98 @@
+import ast
+import os
+
+REFERENCE_PATH = os.path.join(os.path.dirname(__file__), 'tree_stem_reference.py')
+TABLE_PATH = os.path.join(os.path.dirname(__file__), 'tree_stem_table.py')
+LEAF = -1
+
+
+def _split(statements):
+    """
+    Return (feature, threshold, left, right) of a split or None for a leaf.
+
+    The generated tree uses both `if f <= t: ... else: ...` and the form
+    `if f <= t: ...` followed by `if f > t: ...`.
+    """
+    statement = statements[0]
+    if isinstance(statement, ast.Return):
+        return None
+    test = statement.test
+    feature = int(test.left.id[1:]) - 1
+    threshold = test.comparators[0].value
+    if not isinstance(test.ops[0], ast.LtE):
+        raise ValueError(f"Unexpected comparison at line {statement.lineno}")
+    if statement.orelse:
+        return feature, threshold, statement.body, statement.orelse
+    negated = statements[1]
+    if not (isinstance(negated.test.ops[0], ast.Gt) and negated.test.left.id == test.left.id
+            and negated.test.comparators[0].value == threshold):
+        raise ValueError(f"Unexpected split at line {negated.lineno}")
+    return feature, threshold, statement.body, negated.body
+
+
+def compile_decision_tree(source: str) -> dict:
+    """
+    Compile the nested if/else `decision_tree` function into flat node arrays.
+
+    Nodes are numbered in pre-order. For a split node, FEATURE is the 0-based feature
+    index and a sample goes to LEFT if its feature is <= THRESHOLD, else to RIGHT.
+    Leaves have FEATURE == -1 and hold the returned cut length in VALUE.
+    """
+    module = ast.parse(source)
+    function = next(node for node in module.body
+                    if isinstance(node, ast.FunctionDef) and node.name == 'decision_tree')
+    table = {'FEATURE': [], 'THRESHOLD': [], 'LEFT': [], 'RIGHT': [], 'VALUE': []}
+
+    def add_node(statements):
+        node = len(table['FEATURE'])
+        for column in table.values():
+            column.append(0)
+        split = _split(statements)
+        if split is None:
+            table['FEATURE'][node] = LEAF
+            table['VALUE'][node] = statements[0].value.value
+            return node
+        feature, threshold, left, right = split
+        table['FEATURE'][node] = feature
+        table['THRESHOLD'][node] = threshold
+        table['LEFT'][node] = add_node(left)
+        table['RIGHT'][node] = add_node(right)
+        return node
+
+    add_node(function.body)
+    return table
+
+
+def render_table(table: dict) -> str:
+    """
+    Render the node arrays as a Python module.
+
+    Columns are stored as whitespace-separated strings and parsed on import, which is
+    much cheaper to compile than tuple literals with thousands of elements.
+    """
+    lines = [
+        '# Generated by python -m retriever_pipeline.compile_tree_stem from tree_stem_reference.decision_tree.',
+        '# Do not edit by hand.',
+        '',
+        '',
+        'def _column(values):',
+        '    return tuple(int(value) for value in values.split())',
+        '',
+        '',
+        f'NUM_NODES = {len(table["FEATURE"])}',
+    ]
+    for name, column in table.items():
+        lines.append('')
+        lines.append(f'{name} = _column("""')
+        for start in range(0, len(column), 25):
+            lines.append(' '.join(str(value) for value in column[start:start + 25]))
+        lines.append('""")')
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    with open(REFERENCE_PATH, encoding='utf-8') as file:
+        compiled = compile_decision_tree(file.read())
+    with open(TABLE_PATH, 'w', encoding='utf-8') as file:
+        file.write(render_table(compiled))
+    print(f'Compiled {len(compiled["FEATURE"])} nodes into {TABLE_PATH}')
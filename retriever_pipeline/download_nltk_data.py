@@ -0,0 +1,13 @@
+import sys
+
+import nltk
+
+from retriever_pipeline.processing_chunks import NLTK_DATA_PATH, NLTK_PACKAGES
+
+
+if __name__ == '__main__':
+    # One-time setup step: word_tokenize only looks for its data and never downloads it
+    for package in NLTK_PACKAGES:
+        if not nltk.download(package, download_dir=NLTK_DATA_PATH, quiet=True):
+            sys.exit(f'Could not download NLTK package {package} into {NLTK_DATA_PATH}')
+    print(f'Downloaded {", ".join(NLTK_PACKAGES)} into {NLTK_DATA_PATH}')
@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+KEYWORD_CACHE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'keyword_cache.sqlite')
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase the query and collapse whitespace, so trivially different spellings share an entry."""
+    return " ".join(query.lower().split())
+
+
+def template_hash(template: str) -> str:
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()
+
+
+def model_name(model) -> str:
+    """Name identifying the model that generated the keywords, e.g. claude-3-5-sonnet-20240620."""
+    return getattr(model, "model", None) or getattr(model, "model_name", None) or type(model).__name__
+
+
+class KeywordCache:
+    """
+    Persistent SQLite cache of keywords generated by a language model for a query.
+
+    Entries are keyed on the model name, the hash of the prompt template and the
+    normalized query, so changing either the model or the prompt never returns stale
+    keywords. Hits and misses are counted per instance.
+    """
+
+    def __init__(self, path: str = KEYWORD_CACHE_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS keywords ("
+                "model TEXT NOT NULL, template TEXT NOT NULL, query TEXT NOT NULL, keywords TEXT NOT NULL, "
+                "PRIMARY KEY (model, template, query))"
+            )
+
+    def get(self, model: str, template: str, query: str):
+        """Cached keywords for the query, or None. An empty keyword list counts as a miss."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT keywords FROM keywords WHERE model = ? AND template = ? AND query = ?",
+                (model, template_hash(template), normalize_query(query))
+            ).fetchone()
+            keywords = json.loads(row[0]) if row is not None else None
+            if not keywords:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return keywords
+
+    def put(self, model: str, template: str, query: str, keywords: list[str]):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO keywords (model, template, query, keywords) VALUES (?, ?, ?, ?)",
+                (model, template_hash(template), normalize_query(query), json.dumps(keywords, ensure_ascii=False))
+            )
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = self._connection.execute("SELECT COUNT(*) FROM keywords").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": size,
+        }
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM keywords")
+        self.hits = self.misses = 0
+
+    def close(self):
+        self._connection.close()
@@ -0,0 +1,51 @@
+MAX_VARIANTS = 3
+MAX_VARIANT_WORDS = 3
+KEY_POS = ("PROPN", "NOUN")
+
+# tool_wikipedia.text_preprocessing loads spaCy and noun_phrase_ua models on import, so it is imported on first use
+_text_preprocessing = None
+
+
+def load_text_preprocessing():
+    """Import tool_wikipedia.text_preprocessing, which loads its spaCy and noun phrase models."""
+    global _text_preprocessing
+    if _text_preprocessing is None:
+        from tool_wikipedia import text_preprocessing
+        _text_preprocessing = text_preprocessing
+    return _text_preprocessing
+
+
+def key_terms(query: str) -> list[str]:
+    """
+    Key terms of the query, most specific first: named entities, then noun phrases,
+    then lemmas of the remaining nouns and proper nouns.
+    """
+    text_preprocessing = load_text_preprocessing()
+    doc = text_preprocessing.uk_nlp(query)
+    terms = [ent.lemma_ for ent in doc.ents]
+    terms.extend(text_preprocessing.noun_chunks_extraction(query))
+    terms.extend(token.lemma_ for token in doc if token.pos_ in KEY_POS)
+
+    distinct = {}
+    for term in terms:
+        term = " ".join(term.split())
+        if term:
+            distinct.setdefault(term.lower(), term)
+    return list(distinct.values())
+
+
+def extract_keywords(query: str) -> list[str]:
+    """
+    LLM-free counterpart of the keyword prompt: up to MAX_VARIANTS variants of the
+    query, its leading key words together and then the key terms on their own, each
+    at most MAX_VARIANT_WORDS words long.
+    """
+    terms = key_terms(query)
+    words = {}
+    for term in terms:
+        for word in term.split():
+            words.setdefault(word.lower(), word)
+    words = list(words.values())
+    variants = [" ".join(words[:MAX_VARIANT_WORDS])]
+    variants.extend(" ".join(term.split()[:MAX_VARIANT_WORDS]) for term in terms)
+    return list(dict.fromkeys(variant for variant in variants if variant))[:MAX_VARIANTS]
@@ -1,21 +1,61 @@
-
+import heapq
+import math
+import os
 import re
 from collections import Counter
-
-import spacy
-import nltk
-from nltk import ngrams
-from nltk.tokenize import word_tokenize
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, repeat
 
 # curl -O https://raw.githubusercontent.com/amakukha/stemmers_ukrainian/master/src/tree_stem.py
-from retriever_pipeline.tree_stem import stem_word
-
-nltk.download('punkt_tab')
-
+from retriever_pipeline.tree_stem import stem_word, stem_words, register_word_cache, STEM_CACHE_SIZE
 
-nlp = spacy.load('uk_core_news_sm', disable=['parser', 'ner'])
+# Searched for punkt_tab in addition to NLTK's default locations; nothing is downloaded at runtime.
+# Provision it once with python -m retriever_pipeline.download_nltk_data
+NLTK_DATA_PATH = os.path.join(os.path.dirname(__file__), 'nltk_data')
+NLTK_PACKAGES = ("punkt_tab",)
 ALPH = set("абвгґдеєжзиіїйклмнопрстуфхцчшщьюя'-")
 CLEAN_PATTERN = re.compile(r"[^a-zA-Zа-яА-Яʼ-]")
+# Characters CLEAN_PATTERN keeps in lowercased text that are not in ALPH: stemmer() leaves words with them as is
+UNSTEMMED_PATTERN = re.compile(r"[a-zʼъыэ]")
+RANKERS = ("presence", "bm25", "tfidf")
+BM25_K1 = 1.5
+BM25_B = 0.75
+RRF_K = 60
+PROXIMITY_WINDOW = 10
+
+
+_word_tokenize = None
+
+
+def word_tokenize(text: str) -> list[str]:
+    """nltk.word_tokenize, with NLTK imported on first use."""
+    global _word_tokenize
+    if _word_tokenize is None:
+        _word_tokenize = load_word_tokenize()
+    return _word_tokenize(text)
+
+
+def load_word_tokenize():
+    """Import nltk.word_tokenize and make sure its punkt_tab data is available locally."""
+    import nltk
+    from nltk.tokenize import word_tokenize as nltk_word_tokenize
+
+    if NLTK_DATA_PATH not in nltk.data.path:
+        nltk.data.path.append(NLTK_DATA_PATH)
+    try:
+        nltk.data.find('tokenizers/punkt_tab/english/')
+    except LookupError:
+        raise LookupError(
+            "NLTK punkt_tab data not found. Install it once with "
+            "python -m retriever_pipeline.download_nltk_data"
+        ) from None
+    return nltk_word_tokenize
+
+
+def ngrams(tokens: list, n: int):
+    """Consecutive n-tuples of tokens, like nltk.ngrams."""
+    return zip(*(tokens[i:] for i in range(n)))
 
 
 def contains_only_alph(s):
@@ -23,12 +63,102 @@ def contains_only_alph(s):
     return all(char in ALPH for char in s)
 
 
+@register_word_cache
+@lru_cache(maxsize=STEM_CACHE_SIZE)
+def stem_piece(word: str) -> tuple[str, bool]:
+    """
+    What stemmer() turns a lowercased word into and whether that is already its only token.
+
+    Stemmed words consist of Cyrillic letters and hyphens, which word_tokenize keeps as a
+    single token unless they contain "--". Other pieces still go through word_tokenize.
+    """
+    if UNSTEMMED_PATTERN.search(word):
+        return word, False
+    stem = stem_word(clean_words(word))
+    return stem, "--" not in stem
+
+
+def join_pieces(pieces: list[tuple[str, bool]]) -> list[str]:
+    """
+    Tokenize the stemmed pieces of a text without rejoining them into a string.
+
+    Runs of pieces that need word_tokenize are tokenized together with the neighbouring
+    stems, whose single tokens are then dropped, so that punctuation rules see the same
+    context as when the whole text is tokenized.
+    """
+    pieces = [piece for piece in pieces if piece[0]]
+    tokens = []
+    i = 0
+    while i < len(pieces):
+        piece, is_token = pieces[i]
+        if is_token:
+            tokens.append(piece)
+            i += 1
+            continue
+        j = i
+        while j < len(pieces) and not pieces[j][1]:
+            j += 1
+        start = max(i - 1, 0)
+        end = min(j + 1, len(pieces))
+        run_tokens = word_tokenize(" ".join(piece for piece, _ in pieces[start:end]))
+        tokens.extend(run_tokens[i - start:len(run_tokens) - (end - j)])
+        i = j
+    return tokens
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Lowercase, clean and stem the input text and split it into tokens.
+
+    Equal to word_tokenize(stemmer(text.lower())), but Cyrillic words are cleaned and
+    stemmed once per distinct word and never reach NLTK.
+    """
+    return join_pieces([stem_piece(word) for word in text.lower().split()])
+
+
+def tokenize_many(texts: list[str]) -> list[list[str]]:
+    """Tokenize a batch of texts, stemming their distinct words in one vectorized pass."""
+    texts_words = [text.lower().split() for text in texts]
+    cleaned = {}
+    for words in texts_words:
+        for word in words:
+            if word not in cleaned:
+                cleaned[word] = None if UNSTEMMED_PATTERN.search(word) else clean_words(word)
+    stemmable = list({word for word in cleaned.values() if word is not None})
+    stems = dict(zip(stemmable, stem_words(stemmable)))
+    pieces = {
+        word: (word, False) if clean is None else (stems[clean], "--" not in stems[clean])
+        for word, clean in cleaned.items()
+    }
+    return [join_pieces([pieces[word] for word in words]) for words in texts_words]
+
+
 def generate_ngrams(text: str, n: int) -> list[str]:
     """Generate a list of n-grams from the input text."""
-    tokens = word_tokenize(stemmer(text.lower()))
+    tokens = tokenize(text)
     return list(ngrams(tokens, n))
 
 
+def add_chunk_tokens(chunks: list) -> list:
+    """Store the stemmed token sequence of each chunk in its metadata under "tokens"."""
+    for chunk, tokens in zip(chunks, tokenize_many([chunk.page_content for chunk in chunks])):
+        chunk.metadata["tokens"] = tokens
+    return chunks
+
+
+def get_chunk_tokens(chunk) -> list[str]:
+    """Stemmed tokens of a chunk, reusing its stored tokens when available."""
+    tokens = chunk.metadata.get("tokens")
+    if tokens is None:
+        tokens = tokenize(chunk.page_content)
+    return tokens
+
+
+def get_chunk_ngrams(chunk, n: int) -> list[str]:
+    """Generate n-grams of a chunk, reusing its stored tokens when available."""
+    return list(ngrams(get_chunk_tokens(chunk), n))
+
+
 def clean_words(text: str):
     """Remove unwanted characters from text using CLEAN_PATTERN."""
     return CLEAN_PATTERN.sub("", text)
@@ -45,12 +175,15 @@ def stemmer(text: str):
 
 def search_by_ngrams(chunks: list, query: str, n: int = 1, top_k: int = 3) -> list:
     """Find the top-k most relevant chunks by matching n-grams from the query."""
+    if top_k <= 0:
+        return []
     query_ngrams = set(generate_ngrams(query, n))
 
-    chunk_scores = []
+    # Bounded min-heap of the best (presence_score, intersection_size, -chunk_id) seen so far
+    heap = []
 
-    for chunk in chunks:
-        chunk_ngrams = generate_ngrams(chunk.page_content, n)
+    for chunk_id, chunk in enumerate(chunks):
+        chunk_ngrams = get_chunk_ngrams(chunk, n)
         chunk_counts = Counter(chunk_ngrams)
         chunk_ngrams = set(chunk_ngrams)
 
@@ -58,8 +191,420 @@ def search_by_ngrams(chunks: list, query: str, n: int = 1, top_k: int = 3) -> li
         intersection_size = sum(chunk_counts[ng] for ng in query_ngrams)
 
         if intersection_size > 0:
-            chunk_scores.append((chunk.page_content, presence_score, intersection_size))
+            item = (presence_score, intersection_size, -chunk_id, chunk.page_content)
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    heap.sort(reverse=True)
+    return [item[3] for item in heap]
+
+
+def build_inverted_index(chunks: list, n: int = 1) -> dict:
+    """
+    Build an inverted index mapping each n-gram to the chunks containing it and their counts.
+
+    The index also stores chunk lengths (in n-grams) so that length-normalized rankers
+    can be evaluated without touching the chunks. Document frequencies are the sizes
+    of the posting lists. A unigram index additionally keeps token positions per chunk,
+    from which phrase (higher-order n-gram) and proximity matches are computed.
+    """
+    postings, chunk_lengths, positions = count_ngrams([get_chunk_tokens(chunk) for chunk in chunks], n)
+    return finalize_index(postings, chunk_lengths, n, positions)
+
+
+def count_ngrams(token_lists: list[list[str]], n: int = 1) -> tuple:
+    """
+    Count the n-grams of token sequences into posting lists keyed by the position of
+    the sequence in token_lists, their lengths and, for unigrams, token positions.
+    """
+    postings = {}
+    positions = {} if n == 1 else None
+    chunk_lengths = []
+    for chunk_id, tokens in enumerate(token_lists):
+        chunk_ngrams = list(ngrams(tokens, n))
+        chunk_lengths.append(len(chunk_ngrams))
+        for ng, count in Counter(chunk_ngrams).items():
+            postings.setdefault(ng, {})[chunk_id] = count
+        if positions is not None:
+            for position, ng in enumerate(chunk_ngrams):
+                positions.setdefault(ng, {}).setdefault(chunk_id, []).append(position)
+    return postings, chunk_lengths, positions
+
+
+def tokenize_and_count(shard: list, n: int = 1) -> tuple:
+    """
+    Tokenize and count one shard of a corpus; the worker task of build_inverted_index_parallel.
+
+    Items of the shard are chunk texts or, for chunks that were already tokenized, their
+    token lists. Returns the token lists of the texts and the count_ngrams result of the shard.
+    """
+    texts = [item for item in shard if isinstance(item, str)]
+    new_tokens = iter(tokenize_many(texts))
+    token_lists = [next(new_tokens) if isinstance(item, str) else item for item in shard]
+    return [tokens for item, tokens in zip(shard, token_lists) if isinstance(item, str)], count_ngrams(token_lists, n)
+
+
+def merge_ngram_counts(partials: list[tuple], n: int = 1) -> tuple:
+    """
+    Merge count_ngrams results of consecutive shards of a corpus, in corpus order.
+
+    Chunk ids of each shard are offset by the number of chunks before it, so the result,
+    including the order of terms and posting lists, equals counting the whole corpus at once.
+    """
+    postings = {}
+    positions = {} if n == 1 else None
+    chunk_lengths = []
+    for shard_postings, shard_lengths, shard_positions in partials:
+        offset = len(chunk_lengths)
+        for ng, chunk_counts in shard_postings.items():
+            merged = postings.setdefault(ng, {})
+            for chunk_id, count in chunk_counts.items():
+                merged[chunk_id + offset] = count
+        if positions is not None:
+            for ng, chunk_positions in shard_positions.items():
+                merged = positions.setdefault(ng, {})
+                for chunk_id, token_positions in chunk_positions.items():
+                    merged[chunk_id + offset] = token_positions
+        chunk_lengths.extend(shard_lengths)
+    return postings, chunk_lengths, positions
+
+
+def build_inverted_index_parallel(chunks: list, n: int = 1, workers: int = None, shards_per_worker: int = 4) -> dict:
+    """
+    Build the same index as build_inverted_index, stemming and counting in worker processes.
+
+    The chunks are split into contiguous shards that workers tokenize and count, and the
+    partial counts are merged in corpus order. Tokens of chunks without stored tokens are
+    stored in their metadata, as add_chunk_tokens would.
+    """
+    workers = workers or os.cpu_count() or 1
+    shard_size = max(1, math.ceil(len(chunks) / (workers * shards_per_worker)))
+    shards = [chunks[start:start + shard_size] for start in range(0, len(chunks), shard_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            tokenize_and_count,
+            [[chunk.metadata.get("tokens", chunk.page_content) for chunk in shard] for shard in shards],
+            repeat(n)
+        ))
+    for shard, (new_tokens, _) in zip(shards, results):
+        for chunk, tokens in zip((chunk for chunk in shard if "tokens" not in chunk.metadata), new_tokens):
+            chunk.metadata["tokens"] = tokens
+    postings, chunk_lengths, positions = merge_ngram_counts([counts for _, counts in results], n)
+    return finalize_index(postings, chunk_lengths, n, positions)
+
+
+def finalize_index(postings: dict, chunk_lengths: list[int], n: int, positions: dict = None) -> dict:
+    """
+    Assemble an index from its posting lists and chunk lengths and precompute the
+    collection statistics and per-term score upper bounds used at query time.
+    """
+    index = {
+        "n": n,
+        "num_chunks": len(chunk_lengths),
+        "postings": postings,
+        "positions": positions,
+        "chunk_lengths": chunk_lengths,
+        "avg_chunk_length": sum(chunk_lengths) / len(chunk_lengths) if chunk_lengths else 0.0,
+        "max_chunk_length": max(chunk_lengths, default=0),
+    }
+    index["upper_bounds"] = {}
+    for ranker in RANKERS:
+        contribution = term_contribution(index, ranker)
+        index["upper_bounds"][ranker] = {
+            ng: max(contribution(chunk_id, count, len(chunk_counts)) for chunk_id, count in chunk_counts.items())
+            for ng, chunk_counts in postings.items()
+        }
+    return index
+
+
+def bm25_weight(count: int, df: int, chunk_length: int, num_chunks: int, avg_chunk_length: float,
+                k1: float = BM25_K1, b: float = BM25_B) -> float:
+    """Okapi BM25 contribution of one query term to one chunk."""
+    idf = math.log(1 + (num_chunks - df + 0.5) / (df + 0.5))
+    norm = 1 - b + b * chunk_length / avg_chunk_length if avg_chunk_length else 1.0
+    return idf * count * (k1 + 1) / (count + k1 * norm)
+
+
+def tfidf_weight(count: int, df: int, num_chunks: int) -> float:
+    """TF-IDF contribution of one query term to one chunk."""
+    return count * math.log(num_chunks / df)
+
+
+def _check_ranker(ranker: str):
+    if ranker not in RANKERS:
+        raise ValueError(f"Unknown ranker: {ranker}. Expected one of {RANKERS}")
+
+
+def phrase_postings(index: dict, phrase: tuple) -> dict:
+    """Count the occurrences of a sequence of consecutive tokens in each chunk using token positions."""
+    positions = index["positions"]
+    token_positions = [positions.get((token,)) for token in phrase]
+    if not all(token_positions):
+        return {}
+    rarest = min(token_positions, key=len)
+    chunk_counts = {}
+    for chunk_id in rarest:
+        if not all(chunk_id in chunk_positions for chunk_positions in token_positions):
+            continue
+        starts = set(token_positions[0][chunk_id])
+        for offset, chunk_positions in enumerate(token_positions[1:], 1):
+            starts.intersection_update(position - offset for position in chunk_positions[chunk_id])
+        if starts:
+            chunk_counts[chunk_id] = len(starts)
+    return dict(sorted(chunk_counts.items()))
+
+
+def get_postings(index: dict, ng) -> dict:
+    """
+    Get the {chunk_id: count} postings of an n-gram.
+
+    N-grams longer than those the index was built on are answered from token positions.
+    """
+    if len(ng) == index["n"]:
+        return index["postings"].get(ng)
+    if index.get("positions") is None:
+        raise ValueError(f"A {index['n']}-gram index without positions cannot answer {len(ng)}-gram queries")
+    return phrase_postings(index, ng)
+
+
+def term_scores(index: dict, ng, ranker: str = "presence") -> list:
+    """
+    List (chunk_id, score) contributions of one n-gram from its posting list.
+
+    For "presence" a contribution is a (presence, count) pair, otherwise a float weight.
+    Phrase n-grams use the unigram chunk lengths for BM25 normalization.
+    """
+    chunk_counts = get_postings(index, ng)
+    if not chunk_counts:
+        return []
+    df = len(chunk_counts)
+    num_chunks = index["num_chunks"]
+    if ranker == "presence":
+        return [(chunk_id, (1, count)) for chunk_id, count in chunk_counts.items()]
+    if ranker == "bm25":
+        chunk_lengths = index["chunk_lengths"]
+        avg_chunk_length = index["avg_chunk_length"]
+        return [(chunk_id, bm25_weight(count, df, chunk_lengths[chunk_id], num_chunks, avg_chunk_length))
+                for chunk_id, count in chunk_counts.items()]
+    return [(chunk_id, tfidf_weight(count, df, num_chunks)) for chunk_id, count in chunk_counts.items()]
+
+
+def add_score(chunk_scores: dict, chunk_id: int, score):
+    """Add a term contribution to the accumulated score of a chunk."""
+    current = chunk_scores.get(chunk_id)
+    if current is None:
+        chunk_scores[chunk_id] = score
+    elif isinstance(score, tuple):
+        chunk_scores[chunk_id] = (current[0] + score[0], current[1] + score[1])
+    else:
+        chunk_scores[chunk_id] = current + score
+
+
+def rank_chunks(chunk_scores: dict, ranker: str = "presence", top_k: int = None) -> list[int]:
+    """Order chunk ids by descending score, ties in chunk order, keeping only the top-k if given."""
+    if ranker == "presence":
+        key = lambda i: (-chunk_scores[i][0], -chunk_scores[i][1], i)
+    else:
+        key = lambda i: (-chunk_scores[i], i)
+    if top_k is None:
+        return sorted(chunk_scores, key=key)
+    return heapq.nsmallest(top_k, chunk_scores, key=key)
+
+
+def term_contribution(index: dict, ranker: str = "presence"):
+    """
+    Return a function (chunk_id, count, df) -> scalar score contribution of one term.
+
+    The "presence" ranker is encoded as presence_score * scale + intersection_size with
+    scale larger than any chunk, so scalar order equals the (presence, intersection) order.
+    """
+    num_chunks = index["num_chunks"]
+    if ranker == "presence":
+        scale = index["max_chunk_length"] + 1
+        return lambda chunk_id, count, df: scale + count
+    if ranker == "bm25":
+        chunk_lengths = index["chunk_lengths"]
+        avg_chunk_length = index["avg_chunk_length"]
+        return lambda chunk_id, count, df: bm25_weight(count, df, chunk_lengths[chunk_id], num_chunks,
+                                                       avg_chunk_length)
+    return lambda chunk_id, count, df: tfidf_weight(count, df, num_chunks)
+
+
+def maxscore_top_k(index: dict, query_ngrams: set, top_k: int, ranker: str = "presence") -> list[int]:
+    """
+    Term-at-a-time MaxScore top-k retrieval.
+
+    Query terms are processed in decreasing order of their precomputed score upper
+    bound. Once the summed bounds of the remaining terms fall below the current k-th
+    best partial score, no unseen chunk can reach the top-k: the remaining postings are
+    no longer iterated, only probed for surviving candidates, and candidates that cannot
+    catch up are dropped. Returns chunk ids ranked exactly like rank_chunks.
+    """
+    if top_k <= 0:
+        return []
+    contribution = term_contribution(index, ranker)
+    upper_bounds = index["upper_bounds"][ranker]
+
+    terms = [(upper_bounds[ng], index["postings"][ng]) for ng in query_ngrams if ng in index["postings"]]
+    terms.sort(key=lambda term: -term[0])
+    remaining_bounds = list(accumulate((term[0] for term in reversed(terms)), initial=0))[::-1]
+
+    chunk_scores = {}
+    threshold = None
+    i = 0
+    while i < len(terms):
+        if len(chunk_scores) >= top_k:
+            threshold = heapq.nlargest(top_k, chunk_scores.values())[-1]
+            if remaining_bounds[i] < threshold:
+                break
+        upper_bound, chunk_counts = terms[i]
+        df = len(chunk_counts)
+        for chunk_id, count in chunk_counts.items():
+            chunk_scores[chunk_id] = chunk_scores.get(chunk_id, 0) + contribution(chunk_id, count, df)
+        i += 1
+
+    # Unseen chunks score at most remaining_bounds[i] < threshold: only refine the candidates
+    for j in range(i, len(terms)):
+        chunk_scores = {
+            chunk_id: score for chunk_id, score in chunk_scores.items()
+            if score + remaining_bounds[j] >= threshold
+        }
+        upper_bound, chunk_counts = terms[j]
+        df = len(chunk_counts)
+        for chunk_id in chunk_scores:
+            count = chunk_counts.get(chunk_id)
+            if count:
+                chunk_scores[chunk_id] += contribution(chunk_id, count, df)
+        threshold = heapq.nlargest(top_k, chunk_scores.values())[-1]
+
+    return heapq.nsmallest(top_k, chunk_scores, key=lambda chunk_id: (-chunk_scores[chunk_id], chunk_id))
+
+
+def search_index(chunks: list, index: dict, query: str, top_k: int = 3, ranker: str = "presence",
+                 early_termination: bool = True, n: int = None) -> list:
+    """
+    Find the top-k most relevant chunks using a prebuilt inverted index.
+
+    Only the postings of the query n-grams are visited, and with early_termination
+    MaxScore skips postings that cannot reach the top-k. The default "presence" ranker
+    orders chunks exactly like search_by_ngrams: by (presence_score, intersection_size),
+    ties in chunk order. "bm25" and "tfidf" sum the per-term weights instead.
+    Passing an n larger than the index's matches query phrases through token positions.
+    """
+    _check_ranker(ranker)
+    n = n or index["n"]
+    query_ngrams = set(generate_ngrams(query, n))
+
+    if early_termination and n == index["n"]:
+        ranked = maxscore_top_k(index, query_ngrams, top_k, ranker)
+        return [chunks[i].page_content for i in ranked]
+
+    chunk_scores = {}
+    for ng in query_ngrams:
+        for chunk_id, score in term_scores(index, ng, ranker):
+            add_score(chunk_scores, chunk_id, score)
+
+    ranked = rank_chunks(chunk_scores, ranker, top_k=top_k)
+    return [chunks[i].page_content for i in ranked]
+
+
+def min_span(token_positions: list[list[int]]) -> int:
+    """Length in tokens of the shortest window containing at least one position of every list."""
+    events = sorted((position, term) for term, positions in enumerate(token_positions) for position in positions)
+    counts = [0] * len(token_positions)
+    covered = 0
+    best = math.inf
+    left = 0
+    for position, term in events:
+        counts[term] += 1
+        if counts[term] == 1:
+            covered += 1
+        while covered == len(token_positions):
+            left_position, left_term = events[left]
+            best = min(best, position - left_position + 1)
+            counts[left_term] -= 1
+            if counts[left_term] == 0:
+                covered -= 1
+            left += 1
+    return best
+
+
+def search_proximity(chunks: list, index: dict, query: str, top_k: int = 3, window: int = PROXIMITY_WINDOW) -> list:
+    """
+    Find the top-k most relevant chunks, rewarding chunks where the query terms appear close together.
+
+    Chunks are ranked by presence_score, then by whether all their matched query terms
+    fit within `window` tokens, then by the shortest such span, then by intersection_size.
+    Spans are computed from the positional index, without re-tokenizing chunks.
+    """
+    if index.get("positions") is None:
+        raise ValueError("Proximity search requires an index built with token positions")
+    query_ngrams = set(generate_ngrams(query, 1))
+
+    matched = {}
+    for ng in query_ngrams:
+        for chunk_id, chunk_positions in index["positions"].get(ng, {}).items():
+            matched.setdefault(chunk_id, []).append(chunk_positions)
+
+    chunk_scores = {}
+    for chunk_id, token_positions in matched.items():
+        span = min_span(token_positions)
+        intersection_size = sum(len(chunk_positions) for chunk_positions in token_positions)
+        chunk_scores[chunk_id] = (-len(token_positions), span > window, span, -intersection_size, chunk_id)
+
+    ranked = heapq.nsmallest(top_k, chunk_scores, key=chunk_scores.get)
+    return [chunks[i].page_content for i in ranked]
+
+
+def search_many(chunks: list, queries: list[str], top_k: int = 3, index: dict = None, ranker: str = "presence",
+                n: int = None) -> dict:
+    """
+    Search several query variants at once.
+
+    Every distinct n-gram across all queries has its postings visited once and its
+    contributions are shared by the queries containing it. Without an index, one is
+    built in a single pass over the chunks.
+
+    Returns:
+        dict: "per_query" holds the top-k chunks for each query (in input order) and
+        "fused" the union of those results without duplicates, ordered by reciprocal
+        rank fusion.
+    """
+    _check_ranker(ranker)
+    if index is None:
+        index = build_inverted_index(chunks, n or 1)
+    n = n or index["n"]
+
+    queries_ngrams = [set(generate_ngrams(query, n)) for query in queries]
+    queries_by_ngram = {}
+    for query_id, query_ngrams in enumerate(queries_ngrams):
+        for ng in query_ngrams:
+            queries_by_ngram.setdefault(ng, []).append(query_id)
+
+    queries_scores = [{} for _ in queries]
+    for ng, query_ids in queries_by_ngram.items():
+        for chunk_id, score in term_scores(index, ng, ranker):
+            for query_id in query_ids:
+                add_score(queries_scores[query_id], chunk_id, score)
+
+    per_query_ids = [rank_chunks(chunk_scores, ranker, top_k=top_k) for chunk_scores in queries_scores]
+    return format_many_results(chunks, per_query_ids)
+
+
+def fuse_rankings(rankings: list[list[int]]) -> list[int]:
+    """Merge ranked chunk id lists with reciprocal rank fusion, dropping duplicates."""
+    fused_scores = {}
+    for ranked in rankings:
+        for rank, chunk_id in enumerate(ranked):
+            fused_scores[chunk_id] = fused_scores.get(chunk_id, 0.0) + 1 / (RRF_K + rank + 1)
+    return sorted(fused_scores, key=lambda i: -fused_scores[i])
+
 
-    chunk_scores.sort(key=lambda x: (x[1], x[2]), reverse=True)
-    chunk_scores = [item[0] for item in chunk_scores]
-    return chunk_scores[:top_k]
+def format_many_results(chunks: list, per_query_ids: list[list[int]]) -> dict:
+    """Turn per-query ranked chunk ids into the per-query and fused chunk texts returned by search_many."""
+    return {
+        "per_query": [[chunks[i].page_content for i in ranked] for ranked in per_query_ids],
+        "fused": [chunks[i].page_content for i in fuse_rankings(per_query_ids)],
+    }
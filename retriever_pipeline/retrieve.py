@@ -1,10 +1,23 @@
+import asyncio
+import hashlib
+import json
+import os
 import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from glob import glob
 
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 
-from retriever_pipeline.chunking import load_chunks_from_file, load_documents, split_into_chunks, clean_chunks, save_chunks_to_file
-from retriever_pipeline.processing_chunks import search_by_ngrams
+from retriever_pipeline.chunking import load_document_files, split_into_chunks, clean_chunks, save_chunks_to_file, \
+    load_index_from_file, save_index_to_file, load_versioned_chunks, to_documents, load_chunks_from_file, CHUNKS_FORMAT_VERSION
+from retriever_pipeline.processing_chunks import search_by_ngrams, build_inverted_index, search_index, add_chunk_tokens, \
+    search_many, search_proximity, build_inverted_index_parallel
+from retriever_pipeline.term_matrix import build_term_matrix, search_matrix, search_matrix_many
+from retriever_pipeline.keyword_cache import KeywordCache, model_name
+from retriever_pipeline.local_keywords import extract_keywords
 
 template = """
 Вам буде надано питання або твердження. Ваше завдання — створити три різні варіації ключових слів (по 1–3 слова кожне), які будуть ефективними для отримання відповідної інформації з баз даних або пошукових систем.
@@ -41,77 +54,557 @@ template = """
 **Відповідь:**
 """
 
+# Artifacts loaded in this process, keyed by absolute path: path -> ((mtime_ns, size), value)
+_artifact_cache = {}
+_artifact_cache_lock = threading.RLock()
+# Term matrices built in memory when no matrix file was saved: chunks path -> (index, matrix)
+_built_matrices = {}
+# Keyword state has its own locks: the artifact lock is held while artifacts are loaded or
+# rebuilt, and agenerate_llm_keywords takes these on the event loop
+_keyword_cache = None
+_keyword_cache_lock = threading.Lock()
+# id(model) -> (model, keyword chain) for the most recently used models
+_keyword_chains = OrderedDict()
+_keyword_chains_lock = threading.Lock()
+MAX_KEYWORD_CHAINS = 8
+
+KEYWORD_MODES = ("llm", "local")
+# Keyword generator used when a call does not choose one, see set_keyword_mode
+_keyword_mode = "llm"
+
+
+def get_index_path(filepath):
+    """
+    Get the path of the inverted index stored alongside a chunks file.
+
+    Args:
+        filepath (str): Path to the file containing pre-processed chunks.
+
+    Returns:
+        str: Path to the corresponding index file.
+    """
+    root, _ = os.path.splitext(filepath)
+    return f'{root}_index.pkl'
+
+
+def get_matrix_path(filepath):
+    """
+    Get the path of the sparse term-document matrix stored alongside a chunks file.
+
+    Args:
+        filepath (str): Path to the file containing pre-processed chunks.
+
+    Returns:
+        str: Path to the corresponding matrix file.
+    """
+    root, _ = os.path.splitext(filepath)
+    return f'{root}_matrix.pkl'
+
+
+def get_manifest_path(filepath):
+    """
+    Get the path of the build manifest stored alongside a chunks file.
+
+    Args:
+        filepath (str): Path to the file containing pre-processed chunks.
+
+    Returns:
+        str: Path to the corresponding manifest file.
+    """
+    root, _ = os.path.splitext(filepath)
+    return f'{root}_manifest.json'
+
+
+def hash_file(path):
+    """
+    Compute the SHA-256 hex digest of a file's content.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(filepath):
+    """
+    Load the build manifest of a chunks file.
+
+    Args:
+        filepath (str): Path to the file containing pre-processed chunks.
+
+    Returns:
+        dict: The manifest, or None if it is missing or unreadable.
+    """
+    try:
+        with open(get_manifest_path(filepath), encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def save_manifest(filepath, manifest):
+    """
+    Save the build manifest of a chunks file, replacing the previous one atomically.
+    """
+    manifest_path = get_manifest_path(filepath)
+    tmp_path = f'{manifest_path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def save_chunks_with_index(chunks, filepath, build_matrix=False, index=None):
+    """
+    Save chunks and the inverted index built over their stored tokens.
+
+    Args:
+        chunks (list): Chunks annotated with add_chunk_tokens.
+        filepath (str): Path to save the chunks to.
+        build_matrix (bool): Also save the sparse term-document matrix. An existing
+            matrix file is always rebuilt so it never goes stale.
+        index (dict): The unigram index of the chunks if it was already built.
+
+    Returns:
+        None
+    """
+    if index is None:
+        index = build_inverted_index(chunks)
+    save_chunks_to_file(chunks, filepath)
+    save_index_to_file(index, get_index_path(filepath))
+    matrix_path = get_matrix_path(filepath)
+    if build_matrix or os.path.exists(matrix_path):
+        save_index_to_file(build_term_matrix(index), matrix_path)
+    invalidate(filepath)
+
+
+def load_chunks(filepath):
+    """
+    Load pre-processed chunks, rebuilding the artifact if it was saved in an older format.
+
+    Args:
+        filepath (str): Path to the file containing pre-processed chunks.
+
+    Returns:
+        ChunkStore: The loaded chunks with their stemmed tokens.
+    """
+    version, chunks = load_versioned_chunks(filepath)
+    if version != CHUNKS_FORMAT_VERSION:
+        chunks = add_chunk_tokens(to_documents(chunks))
+        save_chunks_with_index(chunks, filepath)
+        _, chunks = load_versioned_chunks(filepath)
+    return chunks
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_cached(path, loader):
+    """Return the cached result of loader(path), reloading only if the file's mtime or size changed."""
+    key = os.path.abspath(path)
+    with _artifact_cache_lock:
+        cached = _artifact_cache.get(key)
+        if cached is not None and cached[0] == _file_signature(path):
+            return cached[1]
+        value = loader(path)
+        # The loader may rewrite a stale artifact, so take the signature afterwards
+        _artifact_cache[key] = (_file_signature(path), value)
+        return value
+
+
+def invalidate(filepath=None):
+    """
+    Drop cached chunks and index of a chunks file so they are reloaded on next use.
+
+    Args:
+        filepath (str): Path to the chunks file. If None, the whole cache is cleared.
+
+    Returns:
+        None
+    """
+    with _artifact_cache_lock:
+        if filepath is None:
+            _artifact_cache.clear()
+            _built_matrices.clear()
+            return
+        _artifact_cache.pop(os.path.abspath(filepath), None)
+        _artifact_cache.pop(os.path.abspath(get_index_path(filepath)), None)
+        _artifact_cache.pop(os.path.abspath(get_matrix_path(filepath)), None)
+        _built_matrices.pop(os.path.abspath(filepath), None)
+
+
+def load_chunk_store(filepath, ranker="presence"):
+    """
+    Load chunks and their inverted index through the process-wide cache.
 
-def retrieve_chunks(filepath, query, num_chunks_to_retrieve=3):
+    Args:
+        filepath (str): Path to the file containing pre-processed chunks.
+        ranker (str): Ranker the index will be used with.
+
+    Returns:
+        tuple: The chunks and the index, or None if there is no index file and the
+        "presence" ranker can fall back to scanning the chunks.
+    """
+    chunks = _load_cached(filepath, load_chunks)
+    index_path = get_index_path(filepath)
+    if os.path.exists(index_path):
+        index = _load_cached(index_path, load_index_from_file)
+        if index["num_chunks"] == len(chunks):
+            return chunks, index
+        # Another process replaced the chunks and has not saved their index yet
+        print(f'Index does not match the chunks, rebuilding it in memory: {index_path}')
+        return chunks, build_inverted_index(chunks)
+    if ranker != "presence":
+        return chunks, build_inverted_index(chunks)
+    return chunks, None
+
+
+def load_matrix_store(filepath):
+    """
+    Load chunks and their sparse term-document matrix through the process-wide cache.
+
+    Args:
+        filepath (str): Path to the file containing pre-processed chunks.
+
+    Returns:
+        tuple: The chunks and the matrix. If no matrix file was saved, or it does not
+        match the chunks, the matrix is built from the index once and kept until the
+        index changes.
+    """
+    chunks, index = load_chunk_store(filepath, ranker="bm25")
+    matrix_path = get_matrix_path(filepath)
+    if os.path.exists(matrix_path):
+        matrix = _load_cached(matrix_path, load_index_from_file)
+        if matrix["counts"].shape[0] == len(chunks):
+            return chunks, matrix
+    key = os.path.abspath(filepath)
+    with _artifact_cache_lock:
+        entry = _built_matrices.get(key)
+        if entry is None or entry[0] is not index:
+            entry = _built_matrices[key] = (index, build_term_matrix(index))
+        return chunks, entry[1]
+
+
+def retrieve_chunks(filepath, query, num_chunks_to_retrieve=3, ranker="presence", backend="index", n=1):
     """
     Retrieve the most relevant chunks from a file based on a query.
 
+    Chunks and index are loaded once per process and reused until the files change.
+
     Args:
         filepath (str): Path to the file containing pre-processed chunks.
         query (str): The search query to match chunks against.
         num_chunks_to_retrieve (int): Number of top relevant chunks to retrieve.
+        ranker (str): Ranking function: "presence" (n-gram overlap), "bm25", "tfidf" or
+            "proximity" (presence, then how close together the query terms appear).
+        backend (str): "index" to walk posting lists or "matrix" for sparse matrix scoring.
+        n (int): N-gram order of the query; phrases are matched through token positions.
+            Only supported by the "index" backend.
 
     Returns:
         list: A list of the top matching chunks.
     """
-    chunks = load_chunks_from_file(filepath)
-    result = search_by_ngrams(chunks, query, top_k=num_chunks_to_retrieve)
+    if backend == "matrix":
+        chunks, matrix = load_matrix_store(filepath)
+        return search_matrix(chunks, matrix, query, top_k=num_chunks_to_retrieve, ranker=ranker)
+    chunks, index = load_chunk_store(filepath, ranker)
+    if index is None:
+        return search_by_ngrams(chunks, query, n=n, top_k=num_chunks_to_retrieve)
+    if ranker == "proximity":
+        return search_proximity(chunks, index, query, top_k=num_chunks_to_retrieve)
+    result = search_index(chunks, index, query, top_k=num_chunks_to_retrieve, ranker=ranker, n=n)
     return result
 
 
-def preprocess_documents(documents_path, save_path, chunk_size=256, chunk_overlap=50):
+def retrieve_chunks_many(filepath, queries, num_chunks_to_retrieve=3, ranker="presence", backend="index", n=1):
     """
-    Load documents, split them into chunks, clean them, and save to a file.
+    Retrieve the most relevant chunks for several queries in a single pass.
+
+    Args:
+        filepath (str): Path to the file containing pre-processed chunks.
+        queries (list): The search queries to match chunks against.
+        num_chunks_to_retrieve (int): Number of top relevant chunks to retrieve per query.
+        ranker (str): Ranking function: "presence" (n-gram overlap), "bm25" or "tfidf".
+        backend (str): "index" to walk posting lists or "matrix" to score all queries with
+            one sparse matrix-matrix product.
+        n (int): N-gram order of the queries. Only supported by the "index" backend.
+
+    Returns:
+        dict: Top chunks per query under "per_query" and their de-duplicated fusion under "fused".
+    """
+    if backend == "matrix":
+        chunks, matrix = load_matrix_store(filepath)
+        return search_matrix_many(chunks, matrix, queries, top_k=num_chunks_to_retrieve, ranker=ranker)
+    chunks, index = load_chunk_store(filepath, ranker)
+    return search_many(chunks, queries, top_k=num_chunks_to_retrieve, index=index, ranker=ranker, n=n)
+
+
+def preprocess_documents(documents_path, save_path, chunk_size=256, chunk_overlap=50, build_matrix=False, workers=1):
+    """
+    Load documents, split them into chunks, clean and stem them, and save them to a file
+    together with an inverted index over their unigrams.
+
+    A manifest with the content hashes of the source files and the chunking parameters
+    is saved alongside. If nothing changed, the existing artifacts are kept as they are;
+    if only some files changed, chunks of the unchanged files are reused and only the
+    changed files are re-chunked and re-stemmed.
+
+    With more than one worker, stemming and counting n-grams are sharded across a pool
+    of processes; the merged index is identical to a single-process build.
 
     Args:
         documents_path (str): Path to the documents to be loaded.
         save_path (str): Path to save the processed chunks.
         chunk_size (int): Size of each chunk in characters.
         chunk_overlap (int): Number of overlapping characters between chunks.
+        build_matrix (bool): Also save a sparse term-document matrix for the "matrix" backend.
+        workers (int): Number of processes for stemming and indexing; None uses all CPUs.
 
     Returns:
         None
     """
-    # Load documents
-    docs = load_documents(documents_path)
-    # Split into chunks
+    files_path = glob(documents_path)
+    manifest = {
+        "format_version": CHUNKS_FORMAT_VERSION,
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "documents": {path: hash_file(path) for path in files_path},
+    }
+
+    previous = load_manifest(save_path)
+    artifacts = [save_path, get_index_path(save_path)] + ([get_matrix_path(save_path)] if build_matrix else [])
+    reusable = (
+        previous is not None
+        and all(previous.get(key) == manifest[key] for key in ("format_version", "chunk_size", "chunk_overlap"))
+        and all(os.path.exists(path) for path in artifacts)
+    )
+    if reusable and previous["documents"] == manifest["documents"]:
+        print(f'Chunks are up to date: {save_path}')
+        return
+
+    unchanged = set()
+    if reusable:
+        unchanged = {path for path, digest in manifest["documents"].items() if previous["documents"].get(path) == digest}
+    reused_chunks = {}
+    if unchanged:
+        for chunk in to_documents(load_chunks_from_file(save_path)):
+            if chunk.metadata.get("source") in unchanged:
+                reused_chunks.setdefault(chunk.metadata["source"], []).append(chunk)
+
+    # Load, split and clean only the new or changed documents
+    changed_files = [path for path in files_path if path not in unchanged]
+    docs = load_document_files(changed_files)
     chunks = split_into_chunks(docs, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
-    cleaned_chunks = clean_chunks(chunks)
+    new_chunks = {}
+    for chunk in clean_chunks(chunks):
+        new_chunks.setdefault(chunk.metadata["source"], []).append(chunk)
+    parallel = workers is None or workers > 1
+    # Stem once at build time so queries never re-tokenize chunks
+    if not parallel:
+        for source_chunks in new_chunks.values():
+            add_chunk_tokens(source_chunks)
+
+    cleaned_chunks = []
+    for path in files_path:
+        cleaned_chunks.extend(reused_chunks.get(path) or new_chunks.get(path, []))
+    index = build_inverted_index_parallel(cleaned_chunks, workers=workers) if parallel else None
+
+    # Save cleaned chunks, their inverted index and the manifest describing them
+    save_chunks_with_index(cleaned_chunks, save_path, build_matrix=build_matrix, index=index)
+    save_manifest(save_path, manifest)
+    print(f'Chunks processed and saved. Total chunks: {len(cleaned_chunks)} '
+          f'({len(changed_files)} of {len(files_path)} documents re-chunked)')
+
+
+def get_keyword_cache():
+    """The process-wide KeywordCache at KEYWORD_CACHE_PATH, opened on first use."""
+    global _keyword_cache
+    with _keyword_cache_lock:
+        if _keyword_cache is None:
+            _keyword_cache = KeywordCache()
+        return _keyword_cache
+
+
+def cached_keywords(model, query):
+    """
+    Keywords the model generated for the query before, or None.
+
+    The cache only saves model calls, so if it cannot be read, e.g. because another
+    process keeps the database locked, the error is logged and treated as a miss.
+    """
+    try:
+        return get_keyword_cache().get(model_name(model), template, query)
+    except (sqlite3.Error, OSError) as error:
+        print(f'Keyword cache lookup failed: {error}')
+        return None
 
-    # Save cleaned chunks to a file
-    save_chunks_to_file(cleaned_chunks, save_path)
-    print(f'Chunks processed and saved. Total chunks: {len(cleaned_chunks)}')
 
+def cache_keywords(model, query, keywords):
+    """Save generated keywords to the keyword cache, logging instead of raising if it fails."""
+    try:
+        get_keyword_cache().put(model_name(model), template, query, keywords)
+    except (sqlite3.Error, OSError) as error:
+        print(f'Could not save keywords to the keyword cache: {error}')
 
-def retrieve_relevant_chunks(filepath, model, query, num_chunks_to_retrieve=1):
+
+def parse_keywords(answer):
+    """Extract the quoted keyword variants from the model answer."""
+    return re.findall(r'"([^"]*)"', answer)
+
+
+def set_keyword_mode(mode):
+    """Select how retrieve_relevant_chunks generates keywords unless a call overrides it."""
+    global _keyword_mode
+    _check_keyword_mode(mode)
+    _keyword_mode = mode
+
+
+def _check_keyword_mode(mode):
+    if mode not in KEYWORD_MODES:
+        raise ValueError(f"Unknown keyword mode: {mode}. Expected one of {KEYWORD_MODES}")
+
+
+def keyword_chain(model):
     """
-    Retrieve relevant chunks from a file by querying a language model for keywords.
+    Chain asking the model for keyword variants of a question with the prompt template.
+
+    Chains are built once per model and reused, as long as the same model object is passed.
+    """
+    with _keyword_chains_lock:
+        entry = _keyword_chains.get(id(model))
+        if entry is None or entry[0] is not model:
+            prompt = PromptTemplate.from_template(template)
+            entry = _keyword_chains[id(model)] = (model, LLMChain(prompt=prompt, llm=model))
+            if len(_keyword_chains) > MAX_KEYWORD_CHAINS:
+                _keyword_chains.popitem(last=False)
+        _keyword_chains.move_to_end(id(model))
+        return entry[1]
+
+
+def generate_llm_keywords(model, query, use_cache=True):
+    """
+    Ask a language model for keyword variants of a query, reusing cached answers.
+
+    Args:
+        model (LLM): Language model to generate keywords for searching.
+        query (str): User query or prompt to guide the search.
+        use_cache (bool): Look the keywords up in and save them to the keyword cache.
+
+    Returns:
+        list: The generated keywords.
+    """
+    if use_cache:
+        keywords = cached_keywords(model, query)
+        if keywords is not None:
+            return keywords
+
+    keywords = parse_keywords(keyword_chain(model).invoke({"question": query})['text'])
+
+    # An answer without quoted keywords, e.g. a refusal, is not cached so it is asked again next time
+    if use_cache and keywords:
+        cache_keywords(model, query, keywords)
+    return keywords
+
+
+async def agenerate_llm_keywords(model, query, use_cache=True):
+    """Async version of generate_llm_keywords using the async model API; the cache is used from a worker thread."""
+    if use_cache:
+        keywords = await asyncio.to_thread(cached_keywords, model, query)
+        if keywords is not None:
+            return keywords
+
+    keywords = parse_keywords((await keyword_chain(model).ainvoke({"question": query}))['text'])
+
+    if use_cache and keywords:
+        await asyncio.to_thread(cache_keywords, model, query, keywords)
+    return keywords
+
+
+def _local_keywords(query):
+    try:
+        return extract_keywords(query)
+    except (ImportError, OSError) as error:
+        print(f'Local keyword extraction is unavailable: {error}')
+        return []
+
+
+def generate_keywords(model, query, use_cache=True, mode=None):
+    """
+    Generate keyword variants of a query with the local extractor or the language model.
+
+    In "local" mode the language model is only asked when the local extractor finds
+    no keywords or its spaCy models are not installed.
+
+    Args:
+        model (LLM): Language model to generate keywords for searching; may be None
+            in "local" mode if no fallback is wanted.
+        query (str): User query or prompt to guide the search.
+        use_cache (bool): Use the keyword cache for language model answers.
+        mode (str): "llm" or "local"; None uses the mode chosen with set_keyword_mode.
+
+    Returns:
+        list: The generated keywords.
+    """
+    mode = mode or _keyword_mode
+    _check_keyword_mode(mode)
+    if mode == "local":
+        keywords = _local_keywords(query)
+        if keywords or model is None:
+            return keywords
+    return generate_llm_keywords(model, query, use_cache=use_cache)
+
+
+async def agenerate_keywords(model, query, use_cache=True, mode=None):
+    """Async version of generate_keywords; the local extractor runs in a worker thread."""
+    mode = mode or _keyword_mode
+    _check_keyword_mode(mode)
+    if mode == "local":
+        keywords = await asyncio.to_thread(_local_keywords, query)
+        if keywords or model is None:
+            return keywords
+    return await agenerate_llm_keywords(model, query, use_cache=use_cache)
+
+
+def retrieve_relevant_chunks(filepath, model, query, num_chunks_to_retrieve=1, use_cache=True, keyword_mode=None):
+    """
+    Retrieve relevant chunks from a file by searching for keywords generated from the query.
 
     Args:
         filepath (str): Path to the file containing pre-processed chunks.
         model (LLM): Language model to generate keywords for searching.
         query (str): User query or prompt to guide the search.
         num_chunks_to_retrieve (int): Number of chunks to retrieve for each keyword.
+        use_cache (bool): Reuse keywords generated for the same query by the same model.
+        keyword_mode (str): "llm" or "local" keyword generation; None uses the global mode.
 
     Returns:
-        list: A list of chunks relevant to the query.
+        list: A list of distinct chunks relevant to the query, best matches first.
     """
-    # Create prompt and chain
-    prompt = PromptTemplate.from_template(template)
-    llm_chain = LLMChain(prompt=prompt, llm=model)
+    keywords = generate_keywords(model, query, use_cache=use_cache, mode=keyword_mode)
 
-    # Generate keywords from the query
-    answers = llm_chain.invoke({"question": query})['text']
-    keywords = re.findall(r'"([^"]*)"', answers)
+    # Search for relevant chunks using all generated keywords at once
+    keywords = [keyword.lower() for keyword in keywords]
+    results = retrieve_chunks_many(filepath, keywords, num_chunks_to_retrieve=num_chunks_to_retrieve)
+    return results["fused"]
 
-    # Search for relevant chunks using the generated keywords
-    results = []
-    for keyword in keywords:
-        keyword = keyword.lower()
-        relevant_chunks = retrieve_chunks(filepath=filepath, query=keyword, num_chunks_to_retrieve=num_chunks_to_retrieve)
-        results.extend(relevant_chunks)
 
-    return results
+async def aretrieve_relevant_chunks(filepath, model, query, num_chunks_to_retrieve=1, use_cache=True,
+                                    keyword_mode=None):
+    """
+    Async version of retrieve_relevant_chunks.
+
+    Keywords are generated with the async model API and the search over all of them
+    runs in a worker thread, so concurrent questions never block the event loop.
+    """
+    keywords = await agenerate_keywords(model, query, use_cache=use_cache, mode=keyword_mode)
+
+    keywords = [keyword.lower() for keyword in keywords]
+    results = await asyncio.to_thread(
+        retrieve_chunks_many, filepath, keywords, num_chunks_to_retrieve=num_chunks_to_retrieve
+    )
+    return results["fused"]
 
 
 if __name__ == '__main__':
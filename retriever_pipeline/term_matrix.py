@@ -0,0 +1,109 @@
+from retriever_pipeline.processing_chunks import generate_ngrams, format_many_results, BM25_K1, BM25_B, RANKERS
+
+
+def _require_scipy():
+    """numpy and scipy.sparse, imported on first use since the matrix backend is optional."""
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError:
+        raise ImportError("The term matrix backend requires numpy and scipy: pip install numpy scipy") from None
+    return np, sparse
+
+
+def build_term_matrix(index: dict) -> dict:
+    """
+    Build sparse (num_chunks, num_terms) matrices from an inverted index.
+
+    A query is encoded as a binary column over the vocabulary, so scoring all chunks
+    is a single sparse matrix-vector product and a batch of queries a matrix-matrix one.
+
+    Returns:
+        dict: The n-gram order, the vocabulary (n-gram -> column) and CSR matrices with
+        raw "counts", their "binary" presence and precomputed "bm25" and "tfidf" term weights.
+    """
+    np, sparse = _require_scipy()
+    num_chunks = index["num_chunks"]
+    vocabulary = {}
+    rows, cols, counts, dfs = [], [], [], []
+    for col, (ng, chunk_counts) in enumerate(index["postings"].items()):
+        vocabulary[ng] = col
+        rows.extend(chunk_counts.keys())
+        cols.extend([col] * len(chunk_counts))
+        counts.extend(chunk_counts.values())
+        dfs.extend([len(chunk_counts)] * len(chunk_counts))
+
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.float64)
+    dfs = np.asarray(dfs, dtype=np.float64)
+
+    chunk_lengths = np.asarray(index["chunk_lengths"], dtype=np.float64)
+    avg_chunk_length = index["avg_chunk_length"]
+    norm = 1 - BM25_B + BM25_B * chunk_lengths[rows] / avg_chunk_length if avg_chunk_length else 1.0
+    bm25 = np.log(1 + (num_chunks - dfs + 0.5) / (dfs + 0.5)) * counts * (BM25_K1 + 1) / (counts + BM25_K1 * norm)
+    tfidf = counts * np.log(num_chunks / dfs)
+
+    shape = (num_chunks, len(vocabulary))
+    return {
+        "n": index["n"],
+        "vocabulary": vocabulary,
+        "counts": sparse.csr_matrix((counts, (rows, cols)), shape=shape),
+        "binary": sparse.csr_matrix((np.ones_like(counts), (rows, cols)), shape=shape),
+        "bm25": sparse.csr_matrix((bm25, (rows, cols)), shape=shape),
+        "tfidf": sparse.csr_matrix((tfidf, (rows, cols)), shape=shape),
+    }
+
+
+def queries_to_matrix(matrix: dict, queries: list[str]):
+    """Encode queries as a binary CSR matrix of shape (num_terms, num_queries); unknown n-grams are dropped."""
+    np, sparse = _require_scipy()
+    vocabulary = matrix["vocabulary"]
+    rows, cols = [], []
+    for query_id, query in enumerate(queries):
+        for ng in set(generate_ngrams(query, matrix["n"])):
+            col = vocabulary.get(ng)
+            if col is not None:
+                rows.append(col)
+                cols.append(query_id)
+    data = np.ones(len(rows), dtype=np.float64)
+    return sparse.csr_matrix((data, (rows, cols)), shape=(len(vocabulary), len(queries)))
+
+
+def rank_matrix_batch(matrix: dict, queries: list[str], top_k: int = 3, ranker: str = "presence") -> list[list[int]]:
+    """
+    Rank chunk ids for a batch of queries with sparse matrix products.
+
+    Rankings match search_index: "presence" orders by (presence_score, intersection_size),
+    the other rankers by their summed weights, ties in chunk order.
+    """
+    if ranker not in RANKERS:
+        raise ValueError(f"Unknown ranker: {ranker}. Expected one of {RANKERS}")
+    np, _ = _require_scipy()
+    query_matrix = queries_to_matrix(matrix, queries)
+    intersection = (matrix["counts"] @ query_matrix).toarray()
+    weights = matrix["binary"] if ranker == "presence" else matrix[ranker]
+    scores = (weights @ query_matrix).toarray()
+
+    rankings = []
+    for query_id in range(len(queries)):
+        chunk_ids = np.flatnonzero(intersection[:, query_id])
+        if ranker == "presence":
+            order = np.lexsort((chunk_ids, -intersection[chunk_ids, query_id], -scores[chunk_ids, query_id]))
+        else:
+            order = np.lexsort((chunk_ids, -scores[chunk_ids, query_id]))
+        rankings.append(chunk_ids[order[:top_k]].tolist())
+    return rankings
+
+
+def search_matrix(chunks: list, matrix: dict, query: str, top_k: int = 3, ranker: str = "presence") -> list:
+    """Find the top-k most relevant chunks for one query using the term-document matrix."""
+    ranked = rank_matrix_batch(matrix, [query], top_k=top_k, ranker=ranker)[0]
+    return [chunks[i].page_content for i in ranked]
+
+
+def search_matrix_many(chunks: list, matrix: dict, queries: list[str], top_k: int = 3,
+                       ranker: str = "presence") -> dict:
+    """Search a batch of queries at once; returns the same structure as search_many."""
+    per_query_ids = rank_matrix_batch(matrix, queries, top_k=top_k, ranker=ranker)
+    return format_many_results(chunks, per_query_ids)
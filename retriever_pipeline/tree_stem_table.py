@@ -0,0 +1,1029 @@
+# Generated by python -m retriever_pipeline.compile_tree_stem from tree_stem_reference.decision_tree.
+# Do not edit by hand.
+
+
+def _column(values):
+    return tuple(int(value) for value in values.split())
+
+
+NUM_NODES = 5025
+
+FEATURE = _column("""
+1 0 1 1 1 0 2 3 3 2 -1 -1 -1 0 2 -1 4 4 -1 3 4 5 -1 5 -1
+-1 -1 -1 -1 -1 1 0 0 1 -1 2 -1 -1 2 2 2 -1 2 3 -1 -1 -1 3 3 -1
+-1 -1 -1 0 0 -1 -1 0 0 2 -1 -1 -1 0 -1 2 -1 -1 9 2 -1 2 0 2 -1
+2 -1 -1 2 3 -1 -1 -1 2 0 -1 0 -1 -1 -1 7 -1 2 6 -1 -1 -1 2 2 2
+3 3 2 -1 3 -1 3 4 -1 4 -1 4 -1 -1 3 -1 -1 4 4 4 -1 4 -1 -1 -1
+-1 2 -1 -1 -1 3 4 4 3 -1 4 -1 4 -1 4 -1 -1 -1 3 3 -1 4 3 4 -1
+-1 -1 -1 4 4 5 5 -1 -1 4 4 4 -1 4 -1 -1 -1 -1 -1 -1 3 4 4 -1 1
+-1 5 6 4 6 7 -1 -1 -1 -1 5 5 -1 -1 -1 -1 3 4 -1 -1 -1 -1 -1 1 2
+1 1 7 0 -1 0 -1 -1 2 -1 2 -1 -1 2 -1 2 3 3 4 -1 -1 -1 -1 -1 1
+0 -1 0 -1 -1 0 0 3 1 -1 3 3 -1 2 -1 -1 2 -1 2 5 -1 -1 -1 3 2
+2 1 -1 -1 -1 1 -1 -1 1 -1 2 2 2 -1 -1 3 9 2 -1 -1 -1 -1 2 2 3
+2 2 -1 2 -1 -1 -1 -1 -1 -1 3 3 3 1 2 -1 2 -1 -1 -1 3 2 2 -1 2
+-1 2 1 -1 -1 -1 4 -1 4 -1 -1 3 -1 2 -1 2 -1 -1 1 2 -1 2 -1 -1 -1
+2 1 -1 3 3 -1 2 9 -1 -1 -1 -1 2 1 4 -1 3 3 3 3 3 -1 3 1 -1
+-1 -1 -1 -1 3 -1 -1 -1 -1 2 -1 2 1 3 3 -1 -1 3 -1 -1 2 4 -1 4 -1
+-1 3 -1 3 4 4 -1 -1 -1 -1 -1 1 0 0 1 -1 2 -1 -1 1 -1 1 -1 -1 0
+-1 0 2 -1 -1 2 9 -1 6 -1 -1 0 -1 1 -1 -1 3 0 0 -1 3 3 -1 2 -1
+-1 -1 -1 3 2 -1 3 -1 -1 2 0 0 -1 2 2 2 4 -1 -1 -1 3 9 -1 -1 -1
+2 -1 -1 -1 -1 3 0 0 0 1 -1 1 -1 4 2 -1 -1 3 -1 -1 -1 2 -1 -1 1
+1 -1 -1 -1 2 0 -1 0 9 -1 -1 -1 3 -1 -1 2 3 4 4 3 -1 4 -1 -1 4
+0 -1 -1 5 -1 -1 3 -1 5 5 9 -1 5 -1 5 6 -1 -1 -1 4 5 6 -1 6 -1
+-1 5 7 -1 7 -1 -1 -1 5 5 -1 4 -1 -1 -1 -1 0 3 3 3 3 3 6 -1 4
+-1 -1 -1 3 3 4 -1 5 -1 -1 -1 4 -1 4 -1 4 -1 -1 4 3 3 3 -1 4 -1
+-1 -1 -1 4 -1 3 -1 4 3 3 -1 -1 -1 -1 4 4 4 -1 4 5 -1 -1 -1 3 7
+-1 3 -1 -1 4 -1 -1 -1 3 5 5 4 -1 -1 -1 -1 -1 -1 0 2 2 2 2 4 4
+4 -1 -1 5 -1 -1 -1 -1 4 -1 -1 3 7 -1 3 3 6 -1 -1 -1 3 -1 4 4 -1
+-1 -1 3 4 -1 4 -1 -1 3 -1 -1 2 2 2 3 2 0 0 -1 -1 -1 -1 3 4 -1
+4 -1 4 -1 -1 3 4 -1 -1 -1 2 2 2 2 -1 3 4 5 -1 4 -1 -1 3 -1 -1
+-1 -1 -1 4 9 -1 -1 3 3 -1 -1 -1 3 3 2 -1 -1 -1 2 -1 -1 3 -1 3 3
+-1 3 3 -1 -1 -1 3 -1 4 -1 -1 -1 0 3 -1 5 6 6 7 -1 4 -1 -1 4 -1
+-1 4 7 -1 7 -1 -1 -1 4 2 5 5 3 -1 -1 6 6 -1 -1 -1 -1 -1 4 4 0
+-1 5 5 5 -1 -1 -1 5 -1 -1 4 5 -1 -1 0 5 -1 -1 -1 0 -1 5 -1 -1 0
+2 3 3 3 3 -1 4 9 -1 -1 -1 4 -1 4 5 -1 -1 -1 4 4 4 -1 4 -1 4
+-1 -1 -1 4 4 4 5 5 -1 4 4 -1 -1 -1 4 4 -1 4 -1 -1 -1 -1 -1 5 4
+-1 -1 -1 4 4 5 -1 3 -1 -1 3 3 -1 -1 5 -1 -1 4 4 3 -1 3 -1 -1 5
+-1 -1 4 3 3 4 3 -1 -1 -1 -1 3 -1 -1 3 -1 -1 2 2 -1 3 -1 8 -1 2
+5 -1 -1 -1 2 -1 3 -1 4 4 4 -1 5 -1 5 -1 4 -1 -1 -1 4 4 -1 3 -1
+3 5 -1 5 -1 -1 -1 4 -1 -1 -1 1 3 2 8 -1 6 -1 -1 2 3 -1 3 5 7
+-1 -1 5 -1 -1 -1 3 0 0 0 -1 -1 -1 -1 7 -1 2 2 -1 0 0 -1 -1 -1 -1
+3 4 0 0 3 6 9 -1 -1 -1 4 5 -1 -1 -1 -1 2 -1 2 4 9 -1 -1 -1 8
+-1 6 -1 -1 3 -1 2 -1 -1 0 0 -1 -1 3 -1 2 -1 -1 1 -1 9 0 0 -1 -1
+2 2 -1 3 -1 -1 -1 4 5 -1 -1 8 3 -1 5 5 -1 -1 3 9 6 -1 -1 -1 3
+-1 -1 -1 0 1 0 0 1 3 2 -1 -1 -1 0 -1 3 -1 2 -1 -1 -1 1 2 2 2
+2 -1 3 8 -1 -1 -1 3 -1 3 4 -1 -1 -1 3 3 3 -1 3 -1 3 -1 -1 -1 3
+3 3 4 4 -1 3 3 -1 -1 -1 3 3 -1 3 -1 -1 -1 -1 -1 4 3 -1 -1 -1 3
+3 4 -1 2 -1 -1 2 2 -1 -1 4 -1 -1 3 3 2 -1 2 -1 -1 4 -1 -1 2 3
+2 3 2 -1 -1 -1 -1 2 -1 -1 2 -1 -1 4 2 2 2 4 -1 -1 5 6 -1 -1 3
+-1 2 -1 3 3 -1 3 -1 -1 2 -1 -1 3 2 3 -1 -1 3 3 -1 -1 -1 -1 4 -1
+3 3 -1 3 -1 -1 2 3 -1 -1 -1 7 2 2 3 -1 -1 5 6 6 7 6 -1 -1 -1
+-1 -1 5 6 -1 6 7 -1 -1 -1 5 6 5 -1 -1 -1 6 -1 -1 -1 6 5 8 -1 8
+-1 -1 -1 5 -1 5 3 -1 -1 2 -1 -1 0 1 3 3 5 4 6 5 -1 5 6 6 -1
+-1 -1 -1 4 -1 -1 2 2 -1 6 6 -1 -1 -1 -1 2 4 4 -1 -1 -1 -1 3 -1 2
+-1 5 5 4 4 -1 -1 -1 4 -1 -1 5 4 -1 -1 4 4 7 -1 -1 -1 -1 2 3 3
+-1 -1 3 9 2 2 0 -1 -1 -1 -1 -1 -1 3 9 3 -1 3 2 2 -1 -1 -1 -1 -1
+2 4 -1 4 -1 -1 4 -1 -1 2 2 2 2 -1 3 3 -1 3 -1 3 -1 -1 3 -1 -1
+1 4 4 4 -1 2 -1 -1 -1 3 -1 -1 0 -1 -1 8 2 2 -1 1 2 -1 -1 -1 1
+3 3 -1 -1 -1 -1 3 2 2 -1 1 -1 -1 -1 3 -1 2 -1 -1 2 2 2 1 5 -1
+2 -1 8 -1 -1 0 -1 -1 -1 3 -1 2 2 -1 -1 -1 2 -1 -1 0 1 -1 0 1 4
+-1 -1 -1 -1 2 2 2 2 1 -1 2 -1 -1 3 1 -1 3 -1 -1 -1 1 3 -1 3 4
+4 -1 1 2 -1 -1 -1 -1 -1 -1 1 -1 -1 2 1 9 1 1 -1 -1 -1 3 3 -1 -1
+2 -1 -1 2 3 3 3 -1 3 -1 3 -1 -1 -1 3 3 4 4 -1 -1 3 -1 3 -1 -1
+3 -1 3 -1 -1 -1 5 5 6 -1 -1 -1 4 4 -1 -1 -1 1 2 1 3 3 -1 3 9
+-1 -1 -1 -1 3 3 9 3 -1 3 2 -1 -1 -1 -1 2 -1 3 9 -1 2 -1 -1 -1 3
+9 4 -1 -1 -1 -1 2 2 1 -1 3 3 3 -1 -1 -1 -1 3 1 -1 3 -1 -1 -1 -1
+3 9 2 -1 -1 -1 3 -1 1 2 4 4 -1 -1 -1 -1 -1 0 0 2 2 3 4 1 1
+2 -1 -1 4 -1 -1 4 3 -1 -1 5 4 5 5 -1 -1 -1 -1 3 -1 -1 3 1 -1 -1
+1 5 5 -1 4 5 6 -1 6 -1 -1 -1 -1 -1 -1 0 1 0 3 3 -1 2 -1 -1 -1
+-1 1 1 -1 3 3 2 -1 3 -1 -1 4 4 -1 3 -1 -1 -1 -1 2 1 1 3 -1 -1
+-1 -1 2 3 1 -1 -1 3 2 -1 -1 1 -1 -1 1 -1 -1 -1 5 0 1 1 1 -1 1
+-1 -1 -1 1 3 3 4 4 3 -1 -1 -1 4 -1 4 1 -1 -1 -1 3 -1 4 4 -1 -1
+3 -1 -1 -1 0 -1 -1 -1 8 5 6 4 4 -1 7 7 8 7 -1 -1 -1 -1 -1 -1 6
+6 9 -1 7 6 -1 -1 7 8 -1 -1 -1 1 3 7 6 -1 -1 -1 -1 -1 7 -1 -1 0
+1 1 -1 4 -1 -1 -1 -1 7 6 9 -1 9 -1 -1 -1 6 -1 6 -1 5 -1 -1 2 2
+1 1 1 0 0 -1 1 6 -1 3 3 -1 -1 -1 1 -1 -1 -1 3 -1 -1 3 3 5 7
+-1 -1 -1 2 -1 -1 0 -1 -1 1 3 1 2 2 -1 3 3 -1 -1 -1 2 -1 2 -1 2
+-1 2 -1 -1 3 4 5 4 -1 -1 -1 -1 2 2 2 3 -1 -1 -1 3 3 -1 -1 -1 3
+4 4 4 -1 -1 -1 -1 2 2 4 4 5 -1 -1 -1 -1 -1 -1 3 4 1 2 -1 4 -1
+-1 -1 4 3 -1 -1 -1 3 4 4 -1 4 5 -1 5 -1 -1 1 -1 4 6 -1 6 -1 -1
+-1 -1 1 2 -1 -1 3 2 -1 4 -1 -1 3 4 -1 4 -1 -1 -1 2 2 2 -1 -1 1
+0 -1 -1 1 -1 0 -1 -1 1 -1 -1 1 1 -1 3 3 -1 7 -1 4 3 3 -1 -1 5
+-1 -1 -1 -1 0 1 1 -1 1 -1 -1 0 -1 -1 -1 1 1 1 2 -1 0 -1 -1 1 -1
+1 -1 -1 1 1 1 -1 -1 -1 -1 1 1 2 0 -1 -1 3 4 3 -1 -1 -1 -1 2 2
+1 4 -1 -1 -1 3 3 2 -1 3 -1 -1 -1 2 2 -1 -1 4 -1 4 -1 -1 3 -1 3
+-1 -1 1 2 -1 3 -1 -1 0 -1 -1 2 3 1 3 1 1 -1 2 2 1 -1 -1 -1 2
+-1 0 -1 -1 3 3 -1 -1 2 -1 2 5 -1 -1 -1 3 2 -1 1 -1 -1 1 1 -1 1
+-1 -1 3 -1 -1 2 6 9 -1 -1 -1 2 3 -1 2 -1 3 -1 -1 4 7 -1 4 -1 5
+-1 6 -1 -1 3 -1 3 -1 -1 3 6 1 1 -1 1 -1 -1 1 4 5 5 6 5 -1 -1
+-1 -1 -1 4 5 -1 5 6 -1 -1 -1 4 2 -1 5 4 -1 -1 -1 5 -1 -1 -1 5 4
+7 -1 7 -1 -1 -1 4 1 -1 -1 4 4 -1 -1 1 1 -1 -1 -1 1 1 -1 3 3 1
+-1 -1 -1 -1 3 1 -1 1 -1 -1 -1 2 1 1 -1 9 -1 6 -1 -1 1 3 3 -1 4
+7 4 -1 -1 -1 6 5 -1 4 -1 -1 4 -1 -1 -1 0 -1 -1 1 2 1 1 -1 1 -1
+1 -1 0 -1 -1 2 2 -1 -1 -1 3 1 -1 4 1 -1 -1 3 -1 2 -1 -1 -1 7 -1
+3 -1 0 -1 -1 0 0 1 2 2 2 2 9 -1 -1 3 8 -1 -1 -1 3 -1 3 4 -1
+-1 -1 3 3 3 -1 3 -1 3 -1 -1 -1 3 3 3 4 4 -1 3 3 -1 -1 -1 3 3
+-1 3 -1 -1 -1 -1 -1 4 3 -1 -1 -1 3 3 4 -1 2 -1 -1 2 2 -1 -1 -1 3
+3 2 -1 2 -1 -1 4 -1 -1 3 2 2 3 2 -1 -1 -1 -1 2 -1 -1 2 -1 -1 2
+1 6 -1 3 -1 3 -1 3 -1 -1 -1 1 7 4 -1 1 -1 -1 4 1 -1 -1 -1 -1 1
+4 1 -1 2 2 3 -1 3 3 -1 -1 3 -1 -1 2 -1 0 -1 3 -1 -1 -1 6 7 8
+1 -1 -1 5 7 -1 -1 5 -1 -1 5 8 -1 8 -1 -1 -1 2 5 -1 5 2 1 -1 -1
+5 6 6 6 -1 -1 -1 6 -1 -1 6 5 -1 -1 -1 6 -1 -1 2 3 -1 -1 -1 0 -1
+0 2 1 2 -1 2 2 4 -1 -1 -1 -1 1 1 -1 -1 -1 2 3 -1 3 -1 -1 2 3
+3 -1 3 9 -1 -1 -1 -1 2 1 -1 -1 -1 -1 1 1 0 1 1 -1 3 6 4 -1 -1
+-1 -1 1 2 3 5 -1 2 2 -1 3 -1 3 -1 -1 -1 -1 8 -1 -1 -1 1 -1 -1 1
+-1 0 2 -1 2 2 1 -1 3 -1 4 -1 -1 -1 -1 3 1 0 3 -1 3 -1 -1 2 3
+-1 -1 2 -1 -1 4 5 2 -1 -1 -1 2 -1 2 -1 2 -1 -1 0 3 2 -1 -1 3 1
+-1 -1 3 -1 3 -1 3 -1 -1 2 2 2 2 -1 1 -1 -1 -1 1 2 -1 -1 -1 -1 2
+3 2 1 2 -1 2 -1 -1 0 -1 2 -1 -1 6 7 -1 -1 3 -1 3 3 -1 3 -1 -1
+-1 4 2 -1 5 3 6 -1 -1 -1 4 -1 -1 3 -1 -1 1 2 2 3 3 0 -1 -1 4
+-1 4 -1 -1 7 9 -1 -1 0 5 -1 -1 -1 2 -1 -1 -1 4 5 -1 -1 0 -1 -1 1
+4 5 6 6 7 0 -1 0 -1 -1 5 -1 8 -1 -1 6 6 5 -1 9 -1 -1 6 -1 0
+-1 -1 5 -1 6 -1 -1 5 -1 9 -1 3 -1 8 7 -1 7 -1 7 9 -1 -1 -1 -1 0
+0 -1 0 -1 -1 2 5 5 5 -1 6 -1 6 -1 -1 5 6 -1 6 -1 7 -1 -1 5 6
+5 6 8 -1 6 -1 -1 6 -1 -1 6 -1 7 -1 7 -1 -1 5 6 -1 6 5 8 7 -1
+-1 -1 5 -1 -1 -1 6 6 6 -1 5 -1 -1 -1 3 -1 -1 6 6 7 -1 -1 6 -1 7
+6 5 -1 -1 5 8 -1 -1 -1 7 -1 -1 5 6 6 -1 -1 -1 -1 3 -1 -1 3 -1 3
+-1 -1 8 7 0 0 -1 0 0 0 -1 -1 -1 -1 9 3 2 2 2 2 -1 -1 -1 3 -1
+-1 -1 2 3 2 2 4 -1 4 -1 -1 2 -1 -1 2 -1 2 2 -1 4 -1 -1 -1 3 3
+3 4 4 -1 3 7 -1 4 -1 -1 -1 4 -1 4 -1 4 5 5 -1 -1 -1 -1 3 -1 4
+4 -1 -1 2 -1 2 3 -1 -1 -1 2 4 4 -1 -1 -1 -1 2 4 2 2 3 -1 4 -1
+-1 -1 4 -1 -1 -1 2 -1 2 -1 2 -1 -1 4 -1 3 -1 3 -1 -1 3 3 4 5 -1
+-1 -1 4 4 -1 -1 3 -1 -1 3 5 5 4 4 -1 4 5 -1 -1 2 4 4 4 -1 -1
+5 5 -1 -1 -1 5 -1 3 4 -1 -1 -1 -1 2 5 -1 -1 -1 7 6 -1 -1 6 6 5
+-1 -1 7 -1 -1 -1 4 -1 4 -1 4 -1 2 -1 -1 2 2 3 -1 -1 4 -1 4 -1 -1
+-1 9 9 0 -1 3 -1 3 3 -1 4 4 -1 -1 -1 3 -1 3 -1 2 3 -1 -1 -1 9
+5 -1 -1 6 -1 -1 6 7 5 3 -1 -1 5 -1 -1 4 5 4 -1 -1 -1 -1 4 3 -1
+3 -1 -1 4 0 -1 -1 3 -1 -1 4 4 3 5 0 -1 5 4 -1 3 -1 -1 4 -1 -1
+2 4 4 -1 -1 -1 -1 3 4 3 0 -1 3 3 4 -1 -1 5 5 -1 -1 -1 2 6 6
+-1 7 4 4 4 5 -1 -1 -1 -1 -1 -1 -1 3 3 -1 -1 -1 -1 7 5 0 -1 5 5
+7 6 -1 6 -1 -1 -1 6 -1 6 6 -1 6 -1 6 -1 -1 -1 5 5 5 8 -1 -1 6
+-1 -1 6 6 -1 -1 -1 6 3 5 -1 -1 5 6 7 -1 -1 -1 -1 5 -1 -1 9 9 -1
+-1 -1 8 5 7 9 8 8 -1 9 9 -1 -1 -1 -1 9 -1 -1 -1 6 3 -1 -1 5 -1
+-1 9 -1 -1 5 6 7 7 -1 -1 6 -1 -1 -1 5 4 6 5 6 6 -1 -1 -1 -1 6
+7 -1 7 -1 -1 5 -1 -1 -1 6 4 -1 -1 6 -1 -1 6 5 3 4 4 -1 5 5 -1
+-1 -1 3 -1 5 -1 2 -1 -1 -1 8 5 -1 -1 7 2 7 -1 -1 7 -1 -1 5 -1 -1
+3 4 5 5 5 -1 -1 -1 8 -1 -1 4 5 4 3 -1 3 3 -1 4 -1 3 -1 -1 3
+0 -1 -1 -1 4 3 0 -1 -1 5 5 6 6 9 -1 -1 9 -1 -1 0 -1 -1 -1 9 -1
+0 -1 2 -1 -1 3 5 5 -1 -1 0 -1 -1 2 0 -1 3 -1 -1 0 -1 5 6 -1 5
+-1 7 -1 -1 2 7 6 6 -1 7 -1 -1 -1 6 -1 -1 -1 5 6 6 6 2 4 -1 6
+-1 -1 2 7 -1 7 -1 -1 -1 0 -1 3 -1 3 2 -1 -1 -1 8 0 -1 -1 -1 -1 4
+4 4 5 -1 6 -1 -1 -1 5 -1 -1 6 5 -1 -1 -1 5 5 7 6 -1 -1 0 -1 -1
+6 -1 5 5 -1 6 -1 -1 -1 5 -1 -1 3 -1 0 -1 -1 4 6 0 0 -1 0 -1 -1
+3 3 -1 3 4 5 -1 6 -1 -1 3 3 4 4 -1 -1 3 -1 -1 2 -1 -1 2 6 -1
+3 -1 4 -1 -1 2 -1 3 2 -1 -1 -1 2 -1 3 2 3 -1 4 -1 -1 -1 4 -1 7
+-1 -1 3 -1 -1 9 3 3 0 -1 -1 7 9 8 -1 -1 -1 7 4 8 -1 8 9 -1 -1
+-1 5 -1 -1 -1 3 0 -1 3 -1 5 5 6 -1 -1 -1 -1 0 -1 3 2 -1 3 2 3
+-1 -1 -1 -1 -1 8 8 -1 -1 7 -1 7 5 -1 -1 4 -1 -1 3 3 0 -1 4 5 5
+3 -1 -1 -1 -1 -1 3 3 3 4 0 -1 -1 -1 4 -1 -1 4 5 5 3 4 -1 -1 0
+-1 5 -1 5 -1 -1 4 0 -1 -1 -1 5 5 0 -1 3 -1 -1 2 -1 -1 3 3 -1 -1
+-1 3 5 3 -1 0 -1 -1 5 0 -1 5 -1 3 4 -1 -1 -1 3 -1 -1 4 -1 5 0
+-1 -1 6 -1 -1 0 -1 2 -1 -1 4 3 7 4 2 5 5 4 5 -1 -1 -1 -1 4 -1
+-1 5 5 6 -1 -1 5 -1 -1 -1 -1 8 5 5 -1 -1 5 6 -1 -1 -1 -1 3 0 -1
+-1 3 -1 -1 4 4 5 2 -1 -1 6 -1 -1 5 5 5 5 -1 5 -1 -1 -1 -1 -1 2
+3 5 -1 -1 2 -1 -1 5 5 5 -1 6 -1 6 -1 6 -1 -1 5 -1 -1 6 -1 6 -1
+-1 1 5 2 3 4 4 3 -1 -1 4 4 4 -1 -1 -1 4 -1 3 -1 -1 0 -1 0 0
+3 -1 4 5 -1 5 6 -1 6 -1 -1 -1 -1 0 0 -1 -1 -1 3 -1 4 5 -1 5 6
+-1 6 -1 -1 -1 -1 0 0 0 2 -1 0 -1 -1 3 3 3 2 -1 3 -1 -1 3 -1 3
+3 -1 -1 -1 4 4 -1 3 -1 -1 -1 -1 -1 3 3 3 -1 -1 4 3 -1 4 -1 3 -1
+-1 -1 4 4 -1 -1 -1 0 2 0 0 -1 3 3 5 5 4 -1 -1 -1 -1 2 2 0 3
+3 3 5 -1 -1 -1 -1 -1 -1 2 2 3 -1 -1 -1 3 3 -1 -1 -1 2 0 -1 -1 -1
+3 4 2 4 -1 -1 2 -1 4 -1 -1 4 2 -1 -1 -1 2 3 -1 0 -1 -1 3 4 -1
+4 4 5 -1 -1 4 6 -1 6 -1 -1 -1 -1 3 -1 3 0 -1 2 -1 -1 -1 0 -1 0
+0 2 -1 3 -1 -1 -1 -1 3 2 9 2 3 2 -1 0 0 -1 -1 -1 3 0 0 -1 -1
+-1 -1 0 0 -1 3 3 -1 -1 -1 0 0 -1 -1 -1 3 7 0 -1 0 -1 -1 -1 3 -1
+2 -1 -1 2 0 0 -1 3 2 2 -1 -1 3 5 -1 -1 -1 0 2 2 -1 -1 -1 3 -1
+-1 0 0 -1 3 -1 -1 -1 3 0 0 -1 -1 -1 0 0 4 -1 -1 -1 0 -1 -1 3 2
+2 -1 -1 2 9 0 -1 0 -1 -1 0 0 -1 -1 -1 2 -1 2 -1 -1 2 3 0 0 -1
+-1 -1 3 -1 -1 2 2 -1 4 -1 -1 3 -1 2 -1 -1 0 2 2 3 2 3 3 -1 -1
+-1 4 4 -1 3 -1 -1 -1 3 4 4 2 -1 4 -1 -1 -1 4 3 -1 -1 -1 2 -1 4
+3 -1 -1 -1 2 3 -1 3 -1 -1 3 3 4 -1 4 4 -1 -1 4 -1 -1 3 -1 4 -1
+-1 -1 2 3 -1 3 4 3 -1 -1 4 4 5 -1 -1 -1 3 -1 -1 3 -1 -1 3 3 3
+-1 4 4 3 -1 -1 4 -1 4 -1 4 4 -1 3 -1 -1 -1 -1 3 3 -1 -1 -1 4 3
+-1 -1 4 -1 -1 2 3 -1 3 -1 -1 -1 4 4 3 7 2 -1 0 -1 -1 7 -1 -1 0
+2 0 0 -1 2 0 2 -1 -1 -1 2 0 3 -1 6 -1 -1 2 -1 -1 3 -1 -1 -1 -1
+2 5 -1 -1 0 2 -1 2 2 -1 -1 2 -1 4 4 -1 -1 -1 -1 7 8 9 2 -1 -1
+6 8 -1 -1 6 -1 6 -1 -1 6 9 -1 9 -1 9 8 7 -1 -1 -1 -1 -1 6 8 -1
+7 7 2 -1 5 -1 -1 8 8 -1 -1 -1 -1 6 2 -1 6 5 7 7 7 8 8 -1 -1
+-1 -1 3 -1 -1 7 8 -1 8 -1 -1 -1 -1 6 7 -1 -1 3 3 -1 -1 7 -1 -1 7
+7 -1 -1 -1 2 3 5 0 -1 4 -1 0 -1 0 -1 -1 3 -1 0 -1 -1 0 0 0 -1
+3 5 8 -1 -1 -1 -1 -1 3 3 3 -1 -1 5 -1 -1 -1 2 3 3 2 -1 -1 2 0
+3 -1 -1 3 -1 -1 2 4 0 -1 -1 -1 0 2 4 -1 -1 -1 -1 3 5 4 -1 -1 -1
+0 4 3 0 -1 -1 -1 -1 3 -1 -1 2 3 -1 2 -1 3 2 8 -1 0 -1 0 3 -1
+-1 -1 -1 -1 0 2 0 -1 0 -1 -1 2 2 -1 -1 -1 3 -1 2 -1 3 3 6 -1 -1
+-1 -1 0 0 1 0 0 1 1 -1 -1 -1 0 2 -1 2 -1 -1 0 -1 -1 0 2 -1 2
+0 -1 2 8 -1 -1 -1 -1 -1 0 9 0 -1 -1 -1 9 2 2 -1 -1 2 0 0 2 -1
+-1 -1 0 -1 -1 1 2 -1 1 -1 -1 0 0 0 -1 -1 -1 -1 6 -1 2 -1 2 -1 -1
+3 4 5 5 4 -1 -1 5 -1 -1 2 4 -1 6 6 -1 5 6 7 -1 7 -1 -1 -1 -1
+-1 -1 2 4 4 -1 5 5 -1 -1 -1 -1 2 -1 -1 2 2 3 4 2 -1 8 -1 4 4
+-1 -1 -1 4 5 -1 5 -1 -1 2 -1 -1 1 3 -1 -1 4 4 3 -1 2 -1 -1 -1 3
+3 4 -1 5 -1 5 -1 -1 4 -1 -1 4 -1 -1 1 1 -1 1 -1 -1 2 3 3 5 -1
+-1 1 -1 -1 2 -1 3 -1 -1 1 2 -1 -1 2 4 -1 -1 2 -1 -1 2 1 -1 3 4
+-1 4 4 -1 -1 -1 -1 3 3 3 -1 -1 -1 4 -1 -1 1 0 0 2 2 -1 2 8 -1
+-1 -1 -1 0 -1 0 -1 -1 9 2 2 2 2 -1 -1 2 -1 3 2 2 -1 -1 -1 -1 -1
+2 -1 2 -1 3 -1 -1 2 3 2 -1 -1 4 -1 3 -1 -1 -1 1 1 0 2 2 1 -1
+-1 3 2 0 6 7 -1 -1 3 3 -1 -1 -1 -1 -1 9 0 -1 -1 -1 1 -1 2 -1 2
+2 5 8 -1 -1 -1 -1 -1 2 0 0 0 -1 -1 -1 3 -1 2 2 -1 -1 -1 2 1 1
+-1 -1 9 -1 6 -1 -1 0 1 -1 1 -1 -1 2 2 -1 5 -1 -1 3 -1 -1 0 0 -1
+-1 2 9 0 2 2 -1 -1 -1 0 -1 -1 -1 2 3 -1 -1 2 2 -1 2 -1 -1 -1 0
+0 -1 -1 0 2 2 2 0 -1 0 -1 -1 -1 8 0 -1 0 -1 -1 -1 3 0 3 3 3
+3 -1 2 4 -1 4 -1 -1 -1 3 -1 -1 3 3 -1 -1 2 -1 4 -1 4 -1 -1 2 -1
+2 3 4 -1 -1 -1 2 -1 -1 3 0 0 -1 -1 3 3 -1 4 -1 4 -1 3 -1 -1 3
+-1 -1 0 0 -1 -1 2 -1 2 4 -1 4 -1 -1 -1 3 -1 -1 0 0 -1 -1 1 -1 -1
+""")
+
+THRESHOLD = _column("""
+21 12 17 16 3 11 3 23 1 2 0 0 0 3 2 0 27 9 0 28 12 10 0 20 0
+0 0 0 0 0 2 3 2 1 0 12 0 0 27 21 15 0 16 19 0 0 0 20 12 0
+0 0 0 6 5 0 0 8 7 9 0 0 0 10 0 8 0 0 0 8 0 16 6 11 0
+12 0 0 11 9 0 0 0 20 8 0 10 0 0 0 0 0 20 0 0 0 0 20 18 8
+27 26 6 0 16 0 19 1 0 6 0 8 0 0 22 0 0 30 14 10 0 11 0 0 0
+0 6 0 0 0 15 13 10 11 0 1 0 6 0 8 0 0 0 12 5 0 20 9 18 0
+0 0 0 30 27 10 1 0 0 23 22 18 0 19 0 0 0 0 0 0 27 19 10 0 2
+0 30 32 18 1 27 0 0 0 0 19 17 0 0 0 0 16 23 0 0 0 0 0 15 30
+6 5 0 10 0 11 0 0 17 0 20 0 0 18 0 19 24 3 1 0 0 0 0 0 8
+7 0 8 0 0 3 2 13 11 0 10 1 0 19 0 0 3 0 15 21 0 0 0 18 11
+9 10 0 0 0 11 0 0 11 0 13 10 1 0 0 26 0 11 0 0 0 0 27 23 32
+22 18 0 19 0 0 0 0 0 0 13 10 1 11 21 0 24 0 0 0 6 26 13 0 15
+0 20 11 0 0 0 11 0 15 0 0 8 0 13 0 15 0 0 11 21 0 24 0 0 0
+9 11 0 19 18 0 5 25 0 0 0 0 15 12 10 0 30 27 23 22 18 0 19 11 0
+0 0 0 0 28 0 0 0 0 21 0 27 11 21 15 0 0 23 0 0 26 14 0 15 0
+0 14 0 30 18 9 0 0 0 0 0 14 6 5 11 0 11 0 0 11 0 12 0 0 8
+0 10 3 0 0 20 0 0 0 0 0 11 0 9 0 0 13 11 9 0 10 1 0 19 0
+0 0 0 18 11 0 15 0 0 26 11 9 0 15 10 1 34 0 0 0 26 0 0 0 0
+23 0 0 0 0 21 11 10 6 5 0 11 0 18 32 0 0 10 0 0 0 31 0 0 12
+9 0 0 0 31 9 0 11 0 0 0 0 34 0 0 1 3 22 10 2 0 1 0 0 13
+11 0 0 21 0 0 2 0 27 9 0 0 2 0 3 11 0 0 0 25 12 10 0 20 0
+0 16 24 0 25 0 0 0 23 17 0 30 0 0 0 0 11 27 21 15 9 6 22 0 23
+0 0 0 13 11 2 0 32 0 0 0 11 0 22 0 23 0 0 9 20 19 17 0 5 0
+0 0 0 11 0 16 0 23 19 17 0 0 0 0 20 12 1 0 10 19 0 0 0 25 0
+0 22 0 0 15 0 0 0 28 23 11 14 0 0 0 0 0 0 11 11 10 9 6 21 15
+2 0 0 21 0 0 0 0 5 0 0 21 0 0 13 9 33 0 0 0 20 0 16 13 0
+0 0 24 21 0 22 0 0 27 0 0 32 23 13 22 12 9 4 0 0 0 0 23 3 0
+21 0 23 0 0 27 20 0 0 0 19 17 15 14 0 20 19 18 0 18 0 0 8 0 0
+0 0 0 16 0 0 0 8 5 0 0 0 18 17 28 0 0 0 24 0 0 14 0 22 17
+0 20 18 0 0 0 33 0 10 0 0 0 10 22 0 3 23 10 3 0 6 0 0 10 0
+0 6 9 0 11 0 0 0 1 11 27 22 24 0 0 20 12 0 0 0 0 0 31 11 4
+0 21 10 9 0 0 0 23 0 0 13 22 0 0 4 32 0 0 0 4 0 15 0 0 11
+2 15 14 5 3 0 22 0 0 0 0 18 0 20 25 0 0 0 13 10 1 0 6 0 8
+0 0 0 30 27 23 10 1 0 19 17 0 0 0 22 18 0 19 0 0 0 0 0 21 31
+0 0 0 6 1 27 0 22 0 0 19 17 0 0 18 0 0 19 18 25 0 26 0 0 30
+0 0 32 25 22 23 16 0 0 0 0 26 0 0 22 0 0 12 10 0 3 0 0 0 11
+34 0 0 0 32 0 17 0 13 10 1 0 11 0 17 0 6 0 0 0 30 14 0 18 0
+26 18 0 19 0 0 0 31 0 0 0 18 13 2 0 0 0 0 0 4 11 0 12 20 0
+0 0 32 0 0 0 8 11 6 1 0 0 0 0 0 0 26 14 0 6 3 0 0 0 0
+18 32 6 2 17 0 1 0 0 0 1 27 0 0 0 0 9 0 11 1 0 0 0 0 0
+0 0 0 0 17 0 9 0 0 6 1 0 0 32 0 5 0 0 19 0 0 6 1 0 0
+19 18 0 3 0 0 0 0 12 0 0 34 3 0 2 0 0 0 27 34 0 0 0 0 28
+0 0 0 17 7 16 14 5 1 3 0 0 0 13 0 21 0 22 0 0 0 2 15 14 5
+3 0 22 0 0 0 0 18 0 20 25 0 0 0 13 10 1 0 6 0 8 0 0 0 30
+27 23 10 1 0 19 17 0 0 0 22 18 0 19 0 0 0 0 0 21 31 0 0 0 6
+1 27 0 22 0 0 19 17 0 0 18 0 0 19 18 25 0 26 0 0 30 0 0 25 32
+21 23 16 0 0 0 0 22 0 0 26 0 0 22 27 22 8 20 0 0 0 8 0 0 2
+0 16 0 9 6 0 8 0 0 17 0 0 30 26 9 0 0 14 13 0 0 0 0 3 0
+11 1 0 9 0 0 28 20 0 0 0 23 17 16 12 0 0 3 27 22 2 3 0 0 0
+0 0 11 21 0 24 21 0 0 0 25 22 12 0 0 0 14 0 0 0 3 2 9 0 11
+0 0 0 2 0 11 9 0 0 17 0 0 14 11 8 1 22 3 29 15 0 20 14 12 0
+0 0 0 2 0 0 19 17 0 13 11 0 0 0 0 19 3 2 0 0 0 0 6 0 17
+0 6 1 25 7 0 0 0 17 0 0 8 29 0 0 26 16 13 0 0 0 0 18 12 11
+0 0 32 0 17 15 13 0 0 0 0 0 0 23 0 11 0 21 24 22 0 0 0 0 0
+24 17 0 25 0 0 1 0 0 18 11 3 2 0 20 10 0 11 0 18 0 0 32 0 0
+12 17 14 1 0 9 0 0 0 18 0 0 13 0 0 0 17 15 0 15 16 0 0 0 15
+19 18 0 0 0 0 26 17 16 0 15 0 0 0 31 0 15 0 0 27 24 22 16 18 0
+20 0 1 0 0 13 0 0 0 9 0 26 25 0 0 0 30 0 0 16 18 0 15 19 0
+0 0 0 0 14 10 3 2 9 0 1 0 0 20 16 0 6 0 0 0 20 6 0 19 3
+2 0 11 9 0 0 0 0 0 0 8 0 0 18 15 0 11 9 0 0 0 32 0 0 0
+15 0 0 15 13 10 1 0 6 0 8 0 0 0 30 22 10 1 0 0 18 0 19 0 0
+23 0 24 0 0 0 32 1 27 0 0 0 18 17 0 0 0 13 24 9 27 9 0 12 0
+0 0 0 0 21 11 0 6 0 8 21 0 0 0 0 21 0 20 1 0 22 0 0 0 22
+0 11 0 0 0 0 33 28 11 0 20 11 0 0 0 0 0 11 11 0 6 0 0 0 0
+18 30 19 0 0 0 19 0 20 25 18 0 0 0 0 0 0 25 23 7 6 3 23 17 14
+1 0 0 1 0 0 18 1 0 0 30 19 14 12 0 0 0 0 2 0 0 2 14 0 0
+17 27 9 0 31 12 10 0 20 0 0 0 0 0 0 19 14 18 13 11 0 3 0 0 0
+0 16 15 0 27 21 1 0 7 0 0 20 12 0 23 0 0 0 0 1 18 17 7 0 0
+0 0 3 11 17 0 0 13 2 0 0 17 0 0 20 0 0 0 22 19 16 15 11 0 14
+0 0 0 18 27 17 6 1 9 0 0 0 8 0 27 17 0 0 0 21 0 9 5 0 0
+22 0 0 0 18 0 0 0 23 23 1 11 9 0 27 22 2 3 0 0 0 0 0 0 31
+11 0 0 21 10 0 0 23 21 0 0 0 17 17 22 12 0 0 0 0 0 14 0 0 20
+19 16 0 8 0 0 0 0 3 6 9 0 11 0 0 0 4 0 11 0 23 0 0 19 18
+15 14 10 19 18 0 3 1 0 17 14 0 0 0 5 0 0 0 32 0 0 8 6 0 1
+0 0 0 17 0 0 19 0 0 17 21 16 11 10 0 12 9 0 0 0 12 0 13 0 14
+0 15 0 0 2 15 1 3 0 0 0 0 11 10 8 14 0 0 0 12 9 0 0 0 11
+15 10 6 0 0 0 0 14 13 9 6 32 0 0 0 0 0 0 23 21 16 11 0 3 0
+0 0 22 22 0 0 0 24 27 9 0 12 5 0 20 0 0 16 0 16 24 0 25 0 0
+0 0 16 11 0 0 31 11 0 20 0 0 33 22 0 23 0 0 0 13 10 8 0 0 18
+20 0 0 19 0 19 0 0 19 0 0 5 3 0 30 3 0 0 0 34 14 12 0 0 34
+0 0 0 0 19 16 11 0 15 0 0 18 0 0 0 14 6 1 27 0 22 0 0 3 0
+5 0 0 11 10 9 0 0 0 0 17 15 30 19 0 0 21 18 17 0 0 0 0 32 23
+16 16 0 0 0 18 15 30 0 8 0 0 0 30 25 0 0 21 0 22 0 0 14 0 22
+0 0 19 32 0 14 0 0 19 0 0 18 22 15 14 14 3 0 6 5 4 0 0 0 7
+0 24 0 0 10 1 0 0 3 0 15 21 0 0 0 18 11 0 13 0 0 8 3 0 5
+0 0 19 0 0 1 0 9 0 0 0 5 11 0 2 0 14 0 0 31 0 0 1 0 0
+0 0 0 0 17 0 18 0 0 23 23 16 13 0 15 0 0 17 3 26 22 2 3 0 0
+0 0 0 11 21 0 24 21 0 0 0 31 9 0 22 12 0 0 0 14 0 0 0 3 4
+9 0 11 0 0 0 2 17 0 0 11 9 0 0 17 16 0 0 0 15 3 0 31 24 8
+0 0 0 0 32 18 0 19 0 0 0 19 16 3 0 0 0 0 0 0 17 30 3 0 30
+0 0 0 0 0 13 0 0 34 0 0 34 0 0 0 24 0 0 15 30 13 1 0 3 0
+5 0 24 0 0 27 23 0 0 0 21 3 0 16 5 0 0 10 0 31 0 0 0 0 0
+0 0 24 0 0 30 26 1 15 14 5 3 25 0 0 22 0 0 0 0 18 0 20 25 0
+0 0 13 10 1 0 6 0 8 0 0 0 30 27 23 10 1 0 19 17 0 0 0 22 18
+0 19 0 0 0 0 0 21 31 0 0 0 6 1 27 0 22 0 0 19 17 0 0 0 19
+18 25 0 26 0 0 30 0 0 32 25 21 23 16 0 0 0 0 26 0 0 22 0 0 14
+11 0 0 10 0 11 0 17 0 0 0 12 0 0 0 9 0 0 34 9 0 0 0 0 7
+22 6 0 26 17 2 0 8 6 0 0 27 0 0 19 0 28 0 9 0 0 0 3 23 0
+6 0 0 4 5 0 0 11 0 0 6 9 0 11 0 0 0 17 1 0 32 15 4 0 0
+11 21 10 9 0 0 0 23 0 0 22 12 0 0 0 14 0 0 18 12 0 0 0 28 0
+29 21 11 8 0 10 9 2 0 0 0 0 13 12 0 0 0 23 21 0 23 0 0 24 27
+9 0 12 0 0 0 0 0 33 11 0 0 0 0 18 8 32 6 3 0 2 22 32 0 0
+0 0 7 26 30 1 0 19 17 0 19 0 21 0 0 0 0 31 0 0 0 2 0 0 13
+0 31 6 0 12 9 17 0 8 0 1 0 0 0 0 13 17 32 1 0 6 0 0 5 11
+0 0 16 0 0 4 21 19 0 0 0 17 0 19 0 22 0 0 32 17 28 0 0 19 17
+0 0 20 0 23 0 24 0 0 30 17 6 1 0 17 0 0 0 17 19 0 0 0 0 15
+30 13 20 3 0 5 0 0 32 0 1 0 0 0 16 0 0 3 0 26 18 0 19 0 0
+0 21 3 0 18 31 22 0 0 0 10 0 0 31 0 0 20 30 25 3 2 32 0 0 11
+0 16 0 0 0 9 0 0 32 0 0 0 0 26 0 0 0 0 18 0 0 32 0 0 22
+1 3 23 2 3 13 0 23 0 0 2 0 0 0 0 20 10 2 0 0 0 0 13 0 27
+0 0 2 0 21 0 0 2 0 0 0 12 0 11 7 0 21 0 22 13 0 0 0 0 27
+13 0 23 0 0 30 27 9 7 0 6 0 10 0 0 12 1 0 6 0 15 0 0 21 6
+20 3 19 0 1 0 0 5 0 0 1 0 11 0 15 0 0 19 21 0 22 15 17 20 0
+0 0 16 0 0 0 22 21 19 0 20 0 0 0 28 0 0 20 6 1 0 0 8 0 20
+12 22 0 0 24 6 0 0 0 33 0 0 22 23 21 0 0 0 0 25 0 0 22 0 27
+0 0 1 22 28 13 0 23 19 18 0 0 0 0 1 6 31 18 12 2 0 0 0 1 0
+0 0 31 14 16 6 21 0 23 0 0 10 0 0 19 0 28 23 0 6 0 0 0 23 22
+17 16 6 0 16 1 0 14 0 0 0 19 0 22 0 30 18 13 0 0 0 0 18 0 7
+6 0 0 5 0 15 21 0 0 0 27 16 5 0 0 0 0 12 30 10 3 32 0 14 0
+0 0 10 0 0 0 15 0 23 0 26 0 0 3 0 20 0 33 0 0 14 6 3 22 0
+0 0 23 21 0 0 7 0 0 23 23 21 32 6 0 7 12 0 0 31 11 10 8 0 0
+13 9 0 0 0 2 0 16 12 0 0 0 0 25 14 0 0 0 3 4 0 0 11 4 22
+0 0 21 0 0 0 7 0 14 0 30 0 25 0 0 12 7 28 0 0 5 0 28 0 0
+0 3 1 27 0 1 0 17 12 0 16 5 0 0 0 22 0 23 0 12 26 0 0 0 2
+19 0 0 6 0 0 11 23 17 14 0 0 22 0 0 13 20 10 0 0 0 0 14 23 0
+28 0 0 23 27 0 0 16 0 0 14 7 6 23 27 0 5 3 0 3 0 0 6 0 0
+7 3 2 0 0 0 0 28 6 23 27 0 11 8 4 0 0 10 8 0 0 0 20 21 16
+0 20 5 3 2 9 0 0 0 0 0 0 0 17 14 0 0 0 0 22 27 27 0 9 4
+20 11 0 20 0 0 0 6 0 28 8 0 18 0 20 0 0 0 19 17 16 21 0 0 20
+0 0 8 6 0 0 0 19 16 21 0 0 21 17 6 0 0 0 0 21 0 0 3 2 0
+0 0 31 17 23 21 11 10 0 13 9 0 0 0 0 23 0 0 0 8 16 0 0 19 0
+0 14 0 0 1 3 22 2 0 0 2 0 0 0 26 5 21 11 13 9 0 0 0 0 23
+21 0 23 0 0 11 0 0 0 14 3 0 0 21 0 0 1 21 23 11 10 0 13 9 0
+0 0 16 0 13 0 15 0 0 0 23 24 0 0 3 21 2 0 0 2 0 0 25 0 0
+23 8 33 23 14 0 0 0 16 0 0 12 21 10 6 0 17 9 0 9 0 14 0 0 21
+27 0 0 0 11 13 27 0 0 12 9 10 8 0 0 0 0 0 0 27 0 0 0 0 0
+27 0 31 0 0 16 15 4 0 0 27 0 0 15 27 0 21 0 0 27 0 12 10 0 7
+0 29 0 0 31 32 9 6 0 16 0 0 0 7 0 0 0 23 23 21 11 21 11 0 3
+0 0 26 21 0 23 0 0 0 27 0 16 0 20 21 0 0 0 29 27 0 0 0 0 11
+10 9 32 0 28 0 0 0 27 0 0 20 27 0 0 0 21 4 1 3 0 0 27 0 0
+2 0 11 9 0 20 0 0 0 33 0 0 25 0 27 0 0 21 22 27 13 0 23 0 0
+31 6 0 17 15 5 0 21 0 0 11 9 18 17 0 0 8 0 0 31 0 0 14 18 0
+14 0 19 0 0 20 0 12 30 0 0 0 10 0 26 12 21 0 16 0 0 0 16 0 3
+0 0 33 0 0 23 8 6 27 0 0 3 2 3 0 0 0 28 17 21 0 23 21 0 0
+0 5 0 0 0 17 27 0 11 0 8 6 32 0 0 0 0 27 0 31 9 0 26 12 22
+0 0 0 0 0 3 2 0 0 4 0 11 11 0 0 17 0 0 22 6 27 0 26 20 5
+4 0 0 0 0 0 17 8 7 27 28 0 0 0 33 0 0 24 19 16 13 23 0 0 27
+0 6 0 8 0 0 23 27 0 0 0 22 21 27 0 9 0 0 2 0 0 13 10 0 0
+0 16 15 11 0 27 0 0 33 27 0 17 0 11 31 0 0 0 15 0 0 30 0 20 27
+0 0 21 0 0 27 0 7 0 0 30 23 22 25 17 20 17 23 4 0 0 0 0 23 0
+0 26 9 1 0 0 19 0 0 0 0 31 17 14 0 0 19 5 0 0 0 0 26 27 0
+0 31 0 0 32 31 20 9 0 0 21 0 0 33 18 14 3 0 8 0 0 0 0 0 29
+26 14 0 0 12 0 0 22 16 8 0 1 0 3 0 15 0 0 21 0 0 21 0 22 0
+0 23 22 5 3 23 1 2 0 0 16 10 9 0 0 0 20 0 2 0 0 9 0 27 11
+2 0 31 9 0 13 10 0 20 0 0 0 0 21 15 0 0 0 2 0 25 9 0 12 10
+0 20 0 0 0 0 29 11 9 1 0 4 0 0 27 22 15 1 0 9 0 0 18 0 20
+19 0 0 0 20 12 0 23 0 0 0 0 0 27 9 7 0 0 20 21 0 12 0 23 0
+0 0 13 11 0 0 0 30 14 11 5 0 21 1 11 1 3 0 0 0 0 11 7 7 17
+9 5 20 0 0 0 0 0 0 10 8 14 0 0 0 15 9 0 0 0 12 9 0 0 0
+23 21 9 7 0 0 11 0 3 0 0 23 9 0 0 0 7 27 0 9 0 0 24 9 0
+25 12 10 0 0 16 24 0 25 0 0 0 0 27 0 33 9 0 11 0 0 0 15 0 23
+19 9 0 20 0 0 0 0 18 23 0 21 14 19 0 9 5 0 0 0 15 11 9 0 0
+0 0 11 9 0 7 1 0 0 0 22 14 0 0 0 13 32 15 0 22 0 0 0 15 0
+20 0 0 32 11 5 0 15 30 27 0 0 8 2 0 0 0 9 30 26 0 0 0 17 0
+0 23 14 0 17 0 0 0 15 11 9 0 0 0 15 9 9 0 0 0 21 0 0 19 21
+17 0 0 22 0 5 0 15 0 0 15 4 0 0 0 25 0 28 0 0 27 30 5 2 0
+0 0 31 0 0 31 30 0 21 0 0 21 0 34 0 0 31 29 21 21 11 11 9 0 0
+0 10 6 0 13 0 0 0 23 21 11 11 0 5 0 0 0 23 22 0 0 0 11 0 20
+27 0 0 0 23 11 0 12 0 0 25 17 2 0 8 6 0 0 32 0 0 19 0 9 0
+0 0 32 14 0 28 9 23 0 0 26 12 10 0 0 0 20 0 0 33 0 0 21 17 8
+0 20 1 13 0 0 3 0 16 0 19 17 0 11 0 0 0 0 20 18 0 0 0 21 23
+0 0 23 0 0 22 11 0 12 0 0 0 11 10 1 22 15 0 27 0 0 23 0 0 27
+32 11 5 0 7 9 6 0 0 0 14 9 22 0 2 0 0 11 0 0 17 0 0 0 0
+9 23 0 0 31 11 0 28 12 0 0 32 0 3 1 0 0 0 0 3 23 0 4 0 0
+2 5 0 0 11 0 12 0 0 6 9 0 11 0 27 28 2 0 0 0 0 0 1 0 0
+27 22 4 0 24 0 0 20 12 0 0 0 0 32 4 0 11 24 21 10 9 10 9 0 0
+0 0 17 0 0 23 21 0 23 0 0 0 0 12 21 0 0 17 16 0 0 18 0 0 21
+14 0 0 0 3 3 27 9 0 22 0 11 0 27 0 0 2 0 9 0 0 27 11 9 0
+27 33 22 0 0 0 0 0 27 9 7 0 0 33 0 0 0 14 22 1 7 0 0 7 7
+17 0 0 16 0 0 11 21 4 0 0 0 27 12 20 0 0 0 0 23 24 21 0 0 0
+9 27 32 5 0 0 0 0 27 0 0 23 11 0 21 0 20 22 0 0 4 0 27 16 0
+0 0 0 0 27 26 9 0 11 0 0 32 30 0 0 0 4 0 32 0 22 17 13 0 0
+0 0 11 10 26 6 2 25 24 0 0 0 3 17 0 18 0 0 5 0 0 8 9 0 25
+7 0 12 0 0 0 0 0 0 2 0 1 0 0 0 0 8 6 0 0 18 6 5 14 0
+0 0 8 0 0 28 20 0 27 0 0 8 6 3 0 0 0 0 0 0 18 0 19 0 0
+1 3 22 2 2 0 0 20 0 0 12 2 0 27 9 0 28 12 10 0 20 0 0 0 0
+0 0 3 27 21 0 20 12 0 0 0 0 29 0 0 31 3 11 21 2 0 0 0 13 9
+0 0 0 23 21 0 23 0 0 2 0 0 28 27 0 0 16 15 12 0 2 0 0 0 28
+12 22 0 3 0 21 0 0 22 0 0 22 0 0 27 25 0 26 0 0 20 13 11 22 0
+0 28 0 0 10 0 15 0 0 28 23 0 0 22 16 0 0 25 0 0 32 27 0 28 9
+0 25 10 0 0 0 0 21 17 6 0 0 0 21 0 0 24 31 14 27 9 0 12 0 0
+0 0 0 23 0 26 0 0 0 19 17 3 2 0 0 10 0 30 15 13 0 0 0 0 0
+20 0 24 0 31 0 0 10 6 7 0 0 18 0 20 0 0 0 32 27 19 12 10 25 0
+0 19 11 16 0 6 0 0 13 9 0 0 0 0 0 0 14 0 0 0 25 0 14 0 30
+27 0 1 0 0 0 0 0 10 31 30 23 0 0 0 14 0 6 1 0 0 0 12 26 25
+0 0 30 0 0 0 0 31 25 0 26 0 0 30 14 0 34 0 0 17 0 0 23 14 0
+0 16 0 24 8 6 0 0 0 31 0 0 0 20 13 0 0 30 21 0 25 0 0 0 16
+14 0 0 26 17 13 11 17 0 24 0 0 0 1 17 0 24 0 0 0 30 17 19 10 6
+1 0 30 11 0 17 0 0 0 8 0 0 14 13 0 0 20 0 10 0 11 0 0 20 0
+26 22 16 0 0 0 27 0 0 14 24 22 0 0 10 1 0 11 0 17 0 6 0 0 13
+0 0 24 22 0 0 18 0 26 18 0 19 0 0 0 31 0 0 32 31 0 0 33 0 0
+""")
+
+LEFT = _column("""
+1 2 3 4 5 6 7 8 9 10 0 0 0 14 15 0 17 18 0 20 21 22 0 24 0
+0 0 0 0 0 31 32 33 34 0 36 0 0 39 40 41 0 43 44 0 0 0 48 49 0
+0 0 0 54 55 0 0 58 59 60 0 0 0 64 0 66 0 0 69 70 0 72 73 74 0
+76 0 0 79 80 0 0 0 84 85 0 87 0 0 0 91 0 93 94 0 0 0 98 99 100
+101 102 103 0 105 0 107 108 0 110 0 112 0 0 115 0 0 118 119 120 0 122 0 0 0
+0 127 0 0 0 131 132 133 134 0 136 0 138 0 140 0 0 0 144 145 0 147 148 149 0
+0 0 0 154 155 156 157 0 0 160 161 162 0 164 0 0 0 0 0 0 171 172 173 0 175
+0 177 178 179 180 181 0 0 0 0 186 187 0 0 0 0 192 193 0 0 0 0 0 199 200
+201 202 203 204 0 206 0 0 209 0 211 0 0 214 0 216 217 218 219 0 0 0 0 0 225
+226 0 228 0 0 231 232 233 234 0 236 237 0 239 0 0 242 0 244 245 0 0 0 249 250
+251 252 0 0 0 256 0 0 259 0 261 262 263 0 0 266 267 268 0 0 0 0 273 274 275
+276 277 0 279 0 0 0 0 0 0 286 287 288 289 290 0 292 0 0 0 296 297 298 0 300
+0 302 303 0 0 0 307 0 309 0 0 312 0 314 0 316 0 0 319 320 0 322 0 0 0
+326 327 0 329 330 0 332 333 0 0 0 0 338 339 340 0 342 343 344 345 346 0 348 349 0
+0 0 0 0 355 0 0 0 0 360 0 362 363 364 365 0 0 368 0 0 371 372 0 374 0
+0 377 0 379 380 381 0 0 0 0 0 387 388 389 390 0 392 0 0 395 0 397 0 0 400
+0 402 403 0 0 406 407 0 409 0 0 412 0 414 0 0 417 418 419 0 421 422 0 424 0
+0 0 0 429 430 0 432 0 0 435 436 437 0 439 440 441 442 0 0 0 446 447 0 0 0
+451 0 0 0 0 456 457 458 459 460 0 462 0 464 465 0 0 468 0 0 0 472 0 0 475
+476 0 0 0 480 481 0 483 484 0 0 0 488 0 0 491 492 493 494 495 0 497 0 0 500
+501 0 0 504 0 0 507 0 509 510 511 0 513 0 515 516 0 0 0 520 521 522 0 524 0
+0 527 528 0 530 0 0 0 534 535 0 537 0 0 0 0 542 543 544 545 546 547 548 0 550
+0 0 0 554 555 556 0 558 0 0 0 562 0 564 0 566 0 0 569 570 571 572 0 574 0
+0 0 0 579 0 581 0 583 584 585 0 0 0 0 590 591 592 0 594 595 0 0 0 599 600
+0 602 0 0 605 0 0 0 609 610 611 612 0 0 0 0 0 0 619 620 621 622 623 624 625
+626 0 0 629 0 0 0 0 634 0 0 637 638 0 640 641 642 0 0 0 646 0 648 649 0
+0 0 653 654 0 656 0 0 659 0 0 662 663 664 665 666 667 668 0 0 0 0 673 674 0
+676 0 678 0 0 681 682 0 0 0 686 687 688 689 0 691 692 693 0 695 0 0 698 0 0
+0 0 0 704 705 0 0 708 709 0 0 0 713 714 715 0 0 0 719 0 0 722 0 724 725
+0 727 728 0 0 0 732 0 734 0 0 0 738 739 0 741 742 743 744 0 746 0 0 749 0
+0 752 753 0 755 0 0 0 759 760 761 762 763 0 0 766 767 0 0 0 0 0 773 774 775
+0 777 778 779 0 0 0 783 0 0 786 787 0 0 790 791 0 0 0 795 0 797 0 0 800
+801 802 803 804 805 0 807 808 0 0 0 812 0 814 815 0 0 0 819 820 821 0 823 0 825
+0 0 0 829 830 831 832 833 0 835 836 0 0 0 840 841 0 843 0 0 0 0 0 849 850
+0 0 0 854 855 856 0 858 0 0 861 862 0 0 865 0 0 868 869 870 0 872 0 0 875
+0 0 878 879 880 881 882 0 0 0 0 887 0 0 890 0 0 893 894 0 896 0 898 0 900
+901 0 0 0 905 0 907 0 909 910 911 0 913 0 915 0 917 0 0 0 921 922 0 924 0
+926 927 0 929 0 0 0 933 0 0 0 937 938 939 940 0 942 0 0 945 946 0 948 949 950
+0 0 953 0 0 0 957 958 959 960 0 0 0 0 965 0 967 968 0 970 971 0 0 0 0
+976 977 978 979 980 981 982 0 0 0 986 987 0 0 0 0 992 0 994 995 996 0 0 0 1000
+0 1002 0 0 1005 0 1007 0 0 1010 1011 0 0 1014 0 1016 0 0 1019 0 1021 1022 1023 0 0
+1026 1027 0 1029 0 0 0 1033 1034 0 0 1037 1038 0 1040 1041 0 0 1044 1045 1046 0 0 0 1050
+0 0 0 1054 1055 1056 1057 1058 1059 1060 0 0 0 1064 0 1066 0 1068 0 0 0 1072 1073 1074 1075
+1076 0 1078 1079 0 0 0 1083 0 1085 1086 0 0 0 1090 1091 1092 0 1094 0 1096 0 0 0 1100
+1101 1102 1103 1104 0 1106 1107 0 0 0 1111 1112 0 1114 0 0 0 0 0 1120 1121 0 0 0 1125
+1126 1127 0 1129 0 0 1132 1133 0 0 1136 0 0 1139 1140 1141 0 1143 0 0 1146 0 0 1149 1150
+1151 1152 1153 0 0 0 0 1158 0 0 1161 0 0 1164 1165 1166 1167 1168 0 0 1171 1172 0 0 1175
+0 1177 0 1179 1180 0 1182 0 0 1185 0 0 1188 1189 1190 0 0 1193 1194 0 0 0 0 1199 0
+1201 1202 0 1204 0 0 1207 1208 0 0 0 1212 1213 1214 1215 0 0 1218 1219 1220 1221 1222 0 0 0
+0 0 1228 1229 0 1231 1232 0 0 0 1236 1237 1238 0 0 0 1242 0 0 0 1246 1247 1248 0 1250
+0 0 0 1254 0 1256 1257 0 0 1260 0 0 1263 1264 1265 1266 1267 1268 1269 1270 0 1272 1273 1274 0
+0 0 0 1279 0 0 1282 1283 0 1285 1286 0 0 0 0 1291 1292 1293 0 0 0 0 1298 0 1300
+0 1302 1303 1304 1305 0 0 0 1309 0 0 1312 1313 0 0 1316 1317 1318 0 0 0 0 1323 1324 1325
+0 0 1328 1329 1330 1331 1332 0 0 0 0 0 0 1339 1340 1341 0 1343 1344 1345 0 0 0 0 0
+1351 1352 0 1354 0 0 1357 0 0 1360 1361 1362 1363 0 1365 1366 0 1368 0 1370 0 0 1373 0 0
+1376 1377 1378 1379 0 1381 0 0 0 1385 0 0 1388 0 0 1391 1392 1393 0 1395 1396 0 0 0 1400
+1401 1402 0 0 0 0 1407 1408 1409 0 1411 0 0 0 1415 0 1417 0 0 1420 1421 1422 1423 1424 0
+1426 0 1428 0 0 1431 0 0 0 1435 0 1437 1438 0 0 0 1442 0 0 1445 1446 0 1448 1449 1450
+0 0 0 0 1455 1456 1457 1458 1459 0 1461 0 0 1464 1465 0 1467 0 0 0 1471 1472 0 1474 1475
+1476 0 1478 1479 0 0 0 0 0 0 1486 0 0 1489 1490 1491 1492 1493 0 0 0 1497 1498 0 0
+1501 0 0 1504 1505 1506 1507 0 1509 0 1511 0 0 0 1515 1516 1517 1518 0 0 1521 0 1523 0 0
+1526 0 1528 0 0 0 1532 1533 1534 0 0 0 1538 1539 0 0 0 1543 1544 1545 1546 1547 0 1549 1550
+0 0 0 0 1555 1556 1557 1558 0 1560 1561 0 0 0 0 1566 0 1568 1569 0 1571 0 0 0 1575
+1576 1577 0 0 0 0 1582 1583 1584 0 1586 1587 1588 0 0 0 0 1593 1594 0 1596 0 0 0 0
+1601 1602 1603 0 0 0 1607 0 1609 1610 1611 1612 0 0 0 0 0 1618 1619 1620 1621 1622 1623 1624 1625
+1626 0 0 1629 0 0 1632 1633 0 0 1636 1637 1638 1639 0 0 0 0 1644 0 0 1647 1648 0 0
+1651 1652 1653 0 1655 1656 1657 0 1659 0 0 0 0 0 0 1666 1667 1668 1669 1670 0 1672 0 0 0
+0 1677 1678 0 1680 1681 1682 0 1684 0 0 1687 1688 0 1690 0 0 0 0 1695 1696 1697 1698 0 0
+0 0 1703 1704 1705 0 0 1708 1709 0 0 1712 0 0 1715 0 0 0 1719 1720 1721 1722 1723 0 1725
+0 0 0 1729 1730 1731 1732 1733 1734 0 0 0 1738 0 1740 1741 0 0 0 1745 0 1747 1748 0 0
+1751 0 0 0 1755 0 0 0 1759 1760 1761 1762 1763 0 1765 1766 1767 1768 0 0 0 0 0 0 1775
+1776 1777 0 1779 1780 0 0 1783 1784 0 0 0 1788 1789 1790 1791 0 0 0 0 0 1797 0 0 1800
+1801 1802 0 1804 0 0 0 0 1809 1810 1811 0 1813 0 0 0 1817 0 1819 0 1821 0 0 1824 1825
+1826 1827 1828 1829 1830 0 1832 1833 0 1835 1836 0 0 0 1840 0 0 0 1844 0 0 1847 1848 1849 1850
+0 0 0 1854 0 0 1857 0 0 1860 1861 1862 1863 1864 0 1866 1867 0 0 0 1871 0 1873 0 1875
+0 1877 0 0 1880 1881 1882 1883 0 0 0 0 1888 1889 1890 1891 0 0 0 1895 1896 0 0 0 1900
+1901 1902 1903 0 0 0 0 1908 1909 1910 1911 1912 0 0 0 0 0 0 1919 1920 1921 1922 0 1924 0
+0 0 1928 1929 0 0 0 1933 1934 1935 0 1937 1938 0 1940 0 0 1943 0 1945 1946 0 1948 0 0
+0 0 1953 1954 0 0 1957 1958 0 1960 0 0 1963 1964 0 1966 0 0 0 1970 1971 1972 0 0 1975
+1976 0 0 1979 0 1981 0 0 1984 0 0 1987 1988 0 1990 1991 0 1993 0 1995 1996 1997 0 0 2000
+0 0 0 0 2005 2006 2007 0 2009 0 0 2012 0 0 0 2016 2017 2018 2019 0 2021 0 0 2024 0
+2026 0 0 2029 2030 2031 0 0 0 0 2036 2037 2038 2039 0 0 2042 2043 2044 0 0 0 0 2049 2050
+2051 2052 0 0 0 2056 2057 2058 0 2060 0 0 0 2064 2065 0 0 2068 0 2070 0 0 2073 0 2075
+0 0 2078 2079 0 2081 0 0 2084 0 0 2087 2088 2089 2090 2091 2092 0 2094 2095 2096 0 0 0 2100
+0 2102 0 0 2105 2106 0 0 2109 0 2111 2112 0 0 0 2116 2117 0 2119 0 0 2122 2123 0 2125
+0 0 2128 0 0 2131 2132 2133 0 0 0 2137 2138 0 2140 0 2142 0 0 2145 2146 0 2148 0 2150
+0 2152 0 0 2155 0 2157 0 0 2160 2161 2162 2163 0 2165 0 0 2168 2169 2170 2171 2172 2173 0 0
+0 0 0 2179 2180 0 2182 2183 0 0 0 2187 2188 0 2190 2191 0 0 0 2195 0 0 0 2199 2200
+2201 0 2203 0 0 0 2207 2208 0 0 2211 2212 0 0 2215 2216 0 0 0 2220 2221 0 2223 2224 2225
+0 0 0 0 2230 2231 0 2233 0 0 0 2237 2238 2239 0 2241 0 2243 0 0 2246 2247 2248 0 2250
+2251 2252 0 0 0 2256 2257 0 2259 0 0 2262 0 0 0 2266 0 0 2269 2270 2271 2272 0 2274 0
+2276 0 2278 0 0 2281 2282 0 0 0 2286 2287 0 2289 2290 0 0 2293 0 2295 0 0 0 2299 0
+2301 0 2303 0 0 2306 2307 2308 2309 2310 2311 2312 2313 0 0 2316 2317 0 0 0 2321 0 2323 2324 0
+0 0 2328 2329 2330 0 2332 0 2334 0 0 0 2338 2339 2340 2341 2342 0 2344 2345 0 0 0 2349 2350
+0 2352 0 0 0 0 0 2358 2359 0 0 0 2363 2364 2365 0 2367 0 0 2370 2371 0 0 0 2375
+2376 2377 0 2379 0 0 2382 0 0 2385 2386 2387 2388 2389 0 0 0 0 2394 0 0 2397 0 0 2400
+2401 2402 0 2404 0 2406 0 2408 0 0 0 2412 2413 2414 0 2416 0 0 2419 2420 0 0 0 0 2425
+2426 2427 0 2429 2430 2431 0 2433 2434 0 0 2437 0 0 2440 0 2442 0 2444 0 0 0 2448 2449 2450
+2451 0 0 2454 2455 0 0 2458 0 0 2461 2462 0 2464 0 0 0 2468 2469 0 2471 2472 2473 0 0
+2476 2477 2478 2479 0 0 0 2483 0 0 2486 2487 0 0 0 2491 0 0 2494 2495 0 0 0 2499 0
+2501 2502 2503 2504 0 2506 2507 2508 0 0 0 0 2513 2514 0 0 0 2518 2519 0 2521 0 0 2524 2525
+2526 0 2528 2529 0 0 0 0 2534 2535 0 0 0 0 2540 2541 2542 2543 2544 0 2546 2547 2548 0 0
+0 0 2553 2554 2555 2556 0 2558 2559 0 2561 0 2563 0 0 0 0 2568 0 0 0 2572 0 0 2575
+0 2577 2578 0 2580 2581 2582 0 2584 0 2586 0 0 0 0 2591 2592 2593 2594 0 2596 0 0 2599 2600
+0 0 2603 0 0 2606 2607 2608 0 0 0 2612 0 2614 0 2616 0 0 2619 2620 2621 0 0 2624 2625
+0 0 2628 0 2630 0 2632 0 0 2635 2636 2637 2638 0 2640 0 0 0 2644 2645 0 0 0 0 2650
+2651 2652 2653 2654 0 2656 0 0 2659 0 2661 0 0 2664 2665 0 0 2668 0 2670 2671 0 2673 0 0
+0 2677 2678 0 2680 2681 2682 0 0 0 2686 0 0 2689 0 0 2692 2693 2694 2695 2696 2697 0 0 2700
+0 2702 0 0 2705 2706 0 0 2709 2710 0 0 0 2714 0 0 0 2718 2719 0 0 2722 0 0 2725
+2726 2727 2728 2729 2730 2731 0 2733 0 0 2736 0 2738 0 0 2741 2742 2743 0 2745 0 0 2748 0 2750
+0 0 2753 0 2755 0 0 2758 0 2760 0 2762 0 2764 2765 0 2767 0 2769 2770 0 0 0 0 2775
+2776 0 2778 0 0 2781 2782 2783 2784 0 2786 0 2788 0 0 2791 2792 0 2794 0 2796 0 0 2799 2800
+2801 2802 2803 0 2805 0 0 2808 0 0 2811 0 2813 0 2815 0 0 2818 2819 0 2821 2822 2823 2824 0
+0 0 2828 0 0 0 2832 2833 2834 0 2836 0 0 0 2840 0 0 2843 2844 2845 0 0 2848 0 2850
+2851 2852 0 0 2855 2856 0 0 0 2860 0 0 2863 2864 2865 0 0 0 0 2870 0 0 2873 0 2875
+0 0 2878 2879 2880 2881 0 2883 2884 2885 0 0 0 0 2890 2891 2892 2893 2894 2895 0 0 0 2899 0
+0 0 2903 2904 2905 2906 2907 0 2909 0 0 2912 0 0 2915 0 2917 2918 0 2920 0 0 0 2924 2925
+2926 2927 2928 0 2930 2931 0 2933 0 0 0 2937 0 2939 0 2941 2942 2943 0 0 0 0 2948 0 2950
+2951 0 0 2954 0 2956 2957 0 0 0 2961 2962 2963 0 0 0 0 2968 2969 2970 2971 2972 0 2974 0
+0 0 2978 0 0 0 2982 0 2984 0 2986 0 0 2989 0 2991 0 2993 0 0 2996 2997 2998 2999 0
+0 0 3003 3004 0 0 3007 0 0 3010 3011 3012 3013 3014 0 3016 3017 0 0 3020 3021 3022 3023 0 0
+3026 3027 0 0 0 3031 0 3033 3034 0 0 0 0 3039 3040 0 0 0 3044 3045 0 0 3048 3049 3050
+0 0 3053 0 0 0 3057 0 3059 0 3061 0 3063 0 0 3066 3067 3068 0 0 3071 0 3073 0 0
+0 3077 3078 3079 0 3081 0 3083 3084 0 3086 3087 0 0 0 3091 0 3093 0 3095 3096 0 0 0 3100
+3101 0 0 3104 0 0 3107 3108 3109 3110 0 0 3113 0 0 3116 3117 3118 0 0 0 0 3123 3124 0
+3126 0 0 3129 3130 0 0 3133 0 0 3136 3137 3138 3139 3140 0 3142 3143 0 3145 0 0 3148 0 0
+3151 3152 3153 0 0 0 0 3158 3159 3160 3161 0 3163 3164 3165 0 0 3168 3169 0 0 0 3173 3174 3175
+0 3177 3178 3179 3180 3181 0 0 0 0 0 0 0 3189 3190 0 0 0 0 3195 3196 3197 0 3199 3200
+3201 3202 0 3204 0 0 0 3208 0 3210 3211 0 3213 0 3215 0 0 0 3219 3220 3221 3222 0 0 3225
+0 0 3228 3229 0 0 0 3233 3234 3235 0 0 3238 3239 3240 0 0 0 0 3245 0 0 3248 3249 0
+0 0 3253 3254 3255 3256 3257 3258 0 3260 3261 0 0 0 0 3266 0 0 0 3270 3271 0 0 3274 0
+0 3277 0 0 3280 3281 3282 3283 0 0 3286 0 0 0 3290 3291 3292 3293 3294 3295 0 0 0 0 3300
+3301 0 3303 0 0 3306 0 0 0 3310 3311 0 0 3314 0 0 3317 3318 3319 3320 3321 0 3323 3324 0
+0 0 3328 0 3330 0 3332 0 0 0 3336 3337 0 0 3340 3341 3342 0 0 3345 0 0 3348 0 0
+3351 3352 3353 3354 3355 0 0 0 3359 0 0 3362 3363 3364 3365 0 3367 3368 0 3370 0 3372 0 0 3375
+3376 0 0 0 3380 3381 3382 0 0 3385 3386 3387 3388 3389 0 0 3392 0 0 3395 0 0 0 3399 0
+3401 0 3403 0 0 3406 3407 3408 0 0 3411 0 0 3414 3415 0 3417 0 0 3420 0 3422 3423 0 3425
+0 3427 0 0 3430 3431 3432 3433 0 3435 0 0 0 3439 0 0 0 3443 3444 3445 3446 3447 3448 0 3450
+0 0 3453 3454 0 3456 0 0 0 3460 0 3462 0 3464 3465 0 0 0 3469 3470 0 0 0 0 3475
+3476 3477 3478 0 3480 0 0 0 3484 0 0 3487 3488 0 0 0 3492 3493 3494 3495 0 0 3498 0 0
+3501 0 3503 3504 0 3506 0 0 0 3510 0 0 3513 0 3515 0 0 3518 3519 3520 3521 0 3523 0 0
+3526 3527 0 3529 3530 3531 0 3533 0 0 3536 3537 3538 3539 0 0 3542 0 0 3545 0 0 3548 3549 0
+3551 0 3553 0 0 3556 0 3558 3559 0 0 0 3563 0 3565 3566 3567 0 3569 0 0 0 3573 0 3575
+0 0 3578 0 0 3581 3582 3583 3584 0 0 3587 3588 3589 0 0 0 3593 3594 3595 0 3597 3598 0 0
+0 3602 0 0 0 3606 3607 0 3609 0 3611 3612 3613 0 0 0 0 3618 0 3620 3621 0 3623 3624 3625
+0 0 0 0 0 3631 3632 0 0 3635 0 3637 3638 0 0 3641 0 0 3644 3645 3646 0 3648 3649 3650
+3651 0 0 0 0 0 3657 3658 3659 3660 3661 0 0 0 3665 0 0 3668 3669 3670 3671 3672 0 0 3675
+0 3677 0 3679 0 0 3682 3683 0 0 0 3687 3688 3689 0 3691 0 0 3694 0 0 3697 3698 0 0
+0 3702 3703 3704 0 3706 0 0 3709 3710 0 3712 0 3714 3715 0 0 0 3719 0 0 3722 0 3724 3725
+0 0 3728 0 0 3731 0 3733 0 0 3736 3737 3738 3739 3740 3741 3742 3743 3744 0 0 0 0 3749 0
+0 3752 3753 3754 0 0 3757 0 0 0 0 3762 3763 3764 0 0 3767 3768 0 0 0 0 3773 3774 0
+0 3777 0 0 3780 3781 3782 3783 0 0 3786 0 0 3789 3790 3791 3792 0 3794 0 0 0 0 0 3800
+3801 3802 0 0 3805 0 0 3808 3809 3810 0 3812 0 3814 0 3816 0 0 3819 0 0 3822 0 3824 0
+0 3827 3828 3829 3830 3831 3832 3833 0 0 3836 3837 3838 0 0 0 3842 0 3844 0 0 3847 0 3849 3850
+3851 0 3853 3854 0 3856 3857 0 3859 0 0 0 0 3864 3865 0 0 0 3869 0 3871 3872 0 3874 3875
+0 3877 0 0 0 0 3882 3883 3884 3885 0 3887 0 0 3890 3891 3892 3893 0 3895 0 0 3898 0 3900
+3901 0 0 0 3905 3906 0 3908 0 0 0 0 0 3914 3915 3916 0 0 3919 3920 0 3922 0 3924 0
+0 0 3928 3929 0 0 0 3933 3934 3935 3936 0 3938 3939 3940 3941 3942 0 0 0 0 3947 3948 3949 3950
+3951 3952 3953 0 0 0 0 0 0 3960 3961 3962 0 0 0 3966 3967 0 0 0 3971 3972 0 0 0
+3976 3977 3978 3979 0 0 3982 0 3984 0 0 3987 3988 0 0 0 3992 3993 0 3995 0 0 3998 3999 0
+4001 4002 4003 0 0 4006 4007 0 4009 0 0 0 0 4014 0 4016 4017 0 4019 0 0 0 4023 0 4025
+4026 4027 0 4029 0 0 0 0 4034 4035 4036 4037 4038 4039 0 4041 4042 0 0 0 4046 4047 4048 0 0
+0 0 4053 4054 0 4056 4057 0 0 0 4061 4062 0 0 0 4066 4067 4068 0 4070 0 0 0 4074 0
+4076 0 0 4079 4080 4081 0 4083 4084 4085 0 0 4088 4089 0 0 0 4093 4094 4095 0 0 0 4099 0
+0 4102 4103 0 4105 0 0 0 4109 4110 4111 0 0 0 4115 4116 4117 0 0 0 4121 0 0 4124 4125
+4126 0 0 4129 4130 4131 0 4133 0 0 4136 4137 0 0 0 4141 0 4143 0 0 4146 4147 4148 4149 0
+0 0 4153 0 0 4156 4157 0 4159 0 0 4162 0 4164 0 0 4167 4168 4169 4170 4171 4172 4173 0 0
+0 4177 4178 0 4180 0 0 0 4184 4185 4186 4187 0 4189 0 0 0 4193 4194 0 0 0 4198 0 4200
+4201 0 0 0 4205 4206 0 4208 0 0 4211 4212 4213 0 4215 4216 0 0 4219 0 0 4222 0 4224 0
+0 0 4228 4229 0 4231 4232 4233 0 0 4236 4237 4238 0 0 0 4242 0 0 4245 0 0 4248 4249 4250
+0 4252 4253 4254 0 0 4257 0 4259 0 4261 4262 0 4264 0 0 0 0 4269 4270 0 0 0 4274 4275
+0 0 4278 0 0 4281 4282 0 4284 0 0 0 4288 4289 4290 4291 4292 0 4294 0 0 4297 0 0 4300
+4301 4302 4303 0 4305 4306 4307 0 0 0 4311 4312 4313 0 4315 0 0 4318 0 0 4321 0 0 0 0
+4326 4327 0 0 4330 4331 0 4333 4334 0 0 4337 0 4339 4340 0 0 0 0 4345 4346 4347 4348 0 0
+4351 4352 0 0 4355 0 4357 0 0 4360 4361 0 4363 0 4365 4366 4367 0 0 0 0 0 4373 4374 0
+4376 4377 4378 0 4380 0 0 4383 4384 0 0 0 0 4389 4390 0 4392 4393 4394 4395 4396 4397 4398 0 0
+0 0 4403 0 0 4406 4407 0 4409 0 0 0 0 4414 4415 0 0 4418 4419 0 0 4422 0 0 4425
+4426 0 0 0 4430 4431 4432 4433 0 4435 0 4437 0 4439 0 0 4442 0 4444 0 0 4447 4448 4449 0
+4451 4452 4453 0 0 0 0 0 4459 4460 4461 0 0 4464 0 0 0 4468 4469 4470 4471 0 0 4474 4475
+4476 0 0 4479 0 0 4482 4483 4484 0 0 0 4488 4489 4490 0 0 0 0 4495 4496 4497 0 0 0
+4501 4502 4503 4504 0 0 0 0 4509 0 0 4512 4513 0 4515 0 4517 4518 4519 0 4521 0 4523 4524 0
+0 0 0 0 4530 4531 4532 0 4534 0 0 4537 4538 0 0 0 4542 0 4544 0 4546 4547 4548 0 0
+0 0 4553 4554 4555 4556 4557 4558 4559 0 0 0 4563 4564 0 4566 0 0 4569 0 0 4572 4573 0 4575
+4576 0 4578 4579 0 0 0 0 0 4585 4586 4587 0 0 0 4591 4592 4593 0 0 4596 4597 4598 4599 0
+0 0 4603 0 0 4606 4607 0 4609 0 0 4612 4613 4614 0 0 0 0 4619 0 4621 0 4623 0 0
+4626 4627 4628 4629 4630 0 0 4633 0 0 4636 4637 0 4639 4640 0 4642 4643 4644 0 4646 0 0 0 0
+0 0 4653 4654 4655 0 4657 4658 0 0 0 0 4663 0 0 4666 4667 4668 4669 4670 0 4672 0 4674 4675
+0 0 0 4679 4680 0 4682 0 0 4685 0 0 4688 4689 0 0 4692 4693 4694 0 4696 0 0 0 4700
+4701 4702 0 4704 0 4706 0 0 4709 0 0 4712 0 0 4715 4716 0 4718 0 0 4721 4722 4723 4724 0
+0 4727 0 0 4730 0 4732 0 0 4735 4736 0 0 4739 4740 0 0 4743 0 0 4746 4747 0 4749 4750
+0 4752 4753 0 0 0 0 4758 4759 4760 0 0 0 4764 0 0 4767 4768 4769 4770 4771 0 4773 4774 0
+0 0 0 4779 0 4781 0 0 4784 4785 4786 4787 4788 0 0 4791 0 4793 4794 4795 0 0 0 0 0
+4801 0 4803 0 4805 0 0 4808 4809 4810 0 0 4813 0 4815 0 0 0 4819 4820 4821 4822 4823 4824 0
+0 4827 4828 4829 4830 4831 0 0 4834 4835 0 0 0 0 0 4841 4842 0 0 0 4846 0 4848 0 4850
+4851 4852 4853 0 0 0 0 0 4859 4860 4861 4862 0 0 0 4866 0 4868 4869 0 0 0 4873 4874 4875
+0 0 4878 0 4880 0 0 4883 4884 0 4886 0 0 4889 4890 0 4892 0 0 4895 0 0 4898 4899 0
+0 4902 4903 4904 4905 4906 0 0 0 4910 0 0 0 4914 4915 0 0 4918 4919 0 4921 0 0 0 4925
+4926 0 0 4929 4930 4931 4932 4933 0 4935 0 0 0 4939 4940 0 4942 0 0 0 4946 4947 4948 4949 4950
+4951 0 4953 4954 0 4956 0 0 0 4960 0 0 4963 4964 0 0 4967 0 4969 0 4971 0 0 4974 0
+4976 4977 4978 0 0 0 4982 0 0 4985 4986 4987 0 0 4990 4991 0 4993 0 4995 0 4997 0 0 5000
+0 0 5003 5004 0 0 5007 0 5009 5010 0 5012 0 0 0 5016 0 0 5019 5020 0 0 5023 0 0
+""")
+
+RIGHT = _column("""
+2724 1053 936 737 198 97 30 13 12 11 0 0 0 29 16 0 28 19 0 27 26 23 0 25 0
+0 0 0 0 0 68 53 38 35 0 37 0 0 52 47 42 0 46 45 0 0 0 51 50 0
+0 0 0 57 56 0 0 63 62 61 0 0 0 65 0 67 0 0 90 71 0 83 78 75 0
+77 0 0 82 81 0 0 0 89 86 0 88 0 0 0 92 0 96 95 0 0 0 197 130 129
+126 117 104 0 106 0 114 109 0 111 0 113 0 0 116 0 0 125 124 121 0 123 0 0 0
+0 128 0 0 0 170 143 142 135 0 137 0 139 0 141 0 0 0 153 146 0 152 151 150 0
+0 0 0 169 168 159 158 0 0 167 166 163 0 165 0 0 0 0 0 0 196 191 174 0 176
+0 190 185 184 183 182 0 0 0 0 189 188 0 0 0 0 195 194 0 0 0 0 0 490 455
+224 213 208 205 0 207 0 0 210 0 212 0 0 215 0 223 222 221 220 0 0 0 0 0 230
+227 0 229 0 0 386 285 248 235 0 241 238 0 240 0 0 243 0 247 246 0 0 0 258 255
+254 253 0 0 0 257 0 0 260 0 272 265 264 0 0 271 270 269 0 0 0 0 284 283 282
+281 278 0 280 0 0 0 0 0 0 325 318 295 294 291 0 293 0 0 0 311 306 299 0 301
+0 305 304 0 0 0 308 0 310 0 0 313 0 315 0 317 0 0 324 321 0 323 0 0 0
+337 328 0 336 331 0 335 334 0 0 0 0 359 358 341 0 357 354 353 352 347 0 351 350 0
+0 0 0 0 356 0 0 0 0 361 0 385 370 367 366 0 0 369 0 0 376 373 0 375 0
+0 378 0 384 383 382 0 0 0 0 0 416 399 394 391 0 393 0 0 396 0 398 0 0 401
+0 405 404 0 0 411 408 0 410 0 0 413 0 415 0 0 428 427 420 0 426 423 0 425 0
+0 0 0 434 431 0 433 0 0 454 453 438 0 450 445 444 443 0 0 0 449 448 0 0 0
+452 0 0 0 0 479 474 471 470 461 0 463 0 467 466 0 0 469 0 0 0 473 0 0 478
+477 0 0 0 487 482 0 486 485 0 0 0 489 0 0 618 541 506 499 496 0 498 0 0 503
+502 0 0 505 0 0 508 0 540 519 512 0 514 0 518 517 0 0 0 533 526 523 0 525 0
+0 532 529 0 531 0 0 0 539 536 0 538 0 0 0 0 617 608 589 568 553 552 549 0 551
+0 0 0 561 560 557 0 559 0 0 0 563 0 565 0 567 0 0 578 577 576 573 0 575 0
+0 0 0 580 0 582 0 588 587 586 0 0 0 0 607 598 593 0 597 596 0 0 0 604 601
+0 603 0 0 606 0 0 0 616 615 614 613 0 0 0 0 0 0 736 661 636 633 632 631 628
+627 0 0 630 0 0 0 0 635 0 0 652 639 0 645 644 643 0 0 0 647 0 651 650 0
+0 0 658 655 0 657 0 0 660 0 0 721 712 685 672 671 670 669 0 0 0 0 680 675 0
+677 0 679 0 0 684 683 0 0 0 703 702 701 690 0 700 697 694 0 696 0 0 699 0 0
+0 0 0 707 706 0 0 711 710 0 0 0 718 717 716 0 0 0 720 0 0 723 0 731 726
+0 730 729 0 0 0 733 0 735 0 0 0 799 740 0 758 751 748 745 0 747 0 0 750 0
+0 757 754 0 756 0 0 0 772 771 770 765 764 0 0 769 768 0 0 0 0 0 794 785 776
+0 782 781 780 0 0 0 784 0 0 789 788 0 0 793 792 0 0 0 796 0 798 0 0 935
+892 853 818 811 806 0 810 809 0 0 0 813 0 817 816 0 0 0 828 827 822 0 824 0 826
+0 0 0 848 847 846 839 834 0 838 837 0 0 0 845 842 0 844 0 0 0 0 0 852 851
+0 0 0 867 860 857 0 859 0 0 864 863 0 0 866 0 0 877 874 871 0 873 0 0 876
+0 0 889 886 885 884 883 0 0 0 0 888 0 0 891 0 0 904 895 0 897 0 899 0 903
+902 0 0 0 906 0 908 0 920 919 912 0 914 0 916 0 918 0 0 0 932 923 0 925 0
+931 928 0 930 0 0 0 934 0 0 0 1018 975 944 941 0 943 0 0 956 947 0 955 952 951
+0 0 954 0 0 0 964 963 962 961 0 0 0 0 966 0 974 969 0 973 972 0 0 0 0
+1009 1004 991 990 985 984 983 0 0 0 989 988 0 0 0 0 993 0 999 998 997 0 0 0 1001
+0 1003 0 0 1006 0 1008 0 0 1013 1012 0 0 1015 0 1017 0 0 1020 0 1032 1025 1024 0 0
+1031 1028 0 1030 0 0 0 1036 1035 0 0 1052 1039 0 1043 1042 0 0 1049 1048 1047 0 0 0 1051
+0 0 0 1617 1262 1071 1070 1063 1062 1061 0 0 0 1065 0 1067 0 1069 0 0 0 1163 1124 1089 1082
+1077 0 1081 1080 0 0 0 1084 0 1088 1087 0 0 0 1099 1098 1093 0 1095 0 1097 0 0 0 1119
+1118 1117 1110 1105 0 1109 1108 0 0 0 1116 1113 0 1115 0 0 0 0 0 1123 1122 0 0 0 1138
+1131 1128 0 1130 0 0 1135 1134 0 0 1137 0 0 1148 1145 1142 0 1144 0 0 1147 0 0 1160 1157
+1156 1155 1154 0 0 0 0 1159 0 0 1162 0 0 1211 1198 1187 1170 1169 0 0 1174 1173 0 0 1176
+0 1178 0 1184 1181 0 1183 0 0 1186 0 0 1197 1192 1191 0 0 1196 1195 0 0 0 0 1200 0
+1206 1203 0 1205 0 0 1210 1209 0 0 0 1245 1244 1217 1216 0 0 1227 1226 1225 1224 1223 0 0 0
+0 0 1235 1230 0 1234 1233 0 0 0 1241 1240 1239 0 0 0 1243 0 0 0 1253 1252 1249 0 1251
+0 0 0 1255 0 1259 1258 0 0 1261 0 0 1444 1359 1322 1297 1290 1281 1278 1271 0 1277 1276 1275 0
+0 0 0 1280 0 0 1289 1284 0 1288 1287 0 0 0 0 1296 1295 1294 0 0 0 0 1299 0 1301
+0 1311 1308 1307 1306 0 0 0 1310 0 0 1315 1314 0 0 1321 1320 1319 0 0 0 0 1338 1327 1326
+0 0 1337 1336 1335 1334 1333 0 0 0 0 0 0 1350 1349 1342 0 1348 1347 1346 0 0 0 0 0
+1356 1353 0 1355 0 0 1358 0 0 1419 1390 1375 1364 0 1372 1367 0 1369 0 1371 0 0 1374 0 0
+1387 1384 1383 1380 0 1382 0 0 0 1386 0 0 1389 0 0 1406 1399 1394 0 1398 1397 0 0 0 1405
+1404 1403 0 0 0 0 1414 1413 1410 0 1412 0 0 0 1416 0 1418 0 0 1441 1434 1433 1430 1425 0
+1427 0 1429 0 0 1432 0 0 0 1436 0 1440 1439 0 0 0 1443 0 0 1454 1447 0 1453 1452 1451
+0 0 0 0 1488 1485 1470 1463 1460 0 1462 0 0 1469 1466 0 1468 0 0 0 1484 1473 0 1483 1482
+1477 0 1481 1480 0 0 0 0 0 0 1487 0 0 1542 1503 1496 1495 1494 0 0 0 1500 1499 0 0
+1502 0 0 1531 1514 1513 1508 0 1510 0 1512 0 0 0 1530 1525 1520 1519 0 0 1522 0 1524 0 0
+1527 0 1529 0 0 0 1537 1536 1535 0 0 0 1541 1540 0 0 0 1600 1581 1554 1553 1548 0 1552 1551
+0 0 0 0 1574 1565 1564 1559 0 1563 1562 0 0 0 0 1567 0 1573 1570 0 1572 0 0 0 1580
+1579 1578 0 0 0 0 1599 1592 1585 0 1591 1590 1589 0 0 0 0 1598 1595 0 1597 0 0 0 0
+1606 1605 1604 0 0 0 1608 0 1616 1615 1614 1613 0 0 0 0 0 2305 2086 1823 1718 1665 1646 1631 1628
+1627 0 0 1630 0 0 1635 1634 0 0 1643 1642 1641 1640 0 0 0 0 1645 0 0 1650 1649 0 0
+1664 1663 1654 0 1662 1661 1658 0 1660 0 0 0 0 0 0 1717 1676 1675 1674 1671 0 1673 0 0 0
+0 1694 1679 0 1693 1686 1683 0 1685 0 0 1692 1689 0 1691 0 0 0 0 1702 1701 1700 1699 0 0
+0 0 1714 1707 1706 0 0 1711 1710 0 0 1713 0 0 1716 0 0 0 1758 1757 1728 1727 1724 0 1726
+0 0 0 1754 1753 1744 1737 1736 1735 0 0 0 1739 0 1743 1742 0 0 0 1746 0 1750 1749 0 0
+1752 0 0 0 1756 0 0 0 1808 1799 1774 1773 1764 0 1772 1771 1770 1769 0 0 0 0 0 0 1796
+1787 1778 0 1782 1781 0 0 1786 1785 0 0 0 1795 1794 1793 1792 0 0 0 0 0 1798 0 0 1807
+1806 1803 0 1805 0 0 0 0 1816 1815 1812 0 1814 0 0 0 1818 0 1820 0 1822 0 0 2015 1986
+1859 1846 1843 1842 1831 0 1839 1834 0 1838 1837 0 0 0 1841 0 0 0 1845 0 0 1856 1853 1852 1851
+0 0 0 1855 0 0 1858 0 0 1969 1918 1879 1870 1865 0 1869 1868 0 0 0 1872 0 1874 0 1876
+0 1878 0 0 1887 1886 1885 1884 0 0 0 0 1899 1894 1893 1892 0 0 0 1898 1897 0 0 0 1907
+1906 1905 1904 0 0 0 0 1917 1916 1915 1914 1913 0 0 0 0 0 0 1932 1927 1926 1923 0 1925 0
+0 0 1931 1930 0 0 0 1952 1951 1936 0 1942 1939 0 1941 0 0 1944 0 1950 1947 0 1949 0 0
+0 0 1956 1955 0 0 1962 1959 0 1961 0 0 1968 1965 0 1967 0 0 0 1983 1974 1973 0 0 1978
+1977 0 0 1980 0 1982 0 0 1985 0 0 2004 1989 0 2003 1992 0 1994 0 2002 1999 1998 0 0 2001
+0 0 0 0 2014 2011 2008 0 2010 0 0 2013 0 0 0 2035 2028 2023 2020 0 2022 0 0 2025 0
+2027 0 0 2034 2033 2032 0 0 0 0 2077 2048 2041 2040 0 0 2047 2046 2045 0 0 0 0 2072 2055
+2054 2053 0 0 0 2063 2062 2059 0 2061 0 0 0 2067 2066 0 0 2069 0 2071 0 0 2074 0 2076
+0 0 2083 2080 0 2082 0 0 2085 0 0 2236 2159 2130 2115 2104 2093 0 2099 2098 2097 0 0 0 2101
+0 2103 0 0 2108 2107 0 0 2110 0 2114 2113 0 0 0 2121 2118 0 2120 0 0 2127 2124 0 2126
+0 0 2129 0 0 2136 2135 2134 0 0 0 2144 2139 0 2141 0 2143 0 0 2154 2147 0 2149 0 2151
+0 2153 0 0 2156 0 2158 0 0 2219 2198 2167 2164 0 2166 0 0 2197 2178 2177 2176 2175 2174 0 0
+0 0 0 2186 2181 0 2185 2184 0 0 0 2194 2189 0 2193 2192 0 0 0 2196 0 0 0 2206 2205
+2202 0 2204 0 0 0 2210 2209 0 0 2214 2213 0 0 2218 2217 0 0 0 2229 2222 0 2228 2227 2226
+0 0 0 0 2235 2232 0 2234 0 0 0 2268 2245 2240 0 2242 0 2244 0 0 2265 2264 2249 0 2255
+2254 2253 0 0 0 2261 2258 0 2260 0 0 2263 0 0 0 2267 0 0 2298 2285 2280 2273 0 2275 0
+2277 0 2279 0 0 2284 2283 0 0 0 2297 2288 0 2292 2291 0 0 2294 0 2296 0 0 0 2300 0
+2302 0 2304 0 0 2539 2424 2399 2362 2327 2320 2315 2314 0 0 2319 2318 0 0 0 2322 0 2326 2325 0
+0 0 2337 2336 2331 0 2333 0 2335 0 0 0 2357 2356 2355 2348 2343 0 2347 2346 0 0 0 2354 2351
+0 2353 0 0 0 0 0 2361 2360 0 0 0 2374 2369 2366 0 2368 0 0 2373 2372 0 0 0 2384
+2381 2378 0 2380 0 0 2383 0 0 2396 2393 2392 2391 2390 0 0 0 0 2395 0 0 2398 0 0 2411
+2410 2403 0 2405 0 2407 0 2409 0 0 0 2423 2418 2415 0 2417 0 0 2422 2421 0 0 0 0 2498
+2447 2428 0 2446 2439 2432 0 2436 2435 0 0 2438 0 0 2441 0 2443 0 2445 0 0 0 2467 2460 2453
+2452 0 0 2457 2456 0 0 2459 0 0 2466 2463 0 2465 0 0 0 2493 2470 0 2490 2475 2474 0 0
+2485 2482 2481 2480 0 0 0 2484 0 0 2489 2488 0 0 0 2492 0 0 2497 2496 0 0 0 2500 0
+2538 2517 2512 2505 0 2511 2510 2509 0 0 0 0 2516 2515 0 0 0 2523 2520 0 2522 0 0 2533 2532
+2527 0 2531 2530 0 0 0 0 2537 2536 0 0 0 0 2649 2574 2571 2552 2545 0 2551 2550 2549 0 0
+0 0 2570 2567 2566 2557 0 2565 2560 0 2562 0 2564 0 0 0 0 2569 0 0 0 2573 0 0 2576
+0 2590 2579 0 2589 2588 2583 0 2585 0 2587 0 0 0 0 2618 2605 2598 2595 0 2597 0 0 2602 2601
+0 0 2604 0 0 2611 2610 2609 0 0 0 2613 0 2615 0 2617 0 0 2634 2623 2622 0 0 2627 2626
+0 0 2629 0 2631 0 2633 0 0 2648 2643 2642 2639 0 2641 0 0 0 2647 2646 0 0 0 0 2691
+2676 2663 2658 2655 0 2657 0 0 2660 0 2662 0 0 2667 2666 0 0 2669 0 2675 2672 0 2674 0 0
+0 2688 2679 0 2685 2684 2683 0 0 0 2687 0 0 2690 0 0 2717 2716 2713 2704 2699 2698 0 0 2701
+0 2703 0 0 2708 2707 0 0 2712 2711 0 0 0 2715 0 0 0 2721 2720 0 0 2723 0 0 3826
+2877 2774 2757 2740 2735 2732 0 2734 0 0 2737 0 2739 0 0 2752 2747 2744 0 2746 0 0 2749 0 2751
+0 0 2754 0 2756 0 0 2759 0 2761 0 2763 0 2773 2766 0 2768 0 2772 2771 0 0 0 0 2780
+2777 0 2779 0 0 2872 2869 2790 2785 0 2787 0 2789 0 0 2798 2793 0 2795 0 2797 0 0 2842 2817
+2810 2807 2804 0 2806 0 0 2809 0 0 2812 0 2814 0 2816 0 0 2831 2820 0 2830 2827 2826 2825 0
+0 0 2829 0 0 0 2839 2838 2835 0 2837 0 0 0 2841 0 0 2862 2847 2846 0 0 2849 0 2859
+2854 2853 0 0 2858 2857 0 0 0 2861 0 0 2868 2867 2866 0 0 0 0 2871 0 0 2874 0 2876
+0 0 3135 3076 2889 2882 0 2888 2887 2886 0 0 0 0 2995 2902 2901 2898 2897 2896 0 0 0 2900 0
+0 0 2988 2923 2914 2911 2908 0 2910 0 0 2913 0 0 2916 0 2922 2919 0 2921 0 0 0 2967 2960
+2947 2936 2929 0 2935 2932 0 2934 0 0 0 2938 0 2940 0 2946 2945 2944 0 0 0 0 2949 0 2953
+2952 0 0 2955 0 2959 2958 0 0 0 2966 2965 2964 0 0 0 0 2981 2980 2977 2976 2973 0 2975 0
+0 0 2979 0 0 0 2983 0 2985 0 2987 0 0 2990 0 2992 0 2994 0 0 3009 3002 3001 3000 0
+0 0 3006 3005 0 0 3008 0 0 3065 3056 3043 3038 3015 0 3019 3018 0 0 3037 3030 3025 3024 0 0
+3029 3028 0 0 0 3032 0 3036 3035 0 0 0 0 3042 3041 0 0 0 3047 3046 0 0 3055 3052 3051
+0 0 3054 0 0 0 3058 0 3060 0 3062 0 3064 0 0 3075 3070 3069 0 0 3072 0 3074 0 0
+0 3106 3099 3080 0 3082 0 3090 3085 0 3089 3088 0 0 0 3092 0 3094 0 3098 3097 0 0 0 3103
+3102 0 0 3105 0 0 3122 3115 3112 3111 0 0 3114 0 0 3121 3120 3119 0 0 0 0 3128 3125 0
+3127 0 0 3132 3131 0 0 3134 0 0 3517 3316 3157 3150 3141 0 3147 3144 0 3146 0 0 3149 0 0
+3156 3155 3154 0 0 0 0 3279 3194 3193 3162 0 3172 3167 3166 0 0 3171 3170 0 0 0 3188 3187 3176
+0 3186 3185 3184 3183 3182 0 0 0 0 0 0 0 3192 3191 0 0 0 0 3252 3247 3198 0 3218 3207
+3206 3203 0 3205 0 0 0 3209 0 3217 3212 0 3214 0 3216 0 0 0 3232 3227 3224 3223 0 0 3226
+0 0 3231 3230 0 0 0 3244 3237 3236 0 0 3243 3242 3241 0 0 0 0 3246 0 0 3251 3250 0
+0 0 3276 3269 3268 3265 3264 3259 0 3263 3262 0 0 0 0 3267 0 0 0 3273 3272 0 0 3275 0
+0 3278 0 0 3289 3288 3285 3284 0 0 3287 0 0 0 3309 3308 3299 3298 3297 3296 0 0 0 0 3305
+3302 0 3304 0 0 3307 0 0 0 3313 3312 0 0 3315 0 0 3350 3335 3334 3327 3322 0 3326 3325 0
+0 0 3329 0 3331 0 3333 0 0 0 3339 3338 0 0 3347 3344 3343 0 0 3346 0 0 3349 0 0
+3512 3361 3358 3357 3356 0 0 0 3360 0 0 3491 3442 3379 3366 0 3374 3369 0 3371 0 3373 0 0 3378
+3377 0 0 0 3405 3384 3383 0 0 3398 3397 3394 3391 3390 0 0 3393 0 0 3396 0 0 0 3400 0
+3402 0 3404 0 0 3413 3410 3409 0 0 3412 0 0 3419 3416 0 3418 0 0 3421 0 3429 3424 0 3426
+0 3428 0 0 3441 3438 3437 3434 0 3436 0 0 0 3440 0 0 0 3474 3473 3468 3459 3452 3449 0 3451
+0 0 3458 3455 0 3457 0 0 0 3461 0 3463 0 3467 3466 0 0 0 3472 3471 0 0 0 0 3486
+3483 3482 3479 0 3481 0 0 0 3485 0 0 3490 3489 0 0 0 3509 3500 3497 3496 0 0 3499 0 0
+3502 0 3508 3505 0 3507 0 0 0 3511 0 0 3514 0 3516 0 0 3643 3580 3525 3522 0 3524 0 0
+3577 3528 0 3562 3535 3532 0 3534 0 0 3547 3544 3541 3540 0 0 3543 0 0 3546 0 0 3555 3550 0
+3552 0 3554 0 0 3557 0 3561 3560 0 0 0 3564 0 3572 3571 3568 0 3570 0 0 0 3574 0 3576
+0 0 3579 0 0 3630 3605 3586 3585 0 0 3592 3591 3590 0 0 0 3604 3601 3596 0 3600 3599 0 0
+0 3603 0 0 0 3617 3608 0 3610 0 3616 3615 3614 0 0 0 0 3619 0 3629 3622 0 3628 3627 3626
+0 0 0 0 0 3634 3633 0 0 3636 0 3640 3639 0 0 3642 0 0 3735 3656 3647 0 3655 3654 3653
+3652 0 0 0 0 0 3730 3667 3664 3663 3662 0 0 0 3666 0 0 3701 3686 3681 3674 3673 0 0 3676
+0 3678 0 3680 0 0 3685 3684 0 0 0 3696 3693 3690 0 3692 0 0 3695 0 0 3700 3699 0 0
+0 3721 3708 3705 0 3707 0 0 3718 3711 0 3713 0 3717 3716 0 0 0 3720 0 0 3723 0 3727 3726
+0 0 3729 0 0 3732 0 3734 0 0 3779 3772 3761 3760 3751 3748 3747 3746 3745 0 0 0 0 3750 0
+0 3759 3756 3755 0 0 3758 0 0 0 0 3771 3766 3765 0 0 3770 3769 0 0 0 0 3776 3775 0
+0 3778 0 0 3799 3788 3785 3784 0 0 3787 0 0 3798 3797 3796 3793 0 3795 0 0 0 0 0 3807
+3804 3803 0 0 3806 0 0 3821 3818 3811 0 3813 0 3815 0 3817 0 0 3820 0 0 3823 0 3825 0
+0 4552 4287 3932 3881 3846 3835 3834 0 0 3841 3840 3839 0 0 0 3843 0 3845 0 0 3848 0 3868 3863
+3852 0 3862 3855 0 3861 3858 0 3860 0 0 0 0 3867 3866 0 0 0 3870 0 3880 3873 0 3879 3876
+0 3878 0 0 0 0 3913 3912 3889 3886 0 3888 0 0 3911 3904 3897 3894 0 3896 0 0 3899 0 3903
+3902 0 0 0 3910 3907 0 3909 0 0 0 0 0 3927 3918 3917 0 0 3926 3921 0 3923 0 3925 0
+0 0 3931 3930 0 0 0 4166 4033 4022 3937 0 3975 3946 3945 3944 3943 0 0 0 0 3970 3959 3958 3957
+3956 3955 3954 0 0 0 0 0 0 3965 3964 3963 0 0 0 3969 3968 0 0 0 3974 3973 0 0 0
+3991 3986 3981 3980 0 0 3983 0 3985 0 0 3990 3989 0 0 0 3997 3994 0 3996 0 0 4013 4000 0
+4012 4005 4004 0 0 4011 4008 0 4010 0 0 0 0 4015 0 4021 4018 0 4020 0 0 0 4024 0 4032
+4031 4028 0 4030 0 0 0 0 4123 4078 4065 4052 4045 4040 0 4044 4043 0 0 0 4051 4050 4049 0 0
+0 0 4060 4055 0 4059 4058 0 0 0 4064 4063 0 0 0 4073 4072 4069 0 4071 0 0 0 4075 0
+4077 0 0 4108 4101 4082 0 4092 4087 4086 0 0 4091 4090 0 0 0 4098 4097 4096 0 0 0 4100 0
+0 4107 4104 0 4106 0 0 0 4114 4113 4112 0 0 0 4120 4119 4118 0 0 0 4122 0 0 4145 4128
+4127 0 0 4140 4135 4132 0 4134 0 0 4139 4138 0 0 0 4142 0 4144 0 0 4155 4152 4151 4150 0
+0 0 4154 0 0 4161 4158 0 4160 0 0 4163 0 4165 0 0 4280 4227 4204 4183 4176 4175 4174 0 0
+0 4182 4179 0 4181 0 0 0 4197 4192 4191 4188 0 4190 0 0 0 4196 4195 0 0 0 4199 0 4203
+4202 0 0 0 4210 4207 0 4209 0 0 4226 4221 4214 0 4218 4217 0 0 4220 0 0 4223 0 4225 0
+0 0 4247 4230 0 4244 4235 4234 0 0 4241 4240 4239 0 0 0 4243 0 0 4246 0 0 4273 4268 4251
+0 4267 4256 4255 0 0 4258 0 4260 0 4266 4263 0 4265 0 0 0 0 4272 4271 0 0 0 4277 4276
+0 0 4279 0 0 4286 4283 0 4285 0 0 0 4429 4344 4299 4296 4293 0 4295 0 0 4298 0 0 4325
+4324 4323 4304 0 4310 4309 4308 0 0 0 4320 4317 4314 0 4316 0 0 4319 0 0 4322 0 0 0 0
+4329 4328 0 0 4343 4332 0 4336 4335 0 0 4338 0 4342 4341 0 0 0 0 4372 4359 4350 4349 0 0
+4354 4353 0 0 4356 0 4358 0 0 4371 4362 0 4364 0 4370 4369 4368 0 0 0 0 0 4388 4375 0
+4387 4382 4379 0 4381 0 0 4386 4385 0 0 0 0 4424 4391 0 4413 4412 4405 4402 4401 4400 4399 0 0
+0 0 4404 0 0 4411 4408 0 4410 0 0 0 0 4417 4416 0 0 4421 4420 0 0 4423 0 0 4428
+4427 0 0 0 4467 4446 4441 4434 0 4436 0 4438 0 4440 0 0 4443 0 4445 0 0 4458 4457 4450 0
+4456 4455 4454 0 0 0 0 0 4466 4463 4462 0 0 4465 0 0 0 4511 4494 4473 4472 0 0 4481 4478
+4477 0 0 4480 0 0 4487 4486 4485 0 0 0 4493 4492 4491 0 0 0 0 4500 4499 4498 0 0 0
+4508 4507 4506 4505 0 0 0 0 4510 0 0 4529 4514 0 4516 0 4528 4527 4520 0 4522 0 4526 4525 0
+0 0 0 0 4541 4536 4533 0 4535 0 0 4540 4539 0 0 0 4543 0 4545 0 4551 4550 4549 0 0
+0 0 4766 4625 4584 4571 4562 4561 4560 0 0 0 4568 4565 0 4567 0 0 4570 0 0 4583 4574 0 4582
+4577 0 4581 4580 0 0 0 0 0 4590 4589 4588 0 0 0 4618 4595 4594 0 0 4605 4602 4601 4600 0
+0 0 4604 0 0 4611 4608 0 4610 0 0 4617 4616 4615 0 0 0 0 4620 0 4622 0 4624 0 0
+4665 4652 4635 4632 4631 0 0 4634 0 0 4651 4638 0 4650 4641 0 4649 4648 4645 0 4647 0 0 0 0
+0 0 4662 4661 4656 0 4660 4659 0 0 0 0 4664 0 0 4745 4714 4687 4678 4671 0 4673 0 4677 4676
+0 0 0 4684 4681 0 4683 0 0 4686 0 0 4691 4690 0 0 4699 4698 4695 0 4697 0 0 0 4711
+4708 4703 0 4705 0 4707 0 0 4710 0 0 4713 0 0 4720 4717 0 4719 0 0 4734 4729 4726 4725 0
+0 4728 0 0 4731 0 4733 0 0 4738 4737 0 0 4742 4741 0 0 4744 0 0 4757 4748 0 4756 4751
+0 4755 4754 0 0 0 0 4763 4762 4761 0 0 0 4765 0 0 4818 4783 4778 4777 4772 0 4776 4775 0
+0 0 0 4780 0 4782 0 0 4807 4800 4799 4790 4789 0 0 4792 0 4798 4797 4796 0 0 0 0 0
+4802 0 4804 0 4806 0 0 4817 4812 4811 0 0 4814 0 4816 0 0 0 4924 4897 4858 4845 4826 4825 0
+0 4840 4839 4838 4833 4832 0 0 4837 4836 0 0 0 0 0 4844 4843 0 0 0 4847 0 4849 0 4857
+4856 4855 4854 0 0 0 0 0 4872 4865 4864 4863 0 0 0 4867 0 4871 4870 0 0 0 4882 4877 4876
+0 0 4879 0 4881 0 0 4888 4885 0 4887 0 0 4894 4891 0 4893 0 0 4896 0 0 4901 4900 0
+0 4913 4912 4909 4908 4907 0 0 0 4911 0 0 0 4917 4916 0 0 4923 4920 0 4922 0 0 0 4928
+4927 0 0 5018 4945 4938 4937 4934 0 4936 0 0 0 4944 4941 0 4943 0 0 0 5015 4984 4973 4962 4959
+4952 0 4958 4955 0 4957 0 0 0 4961 0 0 4966 4965 0 0 4968 0 4970 0 4972 0 0 4975 0
+4981 4980 4979 0 0 0 4983 0 0 5002 4989 4988 0 0 4999 4992 0 4994 0 4996 0 4998 0 0 5001
+0 0 5006 5005 0 0 5008 0 5014 5011 0 5013 0 0 0 5017 0 0 5022 5021 0 0 5024 0 0
+""")
+
+VALUE = _column("""
+0 0 0 0 0 0 0 0 0 0 0 3 1 0 0 1 0 0 3 0 0 0 3 0 4
+3 3 3 3 1 0 0 0 0 0 0 0 1 0 0 0 1 0 0 1 0 1 0 0 1
+3 1 1 0 0 1 0 0 0 0 3 1 1 0 0 0 3 1 0 0 1 0 0 0 1
+0 0 1 0 0 2 1 1 0 0 1 0 0 1 1 0 9 0 0 9 1 1 0 0 0
+0 0 0 1 0 3 0 0 3 0 4 0 3 4 0 3 1 0 0 0 4 0 1 5 4
+5 0 1 3 1 0 0 0 0 3 0 3 0 4 0 3 4 3 0 0 3 0 0 0 3
+5 3 3 0 0 0 0 4 3 0 0 0 4 0 3 4 4 3 4 3 0 0 0 3 0
+1 0 0 0 0 0 3 5 3 3 0 0 3 5 3 3 0 0 1 3 3 1 1 0 0
+0 0 0 0 2 0 2 1 0 1 0 1 2 0 1 0 0 0 0 1 3 1 3 1 0
+0 0 0 2 0 0 0 0 0 1 0 0 2 0 1 2 0 2 0 0 2 1 2 0 0
+0 0 1 2 1 0 1 2 0 1 0 0 0 1 2 0 0 0 1 0 2 1 0 0 0
+0 0 2 0 1 2 2 2 1 2 0 0 0 0 0 2 0 3 2 2 0 0 0 2 0
+3 0 0 2 3 2 0 3 0 2 3 0 2 0 2 0 3 2 0 0 2 0 3 2 2
+0 0 2 0 0 2 0 0 2 11 4 2 0 0 0 2 0 0 0 0 0 3 0 0 3
+2 2 3 2 0 3 2 2 2 0 2 0 0 0 0 0 3 0 4 3 0 0 2 0 3
+2 0 4 0 0 0 3 2 3 4 2 0 0 0 0 1 0 0 2 0 0 0 2 0 0
+1 0 0 2 0 0 0 1 0 9 1 0 1 0 1 2 0 0 0 1 0 0 2 0 1
+2 2 1 0 0 1 0 1 2 0 0 0 1 0 0 0 0 1 0 2 0 0 1 2 1
+0 2 1 1 2 0 0 0 0 0 2 0 1 0 0 1 2 0 1 2 1 0 2 1 0
+0 1 2 1 0 0 1 0 0 1 0 1 0 1 4 0 0 0 0 0 2 0 4 1 0
+0 2 1 0 1 2 0 2 0 0 0 4 0 4 0 0 5 4 4 0 0 0 4 0 5
+4 0 0 4 0 5 4 4 0 0 4 0 1 4 4 4 0 0 0 0 0 0 0 2 0
+2 4 2 0 0 0 4 0 2 4 1 0 2 0 2 0 4 2 0 0 0 0 2 0 1
+2 2 2 0 2 0 2 0 0 0 2 1 2 2 0 0 0 2 0 0 2 4 2 0 0
+2 0 2 4 0 4 2 2 0 0 0 0 2 3 2 3 2 1 0 0 0 0 0 0 0
+0 3 2 0 4 3 2 1 0 4 2 0 0 3 0 0 0 3 5 4 0 3 0 0 3
+1 3 0 0 4 0 5 4 0 1 3 0 0 0 0 0 0 0 2 1 2 3 0 0 2
+0 4 0 5 4 0 0 1 3 2 0 0 0 0 1 0 0 0 2 0 4 3 0 4 1
+1 1 1 0 0 2 1 0 0 2 4 2 0 0 0 1 3 3 0 1 2 0 3 0 0
+2 0 0 2 4 2 0 2 0 1 4 1 0 0 1 0 0 0 0 1 0 6 4 0 4
+5 0 0 6 0 7 6 5 0 0 0 0 0 4 1 0 0 4 6 4 4 1 0 0 0
+1 0 0 0 5 6 5 0 6 5 0 0 4 6 0 0 1 4 6 0 3 0 5 4 0
+0 0 0 0 0 3 0 0 4 3 4 0 3 0 0 3 5 3 0 0 0 3 0 4 0
+3 4 3 0 0 0 0 0 4 0 0 4 3 4 0 0 4 0 3 4 4 3 4 0 0
+4 3 3 0 0 0 3 0 3 4 0 0 3 4 0 3 1 0 0 0 3 0 4 3 0
+3 6 0 0 0 0 0 4 3 3 3 0 4 3 0 3 4 0 0 1 0 3 0 3 0
+0 3 6 3 0 1 0 3 0 0 0 3 0 4 0 3 0 4 3 3 0 0 5 0 4
+0 0 3 0 6 3 4 0 5 3 1 0 0 0 0 1 0 9 1 0 0 1 0 0 0
+1 2 0 1 2 2 0 0 0 0 1 0 1 1 0 1 0 0 1 0 0 1 0 1 1
+0 0 0 0 0 0 0 1 8 1 0 0 1 3 1 0 0 1 0 0 0 1 3 1 0
+1 0 9 1 0 1 0 1 3 0 0 1 0 0 1 0 2 1 0 0 0 0 0 1 0
+0 0 1 0 3 1 1 0 0 6 7 0 0 1 0 0 9 1 0 0 0 9 1 1 0
+3 1 1 0 0 0 0 0 0 0 3 1 1 0 1 0 2 0 2 5 0 0 0 0 0
+0 2 0 0 3 2 3 0 2 0 0 2 4 2 0 0 0 2 0 3 0 2 3 2 0
+0 0 0 0 3 0 0 3 2 3 0 0 3 0 2 3 3 2 3 0 0 3 2 2 0
+0 0 2 0 2 3 0 0 2 3 0 2 0 0 0 0 2 0 3 2 0 2 5 0 0
+0 0 0 3 2 2 2 0 2 3 0 3 2 0 0 0 0 0 3 4 0 0 2 8 0
+2 0 2 0 0 2 0 4 3 0 3 2 0 0 0 4 0 0 0 3 4 3 4 0 2
+0 0 2 0 3 2 0 0 3 2 2 0 0 0 0 2 3 0 0 0 0 0 7 5 5
+5 5 0 0 6 0 0 7 8 6 0 0 0 5 6 7 0 6 5 2 0 0 0 7 0
+8 7 6 0 5 0 0 2 6 0 5 2 0 0 0 0 0 0 0 0 2 0 0 0 6
+7 6 4 0 3 7 0 0 2 0 0 3 2 3 2 0 0 0 3 5 3 2 0 2 0
+2 0 0 0 0 5 4 5 0 5 4 0 0 6 5 0 0 0 4 5 4 4 0 0 0
+2 3 0 0 0 0 0 3 2 3 2 2 2 0 0 0 2 0 0 0 2 3 2 2 2
+0 0 2 0 4 2 0 4 2 0 0 0 0 2 0 0 2 0 2 0 4 2 0 1 2
+0 0 0 0 1 0 2 1 1 0 1 2 0 2 1 0 0 0 2 0 0 2 1 2 0
+0 0 2 1 2 2 0 0 0 2 0 1 2 2 0 2 0 5 2 0 0 0 0 0 1
+0 1 0 1 2 0 2 1 2 0 1 0 0 1 2 1 0 2 3 0 0 0 0 0 0
+0 2 0 0 0 0 0 0 0 2 0 0 2 0 0 2 0 2 4 2 0 0 2 0 0
+0 2 0 0 2 3 2 2 2 0 0 2 0 0 0 0 0 0 3 2 2 0 0 7 2
+0 4 2 0 0 0 0 2 0 3 0 2 3 2 0 0 0 0 3 2 0 3 0 2 3
+0 3 0 2 3 2 0 0 0 2 4 2 0 0 2 4 2 0 0 0 0 0 2 0 0
+2 3 2 2 0 0 0 0 2 0 0 2 3 2 2 0 2 0 0 3 0 2 3 2 0
+0 0 2 4 2 2 0 0 0 2 0 0 0 7 2 3 2 0 0 2 0 2 3 2 3
+0 0 0 0 2 2 0 2 0 0 0 0 9 2 2 2 0 0 0 0 0 0 0 0 0
+0 1 0 0 4 2 0 0 0 2 0 0 0 0 5 6 5 0 0 2 6 0 0 0 2
+0 0 0 4 0 0 0 4 0 5 4 4 4 4 4 0 0 0 0 0 0 0 2 0 0
+1 0 0 2 0 0 0 2 0 4 2 0 0 2 0 4 2 2 2 0 0 0 0 2 1
+2 1 0 0 0 2 0 0 0 0 2 0 2 0 0 0 1 0 0 0 0 0 0 1 0
+0 2 3 0 0 0 0 0 0 4 3 4 0 5 0 0 4 3 5 0 3 0 0 3 5
+0 3 1 4 0 0 1 0 0 0 0 0 0 1 0 0 0 0 8 6 6 6 6 3 0
+0 0 3 0 0 6 7 0 0 8 9 7 0 0 0 0 6 7 8 3 3 0 7 6 0
+0 0 1 0 4 3 1 0 0 0 0 8 0 9 8 7 0 6 0 7 0 6 3 0 0
+0 0 0 0 0 0 0 0 1 0 0 1 0 1 0 2 1 0 0 0 2 0 0 0 0
+2 7 2 0 2 1 0 2 0 0 0 0 0 0 2 0 0 3 4 3 0 2 0 3 0
+1 0 4 1 0 0 0 0 5 3 3 3 0 0 0 0 3 4 2 0 0 3 4 3 0
+0 0 0 4 5 4 3 0 0 0 0 0 3 4 3 3 3 2 0 0 0 0 4 0 2
+4 4 0 0 3 5 4 0 0 0 3 0 0 3 0 4 3 0 3 0 0 3 0 4 3
+3 3 0 0 3 2 0 0 3 0 4 3 0 0 3 0 2 3 4 0 0 0 3 0 0
+0 1 0 0 0 0 1 0 0 0 1 0 0 1 0 0 3 0 3 0 0 0 3 4 0
+3 6 5 4 0 0 0 1 0 0 3 0 0 1 0 0 0 0 0 0 0 0 1 0 1
+0 2 1 0 0 0 0 1 0 0 0 0 0 0 2 0 0 0 0 2 0 2 1 0 0
+0 0 2 4 2 0 0 0 2 0 3 4 3 0 0 1 2 0 4 0 5 4 0 3 0
+2 4 0 0 0 0 3 2 0 1 0 0 0 0 0 0 0 1 0 0 0 2 1 2 0
+1 0 1 0 0 0 2 1 0 2 0 0 2 1 2 0 0 1 0 1 2 0 0 1 0
+2 1 0 2 1 0 0 0 1 10 1 0 0 1 0 1 0 2 1 0 0 1 0 1 0
+9 0 8 1 0 1 0 3 1 0 0 0 0 1 0 2 1 0 0 0 0 0 0 6 4
+4 4 4 0 0 5 0 0 6 7 5 0 0 1 0 0 4 5 6 0 5 4 1 0 0
+0 6 0 7 6 1 0 0 4 1 0 0 1 5 0 0 1 4 1 0 0 1 0 0 0
+1 2 1 2 0 0 1 0 0 1 1 0 0 0 1 0 1 0 10 1 0 0 0 3 0
+0 0 8 3 3 0 0 9 0 3 5 0 3 5 4 0 1 0 0 0 0 0 0 0 1
+0 2 0 1 0 0 0 2 1 2 0 0 1 0 0 2 1 0 1 0 2 1 1 0 1
+0 9 0 1 0 0 0 0 0 0 0 0 0 2 11 0 0 3 2 3 0 2 0 0 2
+4 2 0 0 0 2 0 3 0 2 3 2 0 0 0 0 0 3 0 0 3 2 3 0 0
+3 0 2 3 3 2 3 0 0 3 2 2 0 0 0 2 0 2 3 0 0 2 3 2 0
+0 0 2 0 3 2 0 2 5 0 0 0 0 0 3 2 2 2 0 3 2 0 2 3 0
+0 0 2 0 2 0 2 0 4 2 0 0 0 0 0 0 0 2 0 0 0 2 5 0 0
+0 0 0 0 0 0 3 0 0 2 4 0 3 4 0 2 0 0 0 4 2 3 0 0 0
+0 0 2 0 0 7 5 0 6 5 0 0 7 0 8 7 6 0 0 5 0 0 0 0 3
+0 0 0 0 6 7 6 0 7 6 0 0 5 7 7 0 6 5 0 0 3 2 3 0 0
+0 0 0 0 2 0 0 0 3 2 3 2 0 0 0 2 0 0 0 3 0 4 3 0 0
+0 2 0 0 2 3 2 2 0 0 2 0 3 0 0 0 0 0 0 1 0 0 0 1 7
+9 1 0 0 0 0 2 0 0 2 0 2 0 3 2 1 4 0 2 10 2 0 2 1 0
+1 0 0 1 0 0 0 1 0 3 0 3 1 1 1 0 0 0 0 2 0 1 2 0 0
+0 2 0 1 0 0 0 0 1 2 1 0 1 0 1 0 2 1 0 0 0 1 3 0 0
+2 1 0 1 0 1 0 2 1 0 0 0 0 1 0 0 2 1 0 0 1 0 1 3 0
+0 0 0 0 2 0 3 2 0 1 0 1 0 0 0 3 9 0 3 0 0 3 0 2 3
+3 0 0 2 0 0 0 2 3 3 0 2 3 0 2 3 0 0 0 0 0 0 2 1 0
+2 0 3 2 0 0 2 10 0 0 8 2 1 0 3 2 3 0 0 7 8 0 1 0 0
+0 0 0 0 0 0 1 0 0 1 0 3 0 3 6 0 0 0 4 0 6 5 0 4 0
+1 4 0 4 0 5 3 0 4 0 4 0 4 0 0 6 0 6 0 0 4 6 6 6 0
+0 1 0 0 1 0 0 0 0 4 0 4 0 5 4 0 0 6 0 4 0 4 6 0 0
+0 0 0 4 0 6 4 0 7 4 0 4 0 6 0 8 6 0 0 4 0 0 0 0 7
+4 4 0 6 3 4 0 0 0 4 0 4 6 5 0 4 3 0 0 0 1 4 0 6 0
+0 0 6 4 0 0 4 6 4 0 4 6 0 0 0 4 5 4 4 0 4 5 0 3 0
+5 3 0 0 0 0 1 0 0 0 0 1 0 1 0 0 0 0 0 0 2 3 3 0 2
+3 3 0 0 0 0 0 4 0 5 4 0 2 3 0 4 0 0 2 0 4 3 4 0 0
+0 0 0 4 0 0 5 0 5 6 5 0 3 0 4 0 0 0 4 5 4 5 0 3 0
+0 3 5 0 2 0 0 3 4 4 0 0 0 4 5 4 5 0 0 0 0 0 4 0 4
+3 2 0 5 3 5 0 3 0 2 0 4 2 0 4 0 3 0 3 4 0 0 0 0 3
+5 3 0 0 4 5 0 5 4 0 0 0 0 0 4 0 0 6 5 0 0 0 0 5 4
+0 0 5 6 5 0 5 0 0 4 5 5 3 0 0 5 4 5 0 0 8 6 0 0 0
+5 6 0 7 6 6 0 6 0 5 0 4 0 4 5 0 0 0 4 3 0 5 0 4 5
+3 0 0 0 1 0 3 0 0 4 0 0 4 5 4 0 3 0 5 0 0 4 5 3 0
+0 8 5 0 6 10 0 0 0 0 4 8 0 4 5 0 0 0 7 5 6 4 0 0 5
+0 3 6 0 0 1 3 0 4 5 0 0 0 0 0 1 0 0 5 0 3 5 0 3 5
+0 0 0 3 5 3 3 0 0 0 0 1 0 0 0 6 5 0 0 4 6 4 0 0 0
+4 0 0 0 0 0 6 4 4 6 4 5 4 0 0 3 4 3 3 0 0 0 1 0 0
+0 0 6 0 7 5 7 0 6 0 0 7 0 6 0 7 6 7 0 0 0 0 5 6 0
+6 3 0 0 5 8 5 0 0 0 4 3 0 0 0 7 3 5 7 0 6 5 0 0 6
+7 6 0 0 0 0 0 0 10 0 0 9 10 9 9 0 10 9 6 0 0 5 6 0 5
+6 0 9 8 0 0 0 0 7 5 0 5 7 5 0 0 0 0 0 0 6 7 6 6 0
+0 7 0 8 7 0 6 5 4 0 0 6 4 0 5 7 0 0 0 0 0 4 0 0 5
+6 5 0 4 0 6 0 4 5 3 0 0 6 5 0 0 0 5 6 0 6 8 0 6 5
+0 0 0 0 0 5 6 5 0 8 6 0 0 0 0 3 0 0 5 0 4 0 5 4 0
+0 1 3 4 0 0 0 1 4 0 0 0 0 0 6 5 0 6 7 0 0 5 6 0 5
+0 1 0 5 3 0 0 0 4 5 0 1 4 0 0 1 0 3 4 0 1 0 0 7 0
+5 0 5 6 0 0 0 0 5 0 8 5 5 0 6 5 3 0 0 0 0 0 0 6 0
+4 5 0 0 7 0 8 7 7 0 1 0 6 0 0 6 7 6 0 0 1 7 4 6 0
+0 0 0 4 0 6 5 5 0 3 5 0 0 3 6 5 0 0 0 0 7 5 0 3 5
+0 6 0 0 5 0 6 5 5 0 5 4 0 3 0 2 4 0 0 0 0 1 0 0 1
+0 0 3 0 0 0 5 0 6 5 0 0 0 0 5 4 0 6 3 0 4 3 0 0 3
+0 4 0 5 6 0 4 0 0 1 3 4 0 4 0 0 0 3 0 6 4 3 0 6 0
+5 4 0 3 4 0 0 0 0 1 3 0 0 0 9 7 7 0 0 0 8 0 0 9 10
+8 0 5 4 7 0 0 1 0 4 0 0 0 3 5 6 4 0 1 0 0 4 0 0 0
+3 6 3 4 3 0 0 7 9 0 7 0 0 8 3 0 7 4 0 0 0 1 0 0 0
+0 3 4 3 3 3 0 0 0 0 0 1 6 5 0 4 5 0 0 0 0 0 5 3 0
+1 0 4 0 6 4 0 0 1 5 5 0 0 0 1 0 3 5 0 1 6 0 0 4 5
+4 0 0 0 4 0 1 5 0 0 1 0 4 0 0 4 5 4 0 4 6 0 4 0 0
+1 5 0 6 7 0 1 0 5 3 0 0 0 0 0 0 0 0 0 5 6 4 5 0 5
+4 0 0 0 6 7 0 5 7 6 4 0 0 0 4 9 0 0 6 5 4 8 0 0 1
+3 0 4 3 0 0 0 0 5 1 0 6 7 0 0 0 0 5 0 3 5 6 5 6 0
+0 0 5 4 0 5 3 0 0 0 5 0 5 0 6 0 5 6 0 5 6 0 6 0 7
+6 0 0 0 0 0 0 0 1 4 0 0 0 2 3 2 0 1 0 2 3 0 1 0 0
+0 2 0 0 4 0 0 4 0 5 4 4 4 0 0 1 0 1 0 2 0 0 4 0 0
+4 0 5 4 4 4 0 0 0 0 1 0 1 2 0 0 0 0 2 0 4 2 0 2 0
+0 4 2 2 0 0 2 0 4 2 2 2 1 0 0 0 2 3 0 0 2 0 2 0 4
+2 2 0 0 3 2 3 0 0 0 0 1 0 0 0 0 0 5 3 3 3 0 0 0 0
+0 0 0 3 5 4 1 3 1 0 0 0 3 4 2 0 0 3 4 3 0 0 1 2 3
+0 0 0 0 5 1 0 4 0 2 4 0 0 3 5 4 0 0 1 0 4 1 0 0 3
+0 0 0 3 4 0 0 3 0 4 3 3 3 0 1 0 0 3 0 3 2 4 0 1 0
+0 0 1 0 1 2 0 1 0 0 0 0 0 0 1 0 0 1 2 1 0 0 0 3 2
+3 1 0 0 1 0 0 3 4 1 0 0 1 0 1 0 0 0 1 0 0 1 1 0 2
+0 1 0 0 0 0 1 0 0 0 1 2 0 0 4 3 4 0 0 0 1 2 3 0 1
+3 0 0 1 0 1 3 1 0 0 0 1 3 1 0 0 0 2 1 2 0 2 1 0 0
+0 2 1 0 0 0 1 0 4 1 0 0 1 4 1 0 1 0 2 1 0 0 0 0 1
+0 1 0 4 1 0 0 2 0 4 5 0 2 0 1 0 0 0 0 0 0 0 0 3 4
+3 0 0 3 0 5 3 3 0 0 0 0 4 0 4 5 4 0 0 3 5 4 0 3 0
+0 3 4 3 0 0 3 0 4 3 0 0 0 4 0 0 3 5 0 4 5 0 3 0 5
+4 4 0 0 3 0 0 0 5 3 0 0 0 3 4 3 0 5 3 0 3 4 0 0 0
+3 0 0 0 4 3 0 4 0 3 0 0 4 0 4 3 4 3 0 0 3 4 3 0 0
+4 1 0 5 4 0 0 1 0 4 1 1 0 0 0 0 0 3 0 1 3 0 5 3 0
+0 0 0 1 0 0 0 1 4 2 0 0 0 3 0 4 3 0 3 2 0 1 4 1 2
+0 0 4 2 0 0 3 0 0 3 4 0 3 0 0 3 4 3 4 0 0 0 0 2 3
+0 0 8 6 0 7 0 6 2 0 0 8 0 9 0 0 0 6 8 8 8 7 0 0 2
+0 0 0 2 0 6 2 0 0 6 8 6 6 0 0 2 0 0 0 0 0 0 0 7 9
+7 8 0 7 4 0 0 8 0 9 8 7 3 0 0 6 8 0 0 3 8 0 1 4 0
+0 7 6 1 0 0 0 0 1 0 2 0 4 0 1 4 0 2 0 1 4 0 0 0 1
+0 0 0 2 1 4 3 1 0 0 0 2 3 0 2 4 3 0 0 0 0 1 3 0 0
+0 1 3 0 1 0 0 0 0 1 3 3 0 0 0 1 2 3 3 0 0 0 4 5 4
+0 0 0 0 1 3 3 3 0 1 3 0 0 1 0 1 0 0 0 4 0 1 0 0 1
+4 4 2 1 0 0 0 1 0 3 1 0 0 2 3 2 0 3 0 3 0 0 0 3 4
+3 4 0 0 0 0 0 0 0 0 1 2 0 0 1 0 2 1 0 1 0 0 0 1 0
+0 1 0 0 1 2 1 1 0 0 0 0 1 0 1 0 0 0 1 2 0 0 0 0 2
+1 0 0 1 0 0 0 2 0 3 1 0 0 0 1 0 1 0 0 8 0 1 0 2 1
+0 0 0 0 0 3 5 0 3 4 0 0 3 0 0 5 0 0 0 5 0 6 5 5 5
+5 3 0 0 0 3 0 0 3 5 3 3 0 1 3 0 0 0 0 0 3 0 4 0 0
+4 5 4 0 0 5 0 6 5 0 3 4 0 0 1 3 0 0 0 3 0 2 4 3 0
+0 0 3 0 3 0 5 3 0 4 3 0 3 5 0 0 1 0 2 1 0 0 0 0 2
+3 0 1 4 0 2 0 2 1 0 0 1 4 0 0 2 4 0 1 2 0 0 2 0 0
+3 0 0 4 3 3 3 0 0 0 3 4 3 0 4 5 0 0 0 0 0 1 0 0 1
+2 1 1 0 0 0 1 0 0 0 0 0 0 1 2 0 1 0 0 0 2 1 2 2 2
+0 1 0 2 0 1 2 0 0 0 2 1 0 2 0 2 1 2 0 0 0 0 0 0 1
+2 0 0 0 0 0 1 9 0 0 1 2 1 2 2 0 0 1 2 2 0 1 0 2 0
+0 0 0 2 8 2 2 2 0 0 0 0 0 1 3 0 2 0 0 1 2 1 0 0 0
+1 2 0 1 0 8 1 0 0 1 0 2 1 0 0 3 0 2 7 0 3 1 0 0 1
+0 0 0 0 0 0 1 2 1 0 0 1 1 0 0 1 2 0 0 1 0 1 2 1 0
+0 1 0 0 0 0 0 0 2 0 0 2 2 0 0 2 0 0 2 2 0 0 0 0 0
+0 2 0 0 3 0 2 3 2 0 1 3 0 0 2 4 0 2 0 3 0 2 3 0 3
+0 0 0 2 5 2 0 3 2 0 0 0 0 1 0 0 2 0 3 0 2 0 3 2 0
+2 4 0 0 0 1 0 3 0 0 2 0 5 2 3 0 4 2 0 0 0 1 0 2 1
+""")
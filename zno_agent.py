@@ -1,16 +1,18 @@
-from langchain_anthropic import ChatAnthropic
-from langchain_core.tools import tool
+from langchain_core.tools import tool, StructuredTool
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, START, StateGraph, MessagesState
 from langgraph.prebuilt import ToolNode
 
-from retriever_pipeline.retrieve import preprocess_documents, retrieve_relevant_chunks
+from model_registry import get_model
+from retriever_pipeline.retrieve import preprocess_documents, retrieve_relevant_chunks, aretrieve_relevant_chunks
 from tool_spelling.spelling_correction_tool import spelling_check_and_correct
 from tool_wikipedia.wikipedia_tool import get_wikipedia_context
 from tool_vocab.vocabulary_scrapper_tool import get_vocabulary_info_tool
 
 from loguru import logger
 import os
+import re
 from dotenv import load_dotenv
 
 
@@ -33,68 +35,103 @@ def search_vocab_dict(word: str) -> str:
     result = get_vocabulary_info_tool(word)
     return result
 
-@tool
-def extract_from_history_docs(query: str) -> str:
+def history_docs_search(query: str) -> str:
     """Інструмент для пошуку інформації в документах з історії"""
-    model = ChatAnthropic(model="claude-3-5-sonnet-20240620", temperature=0.1)
+    model = get_model("keywords")
     result = retrieve_relevant_chunks(history_chunks_file, model, query)
     return result
 
-@tool
-def extract_from_ukr_lit_docs(query: str) -> str:
+async def ahistory_docs_search(query: str) -> str:
+    model = get_model("keywords")
+    result = await aretrieve_relevant_chunks(history_chunks_file, model, query)
+    return result
+
+def ukr_lit_docs_search(query: str) -> str:
     """Інструмент для пошуку інформації в документах з української літератури"""
-    model = ChatAnthropic(model="claude-3-5-sonnet-20240620", temperature=0.1)
+    model = get_model("keywords")
     result = retrieve_relevant_chunks(literature_chunks_file, model, query)
     return result
 
+async def aukr_lit_docs_search(query: str) -> str:
+    model = get_model("keywords")
+    result = await aretrieve_relevant_chunks(literature_chunks_file, model, query)
+    return result
+
+# Retrieval tools with both sync and async implementations, so that app.ainvoke never blocks the event loop
+extract_from_history_docs = StructuredTool.from_function(
+    func=history_docs_search, coroutine=ahistory_docs_search, name="extract_from_history_docs"
+)
+extract_from_ukr_lit_docs = StructuredTool.from_function(
+    func=ukr_lit_docs_search, coroutine=aukr_lit_docs_search, name="extract_from_ukr_lit_docs"
+)
+
+def tool_family_node(family, tools, family_of_tool_call):
+    """ToolNode that runs only the tool calls of the last message that family_of_tool_call assigns to the family."""
+
+    def own_tool_calls(state: MessagesState):
+        last_message = state["messages"][-1]
+        tool_calls = [tool_call for tool_call in last_message.tool_calls if family_of_tool_call(tool_call) == family]
+        return {"messages": [last_message.model_copy(update={"tool_calls": tool_calls})]}
+
+    return RunnableLambda(own_tool_calls) | ToolNode(tools)
+
+
 def setup_qa_app():
     history_tools = [extract_from_history_docs]
     ukr_lit_tools = [extract_from_ukr_lit_docs]
     ukr_lang_tools = [spelling_check, search_vocab_dict]
     wikipedia_tools = [search_wikipedia]
+    tool_families = {
+        "history_tools": history_tools,
+        "ukr_lit_tools": ukr_lit_tools,
+        "ukr_lang_tools": ukr_lang_tools,
+        "wikipedia_tools": wikipedia_tools,
+    }
+    all_tools = history_tools + ukr_lit_tools + ukr_lang_tools + wikipedia_tools
+    family_of_tool = {tool.name: family for family, tools in tool_families.items() for tool in tools}
 
-    model_with_tools = ChatAnthropic(model="claude-3-haiku-20240307", temperature=0).bind_tools(history_tools + ukr_lit_tools + ukr_lang_tools + wikipedia_tools)
+    def family_of_tool_call(tool_call):
+        # Calls of unknown tools go to a ToolNode with all tools, which answers them with an error message
+        # listing every valid tool: each tool call needs a result before the model is called again
+        return family_of_tool.get(tool_call["name"], "invalid_tools")
+
+    model_with_tools = get_model("agent").bind_tools(all_tools)
 
     def should_continue(state: MessagesState):
         messages = state["messages"]
         if len(messages) == 5:
             return END
         last_message = messages[-1]
-        if last_message.tool_calls:
-            if last_message.tool_calls[0]["name"] in [f.name for f in history_tools]:
-                return "history_tools"
-            if last_message.tool_calls[0]["name"] in [f.name for f in ukr_lit_tools]:
-                return "ukr_lit_tools"
-            if last_message.tool_calls[0]["name"] in [f.name for f in ukr_lang_tools]:
-                return "ukr_lang_tools"
-            if last_message.tool_calls[0]["name"] in [f.name for f in wikipedia_tools]:
-                return "wikipedia_tools"
-        return END
+        # Every tool family asked for in this turn runs in parallel; the agent continues once all of them finished
+        families = []
+        for tool_call in last_message.tool_calls:
+            family = family_of_tool_call(tool_call)
+            if family not in families:
+                families.append(family)
+        return families or END
 
     def call_model(state: MessagesState):
         messages = state["messages"]
         response = model_with_tools.invoke(messages)
         return {"messages": [response]}
-    
-    history_tools_node = ToolNode(history_tools)
-    ukr_lit_tools_node = ToolNode(ukr_lit_tools)
-    ukr_lang_tools_node = ToolNode(ukr_lang_tools)
-    wikipedia_tools_node = ToolNode(wikipedia_tools)
+
+    async def acall_model(state: MessagesState):
+        messages = state["messages"]
+        response = await model_with_tools.ainvoke(messages)
+        return {"messages": [response]}
 
     workflow = StateGraph(MessagesState)
 
-    workflow.add_node("agent", call_model)
-    workflow.add_node("history_tools", history_tools_node)
-    workflow.add_node("ukr_lit_tools", ukr_lit_tools_node)
-    workflow.add_node("ukr_lang_tools", ukr_lang_tools_node)
-    workflow.add_node("wikipedia_tools", wikipedia_tools_node)
+    # With an async implementation app.ainvoke awaits the model instead of holding a thread per question
+    workflow.add_node("agent", RunnableLambda(call_model, afunc=acall_model))
+    for family, tools in tool_families.items():
+        workflow.add_node(family, tool_family_node(family, tools, family_of_tool_call))
+        workflow.add_edge(family, "agent")
+    workflow.add_node("invalid_tools", tool_family_node("invalid_tools", all_tools, family_of_tool_call))
+    workflow.add_edge("invalid_tools", "agent")
 
     workflow.add_edge(START, "agent")
-    workflow.add_conditional_edges("agent", should_continue, ["history_tools", "ukr_lit_tools", "ukr_lang_tools", "wikipedia_tools", END])
-    workflow.add_edge("history_tools", "agent")
-    workflow.add_edge("ukr_lit_tools", "agent")
-    workflow.add_edge("ukr_lang_tools", "agent")
-    workflow.add_edge("wikipedia_tools", "agent")
+    workflow.add_conditional_edges("agent", should_continue, [*tool_families, "invalid_tools", END])
 
     app = workflow.compile()
     return app
@@ -117,13 +154,54 @@ def setup_output_parser():
         },
         "required": ["answer", "explanation"],
     }
-    llm = ChatAnthropic(model="claude-3-haiku-20240307", temperature=0)
+    llm = get_model("parser")
     structured_llm = llm.with_structured_output(json_schema)
     return structured_llm
 
 
+ANSWER_PARSING_MODES = ("llm", "local")
+# An answer letter after "відповідь"/"варіант" or on its own, followed by punctuation or the end of the line,
+# so that e.g. the preposition in "Відповідь: В 1654 році" is not taken for option В
+ANSWER_LETTER = r"[\"«„*(\[]*\s*([АБВГД])(?=\s*(?:$|[.)\]:,;!»\"*]|[-—–]))"
+ANSWER_PATTERNS = [
+    re.compile(r"(?i:відповід\w*)\s*(?:[:\-—–]|\bє\b|\bце\b)?\s*" + ANSWER_LETTER, re.MULTILINE),
+    re.compile(r"(?i:варіант\w*)\s*" + ANSWER_LETTER, re.MULTILINE),
+    re.compile(r"\A\W*([АБВГД])\W*\Z"),
+]
+
+
+def message_text(content) -> str:
+    """Text of a message content given as a string or as a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "\n".join(block if isinstance(block, str) else block.get("text", "") for block in content)
+
+
+def extract_answer(text: str):
+    """
+    Extract the answer letter from the agent's final message without a model call.
+
+    Returns:
+        dict: The answer letter and the message as explanation, in the format of
+        setup_output_parser, or None if no letter or several different letters are given.
+    """
+    letters = {match.group(1) for pattern in ANSWER_PATTERNS for match in pattern.finditer(text)}
+    if len(letters) != 1:
+        return None
+    return {"answer": letters.pop(), "explanation": text.strip()}
+
+
 class ZNOAgent:
-    def __init__(self):
+    def __init__(self, answer_parsing: str = "llm"):
+        """
+        Args:
+            answer_parsing (str): "llm" to format every final answer with the parser model
+                or "local" to extract the letter locally, asking the parser model only when
+                that fails.
+        """
+        if answer_parsing not in ANSWER_PARSING_MODES:
+            raise ValueError(f"Unknown answer parsing mode: {answer_parsing}. Expected one of {ANSWER_PARSING_MODES}")
+        self.answer_parsing = answer_parsing
         load_dotenv('env_variables.env', override=True)
         self.app = setup_qa_app()
         self.parser = setup_output_parser()
@@ -135,11 +213,54 @@ class ZNOAgent:
         history_docs = os.path.join(documents_dir, 'history', '*.txt')
         preprocess_documents(history_docs, history_chunks_file)
 
+    def local_answer(self, content):
+        """The locally extracted answer in "local" answer parsing mode, else None."""
+        if self.answer_parsing != "local":
+            return None
+        return extract_answer(message_text(content))
+
+    def parse_answer(self, content):
+        return self.local_answer(content) or self.parser.invoke(content)
+
+    async def aparse_answer(self, content):
+        return self.local_answer(content) or await self.parser.ainvoke(content)
+
     def ask_question(self, question: str):
         result = self.app.invoke({"messages": [HumanMessage(question)]})
-        parsed_result = self.parser.invoke(result["messages"][-1].content)
+        parsed_result = self.parse_answer(result["messages"][-1].content)
         return parsed_result
 
+    async def aask_question(self, question: str):
+        result = await self.app.ainvoke({"messages": [HumanMessage(question)]})
+        parsed_result = await self.aparse_answer(result["messages"][-1].content)
+        return parsed_result
+
+    def ask_questions(self, questions: list[str], max_concurrency: int = 4):
+        """
+        Answer many questions, running up to max_concurrency of them at a time.
+
+        Results are in the order of the questions; a question that failed gets its
+        exception in place of the parsed answer instead of aborting the batch.
+        """
+        config = {"max_concurrency": max_concurrency}
+        results = self.app.batch(
+            [{"messages": [HumanMessage(question)]} for question in questions], config=config, return_exceptions=True
+        )
+        to_parse = []
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                continue
+            content = result["messages"][-1].content
+            results[i] = self.local_answer(content)
+            if results[i] is None:
+                to_parse.append((i, content))
+        parsed_results = self.parser.batch(
+            [content for _, content in to_parse], config=config, return_exceptions=True
+        )
+        for (i, _), parsed_result in zip(to_parse, parsed_results):
+            results[i] = parsed_result
+        return results
+
     def render_app_graph(self):
         try:
             image_data = self.app.get_graph().draw_mermaid_png()